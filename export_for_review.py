@@ -7,13 +7,33 @@ Usage:
 
 import os
 import json
-import csv
 from pathlib import Path
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
 from google.cloud import bigquery
 from dotenv import load_dotenv
 
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # Storage Read API is optional; falls back to REST paging
+    bigquery_storage = None
+
 load_dotenv()
 
+# Below this many rows the REST tabledata.list path is cheaper than opening a
+# Storage Read API session, so small exports stay on REST.
+STORAGE_API_MIN_ROWS = 50
+
+# Output buffer for the CSV sink; a path-opened CSVWriter writes unbuffered
+CSV_BUFFER_BYTES = 1 << 20
+
+
+def _count_equal(batch, column: str, value) -> int:
+    """Count rows in an Arrow batch where `column` equals `value` (nulls never match)"""
+    return pc.sum(pc.equal(batch.column(column), value)).as_py() or 0
+
+
 def export_meetings_for_review(min_score: int = 4, limit: int = 50, output_path: str = "scoring_review.csv"):
     """Export meetings with evidence for manual review"""
 
@@ -21,7 +41,7 @@ def export_meetings_for_review(min_score: int = 4, limit: int = 50, output_path:
     os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = 'gcp_service_account_creds.json'
     client = bigquery.Client(project='angular-stacker-471711-k4')
 
-    query = f"""
+    query = """
     SELECT
       meeting_id,
       JSON_VALUE(client_info, '$.client') as client,
@@ -60,48 +80,83 @@ def export_meetings_for_review(min_score: int = 4, limit: int = 50, output_path:
       JSON_VALUE(fit, '$.reason') as fit_reason,
       JSON_VALUE(fit, '$.summary') as fit_summary,
       JSON_VALUE(fit, '$.evidence') as fit_evidence,
-      JSON_VALUE(fit, '$.services') as fit_services
+      -- services is a JSON array, so JSON_VALUE would return NULL; unnest
+      -- it server-side and flatten to a scalar the CSV writer can emit
+      ARRAY_TO_STRING(
+        ARRAY(
+          SELECT JSON_VALUE(service)
+          FROM UNNEST(JSON_QUERY_ARRAY(fit, '$.services')) AS service
+          WHERE JSON_VALUE(service) IS NOT NULL
+        ),
+        '; '
+      ) as fit_services
 
     FROM `angular-stacker-471711-k4.unknown_brain.meeting_intel`
-    WHERE total_qualified_sections >= {min_score}
+    WHERE total_qualified_sections >= @min_score
     ORDER BY scored_at DESC
-    LIMIT {limit}
+    LIMIT @limit
     """
 
-    print(f"Exporting meetings with score >= {min_score}...")
-    results = client.query(query).result()
-
-    # Write to CSV
-    rows = [dict(row) for row in results]
+    # Bound parameters keep the query text constant across runs, so repeat
+    # exports can be served from the BigQuery result cache.
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter('min_score', 'INT64', min_score),
+            bigquery.ScalarQueryParameter('limit', 'INT64', limit),
+        ],
+        use_query_cache=True,
+    )
 
-    if not rows:
+    print(f"Exporting meetings with score >= {min_score}...")
+    results = client.query(query, job_config=job_config).result()
+
+    bqstorage = None
+    if bigquery_storage is not None and (results.total_rows or 0) > STORAGE_API_MIN_ROWS:
+        # Large export: stream Arrow record batches over gRPC rather than
+        # paging JSON through tabledata.list and building a Row per record.
+        bqstorage = bigquery_storage.BigQueryReadClient()
+
+    # Single pass over the result stream: each Arrow batch is written to the
+    # CSV and folded into the summary counters, so nothing is held beyond the
+    # current batch and the first rows hit disk before the last page arrives.
+    write_options = pa_csv.WriteOptions(include_header=True, batch_size=8192)
+    sink = writer = None
+    total = score_5 = score_4 = 0
+    now_count = next_count = measure_count = blocker_count = fit_count = 0
+
+    try:
+        for batch in results.to_arrow_iterable(bqstorage_client=bqstorage):
+            if batch.num_rows == 0:
+                continue
+            if writer is None:
+                sink = pa.output_stream(output_path, buffer_size=CSV_BUFFER_BYTES)
+                writer = pa_csv.CSVWriter(sink, batch.schema, write_options=write_options)
+            writer.write_batch(batch)
+
+            total += batch.num_rows
+            score_5 += _count_equal(batch, 'total_qualified_sections', 5)
+            score_4 += _count_equal(batch, 'total_qualified_sections', 4)
+            now_count += _count_equal(batch, 'now_qualified', 'true')
+            next_count += _count_equal(batch, 'next_qualified', 'true')
+            measure_count += _count_equal(batch, 'measure_qualified', 'true')
+            blocker_count += _count_equal(batch, 'blocker_qualified', 'true')
+            fit_count += _count_equal(batch, 'fit_qualified', 'true')
+    finally:
+        if writer is not None:
+            writer.close()
+        if sink is not None:
+            sink.close()
+
+    if total == 0:
         print("No meetings found matching criteria")
         return
 
-    # Write CSV with all fields
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
-
-    print(f"✓ Exported {len(rows)} meetings to {output_path}")
-
-    # Print summary stats
-    total = len(rows)
-    score_5 = sum(1 for r in rows if r['total_qualified_sections'] == 5)
-    score_4 = sum(1 for r in rows if r['total_qualified_sections'] == 4)
+    print(f"✓ Exported {total} meetings to {output_path}")
 
     print(f"\nScore distribution:")
     print(f"  5/5: {score_5} ({score_5/total*100:.1f}%)")
     print(f"  4/5: {score_4} ({score_4/total*100:.1f}%)")
 
-    # Count by criteria
-    now_count = sum(1 for r in rows if r['now_qualified'] == 'true')
-    next_count = sum(1 for r in rows if r['next_qualified'] == 'true')
-    measure_count = sum(1 for r in rows if r['measure_qualified'] == 'true')
-    blocker_count = sum(1 for r in rows if r['blocker_qualified'] == 'true')
-    fit_count = sum(1 for r in rows if r['fit_qualified'] == 'true')
-
     print(f"\nCriteria pass rates:")
     print(f"  NOW:     {now_count}/{total} ({now_count/total*100:.1f}%)")
     print(f"  NEXT:    {next_count}/{total} ({next_count/total*100:.1f}%)")
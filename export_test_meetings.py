@@ -2,14 +2,72 @@
 Export recent meetings from BigQuery to JSON for testing sales assessment.
 """
 
-import json
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import date
+from google.cloud import bigquery
 from src.bq_loader import BigQueryLoader
 from rich.console import Console
 
+try:
+    from google.cloud import bigquery_storage
+except ImportError:  # Storage Read API is optional; falls back to REST paging
+    bigquery_storage = None
+
 console = Console()
 
+# Below this many rows the REST tabledata.list path is cheaper than opening a
+# Storage Read API session, so small exports stay on REST.
+STORAGE_API_MIN_ROWS = 50
+
+# Worker threads for per-meeting JSON serialisation + file writes
+EXPORT_WORKERS = 8
+
+# Path separators mapped to '_' when turning a meeting_id into a filename
+_FNAME_TRANS = str.maketrans('/\\', '__')
+
+
+def _write_meeting(output_path: Path, row: dict) -> None:
+    """Build the transcript JSON for one exported row and write it to disk."""
+    # Build transcript JSON
+    transcript = {
+        "meeting_id": row["meeting_id"],
+        "date": row["date"].isoformat() if isinstance(row["date"], date) else str(row["date"]),
+        "company": None,  # Will be extracted by LLM
+        "participants": row["participants"] if row["participants"] else [],
+        "desk": row["desk"] or "Unknown",
+        "notes": [],  # Legacy field, empty for Granola imports
+        "source": row["source"] or "bigquery-export",
+
+        # Granola metadata
+        "granola_note_id": row["granola_note_id"],
+        "title": row["title"],
+        "creator_name": row["creator_name"],
+        "creator_email": row["creator_email"],
+        "calendar_event_title": row["calendar_event_title"],
+        "calendar_event_id": row["calendar_event_id"],
+        "calendar_event_time": row["calendar_event_time"].isoformat() if row["calendar_event_time"] else None,
+        "granola_link": row["granola_link"],
+        "file_created_timestamp": str(row["file_created_timestamp"]) if row["file_created_timestamp"] else None,
+        "zapier_step_id": str(row["zapier_step_id"]) if row["zapier_step_id"] else None,
+
+        # Content sections
+        "enhanced_notes": row["enhanced_notes"],
+        "my_notes": row["my_notes"],
+        "full_transcript": row["full_transcript"]
+    }
+
+    # Create filename from meeting_id (sanitize for filesystem)
+    filename = row["meeting_id"].translate(_FNAME_TRANS)[:100] + '.json'
+    file_path = output_path / filename
+
+    # orjson serialises in C (large full_transcript strings dominate), one write per file
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(transcript, option=orjson.OPT_INDENT_2))
+
+
 def export_meetings(limit: int = 5, output_dir: str = "data/json_test"):
     """Export recent meetings from BigQuery to JSON files."""
 
@@ -18,7 +76,7 @@ def export_meetings(limit: int = 5, output_dir: str = "data/json_test"):
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Query for recent meetings with full transcript data
-    query = f'''
+    query = '''
     SELECT
         meeting_id,
         date,
@@ -43,51 +101,42 @@ def export_meetings(limit: int = 5, output_dir: str = "data/json_test"):
       AND LENGTH(full_transcript) > 1000
       AND creator_name IS NOT NULL
     ORDER BY date DESC
-    LIMIT {limit}
+    LIMIT @limit
     '''
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[bigquery.ScalarQueryParameter('limit', 'INT64', limit)]
+    )
 
     console.print(f'[blue]Fetching {limit} most recent meetings from BigQuery...[/blue]')
-    results = loader.client.query(query).result()
+    results = loader.client.query(query, job_config=job_config).result()
 
+    bqstorage = None
+    if bigquery_storage is not None and (results.total_rows or 0) > STORAGE_API_MIN_ROWS:
+        # Large export: the transcript columns come back as Arrow batches over
+        # gRPC instead of JSON pages from tabledata.list
+        bqstorage = bigquery_storage.BigQueryReadClient()
+
+    # Serialisation + disk writes run on worker threads while the main thread
+    # keeps pulling rows off the result stream. At most EXPORT_WORKERS * 2
+    # rows are in flight; the oldest is reported (in query order) before the
+    # next is submitted, so memory stays bounded and progress shows as it goes.
     exported_count = 0
-    for row in results:
-        # Build transcript JSON
-        transcript = {
-            "meeting_id": row.meeting_id,
-            "date": row.date.isoformat() if isinstance(row.date, date) else str(row.date),
-            "company": None,  # Will be extracted by LLM
-            "participants": row.participants if row.participants else [],
-            "desk": row.desk or "Unknown",
-            "notes": [],  # Legacy field, empty for Granola imports
-            "source": row.source or "bigquery-export",
-
-            # Granola metadata
-            "granola_note_id": row.granola_note_id,
-            "title": row.title,
-            "creator_name": row.creator_name,
-            "creator_email": row.creator_email,
-            "calendar_event_title": row.calendar_event_title,
-            "calendar_event_id": row.calendar_event_id,
-            "calendar_event_time": row.calendar_event_time.isoformat() if row.calendar_event_time else None,
-            "granola_link": row.granola_link,
-            "file_created_timestamp": str(row.file_created_timestamp) if row.file_created_timestamp else None,
-            "zapier_step_id": str(row.zapier_step_id) if row.zapier_step_id else None,
-
-            # Content sections
-            "enhanced_notes": row.enhanced_notes,
-            "my_notes": row.my_notes,
-            "full_transcript": row.full_transcript
-        }
-
-        # Create filename from meeting_id (sanitize for filesystem)
-        filename = row.meeting_id.replace('/', '_').replace('\\', '_')[:100] + '.json'
-        file_path = output_path / filename
-
-        with open(file_path, 'w') as f:
-            json.dump(transcript, f, indent=2)
-
-        console.print(f'[green]✓[/green] Exported: {row.title or row.meeting_id[:50]} (by {row.creator_name})')
-        exported_count += 1
+
+    def report(row, future):
+        future.result()
+        console.print(f'[green]✓[/green] Exported: {row["title"] or row["meeting_id"][:50]} (by {row["creator_name"]})')
+
+    with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as pool:
+        in_flight = deque()
+        for batch in results.to_arrow_iterable(bqstorage_client=bqstorage):
+            for row in batch.to_pylist():
+                if len(in_flight) >= EXPORT_WORKERS * 2:
+                    report(*in_flight.popleft())
+                    exported_count += 1
+                in_flight.append((row, pool.submit(_write_meeting, output_path, row)))
+        while in_flight:
+            report(*in_flight.popleft())
+            exported_count += 1
 
     console.print(f'\n[bold green]Exported {exported_count} meetings to {output_path}/[/bold green]')
     return exported_count
@@ -2,23 +2,153 @@
 """
 Generate client-ready scoring results report from BigQuery
 """
-import json
 import csv
-import subprocess
+from collections import Counter
 from datetime import datetime, date
+from functools import cached_property
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 import os
 
+from google.cloud import bigquery
+
+try:
+    from rustpy_xlsxwriter import FastExcel
+except ImportError:  # XLSX output is optional; CSV/HTML reports still work
+    FastExcel = None
+
+# Cap on detail rows pulled into the report (previously `bq --max_rows=100`)
+MAX_REPORT_ROWS = 100
+
+# Rows per tabledata.list page. Paging is RTT-bound, so ask for large pages
+# (capped at the row limit) rather than the library's small default.
+REPORT_PAGE_SIZE = 10_000
+
+# UNKNOWN service lines counted in the category breakdown
+_FIT_SET = frozenset({'access', 'transform', 'ventures', 'talent', 'evolve'})
+
+# Column headers shared by the detailed CSV and the XLSX Opportunities sheet
+_DETAIL_HEADER = (
+    'Meeting ID', 'Title', 'Date', 'Participants', 'Total Score', 'Qualified',
+    'NOW Score', 'NOW Evidence', 'NOW Reason', 'NOW Summary',
+    'NEXT Score', 'NEXT Evidence', 'NEXT Reason', 'NEXT Summary',
+    'MEASURE Score', 'MEASURE Evidence', 'MEASURE Reason', 'MEASURE Summary',
+    'BLOCKER Score', 'BLOCKER Evidence', 'BLOCKER Reason', 'BLOCKER Summary',
+    'FIT Score', 'FIT Labels', 'FIT Evidence', 'FIT Reason', 'FIT Summary',
+    'Challenges', 'Results', 'Offering',
+    'Scored At', 'Model',
+)
+
+
+# Executive-summary counts over every meeting in the window, not just the
+# MAX_REPORT_ROWS detail rows: ~10 rows back instead of a client-side pass.
+_SUMMARY_STATS_QUERY = """
+WITH scoped AS (
+    SELECT total_qualified_sections, qualified, fit
+    FROM `angular-stacker-471711-k4.unknown_brain.meeting_intel`
+    WHERE scored_at >= TIMESTAMP(@date_filter)
+)
+SELECT 'score' AS kind, CAST(total_qualified_sections AS STRING) AS key,
+       COUNT(*) AS n, COUNTIF(qualified) AS q
+FROM scoped
+GROUP BY total_qualified_sections
+UNION ALL
+SELECT 'fit' AS kind, LOWER(JSON_VALUE(label)) AS key, COUNT(*) AS n, 0 AS q
+FROM scoped,
+     UNNEST(IF(ARRAY_LENGTH(JSON_QUERY_ARRAY(fit, '$.services')) > 0,
+               JSON_QUERY_ARRAY(fit, '$.services'),
+               JSON_QUERY_ARRAY(fit, '$.fit_labels'))) AS label
+WHERE LOWER(JSON_VALUE(label)) IN UNNEST(@fit_set)
+GROUP BY key
+"""
+
+
+def _stats_from_aggregates(rows: Iterable[Any]) -> Dict[str, Any]:
+    """Fold _SUMMARY_STATS_QUERY rows into the summary_stats shape"""
+    total_meetings = 0
+    qualified_meetings = 0
+    score_dist = Counter()
+    fit_categories = Counter()
+    for row in rows:
+        if row['kind'] == 'score':
+            total_meetings += row['n']
+            qualified_meetings += row['q']
+            score_dist[int(row['key'] or 0)] += row['n']
+        else:
+            fit_categories[row['key']] += row['n']
+    return {
+        'total_meetings': total_meetings,
+        'qualified_meetings': qualified_meetings,
+        'score_dist': score_dist,
+        'fit_categories': fit_categories,
+    }
+
+
+def _check_from_columns(row: Any, name: str) -> Dict[str, Any]:
+    """Rebuild a criterion dict from its JSON_VALUE-projected columns"""
+    return {
+        'qualified': row.get(f'{name}_qualified') == 'true',
+        'evidence': row.get(f'{name}_evidence') or '',
+        'reason': row.get(f'{name}_reason') or '',
+        'summary': row.get(f'{name}_summary') or '',
+    }
+
+
+def _check_cells(check: Dict[str, Any]) -> Tuple[int, str, str, str]:
+    """(score, evidence, reason, summary) CSV cells for one criterion"""
+    return (
+        1 if check.get('qualified') else 0,
+        check.get('evidence', ''),
+        check.get('reason', ''),
+        check.get('summary', ''),
+    )
+
+
+def _fit_labels(fit: Dict[str, Any]) -> List[str]:
+    """FIT labels, trying both 'services' and legacy 'fit_labels' fields"""
+    return fit.get('services') or fit.get('fit_labels') or []
+
+
+def _csv_row(r: Dict[str, Any]) -> Tuple:
+    """One detailed-CSV row; criterion dicts are pre-normalised by iter_processed_rows"""
+    fit_score, fit_evidence, fit_reason, fit_summary = _check_cells(r['fit'])
+    return (
+        r['meeting_id'],
+        r['title'],
+        r['date'],
+        '; '.join(r['participants']),
+        r['total_qualified_sections'],
+        'Yes' if r['qualified'] else 'No',
+        *_check_cells(r['now']),
+        *_check_cells(r['next']),
+        *_check_cells(r['measure']),
+        *_check_cells(r['blocker']),
+        fit_score,
+        '; '.join(_fit_labels(r['fit'])),
+        fit_evidence,
+        fit_reason,
+        fit_summary,
+        '; '.join(r['challenges']),
+        '; '.join(r['results']),
+        r['offering'],
+        r['scored_at'],
+        r['llm_model'],
+    )
+
 class ClientReportGenerator:
     def __init__(self):
         self.results = []
         self.output_dir = Path("client_reports")
         self.output_dir.mkdir(exist_ok=True)
+        self.client = bigquery.Client(project=os.getenv('BQ_PROJECT_ID', 'angular-stacker-471711-k4'))
+        # One timestamp for the whole run, shared by every report format
+        self.generated_at = datetime.now()
+        self.report_date = self.generated_at.strftime('%B %d, %Y')
 
     def extract_bq_results(self, date_filter: str = "2025-09-28") -> List[Dict]:
-        """Extract results from BigQuery with proper JSON parsing"""
-        query = f"""
+        """Extract results from BigQuery, with JSON fields flattened in SQL"""
+        query = """
         SELECT
             meeting_id,
             title,
@@ -26,123 +156,176 @@ class ClientReportGenerator:
             participants,
             total_qualified_sections,
             qualified,
-            now,
-            next,
-            measure,
-            blocker,
-            fit,
+
+            -- Only the scalars the report reads, extracted server-side
+            JSON_VALUE(now, '$.qualified') AS now_qualified,
+            JSON_VALUE(now, '$.evidence') AS now_evidence,
+            JSON_VALUE(now, '$.reason') AS now_reason,
+            JSON_VALUE(now, '$.summary') AS now_summary,
+
+            JSON_VALUE(next, '$.qualified') AS next_qualified,
+            JSON_VALUE(next, '$.evidence') AS next_evidence,
+            JSON_VALUE(next, '$.reason') AS next_reason,
+            JSON_VALUE(next, '$.summary') AS next_summary,
+
+            JSON_VALUE(measure, '$.qualified') AS measure_qualified,
+            JSON_VALUE(measure, '$.evidence') AS measure_evidence,
+            JSON_VALUE(measure, '$.reason') AS measure_reason,
+            JSON_VALUE(measure, '$.summary') AS measure_summary,
+
+            JSON_VALUE(blocker, '$.qualified') AS blocker_qualified,
+            JSON_VALUE(blocker, '$.evidence') AS blocker_evidence,
+            JSON_VALUE(blocker, '$.reason') AS blocker_reason,
+            JSON_VALUE(blocker, '$.summary') AS blocker_summary,
+
+            JSON_VALUE(fit, '$.qualified') AS fit_qualified,
+            JSON_VALUE(fit, '$.evidence') AS fit_evidence,
+            JSON_VALUE(fit, '$.reason') AS fit_reason,
+            JSON_VALUE(fit, '$.summary') AS fit_summary,
+            -- FIT labels: `services`, falling back to legacy `fit_labels`
+            ARRAY(
+                SELECT JSON_VALUE(label)
+                FROM UNNEST(
+                    IF(ARRAY_LENGTH(JSON_QUERY_ARRAY(fit, '$.services')) > 0,
+                       JSON_QUERY_ARRAY(fit, '$.services'),
+                       JSON_QUERY_ARRAY(fit, '$.fit_labels'))
+                ) AS label
+                WHERE JSON_VALUE(label) IS NOT NULL
+            ) AS fit_labels,
+
             challenges,
             results,
             offering,
             scored_at,
             llm_model
         FROM `angular-stacker-471711-k4.unknown_brain.meeting_intel`
-        WHERE scored_at >= TIMESTAMP('{date_filter}')
+        WHERE scored_at >= TIMESTAMP(@date_filter)
         ORDER BY total_qualified_sections DESC, scored_at DESC
+        LIMIT @max_rows
         """
 
-        # Run BigQuery query and save to JSON
-        cmd = [
-            "bq", "query",
-            "--use_legacy_sql=false",
-            "--format=json",
-            "--max_rows=100",
-            query
-        ]
-
-        # Set up environment with Google Cloud SDK
-        env = os.environ.copy()
-        env["PATH"] = f"/Users/matt/google-cloud-sdk/bin:{env.get('PATH', '')}"
+        # Parameters instead of interpolation: constant query text is
+        # cacheable, and date_filter can't inject SQL.
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter('date_filter', 'STRING', date_filter),
+                bigquery.ScalarQueryParameter('max_rows', 'INT64', MAX_REPORT_ROWS),
+            ],
+            use_query_cache=True,
+        )
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, env=env)
-            if result.returncode != 0:
-                print(f"Error running BigQuery: {result.stderr}")
-                return []
-
-            # Parse JSON results
-            raw_results = json.loads(result.stdout)
-
-            # Process each result to extract nested JSON fields
-            processed_results = []
-            for row in raw_results:
-                # Parse JSON fields if they exist and are not None
-                def safe_json_parse(field):
-                    if field and field != "null":
-                        try:
-                            return json.loads(field)
-                        except:
-                            return {}
-                    return {}
-
-                processed_row = {
-                    'meeting_id': row.get('meeting_id', ''),
-                    'title': row.get('title', ''),
-                    'date': row.get('date', ''),
-                    'participants': row.get('participants', []),
-                    'total_qualified_sections': int(row.get('total_qualified_sections', 0)),
-                    'qualified': row.get('qualified') == 'true',
-                    'scored_at': row.get('scored_at', ''),
-                    'llm_model': row.get('llm_model', ''),
-                    'now': safe_json_parse(row.get('now')),
-                    'next': safe_json_parse(row.get('next')),
-                    'measure': safe_json_parse(row.get('measure')),
-                    'blocker': safe_json_parse(row.get('blocker')),
-                    'fit': safe_json_parse(row.get('fit')),
-                    'challenges': row.get('challenges', []),
-                    'results': row.get('results', []),
-                    'offering': row.get('offering', '')
-                }
-                processed_results.append(processed_row)
-
-            self.results = processed_results
-            return processed_results
+            # Submit the aggregate job first so it runs while detail rows page in
+            stats_job = self.client.query(_SUMMARY_STATS_QUERY, job_config=bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter('date_filter', 'STRING', date_filter),
+                    bigquery.ArrayQueryParameter('fit_set', 'STRING', sorted(_FIT_SET)),
+                ],
+                use_query_cache=True,
+            ))
+
+            # In-process client: no `bq` fork, no JSON text round trip
+            rows = self.client.query(query, job_config=job_config).result(
+                page_size=min(REPORT_PAGE_SIZE, MAX_REPORT_ROWS),
+                max_results=MAX_REPORT_ROWS,
+            )
+
+            # With the row cap inside one page this is a single fetch, so
+            # there is no next page worth prefetching on another thread
+            self.results = list(self.iter_processed_rows(rows))
+            # Invalidate the cached_properties derived from the previous results
+            self.__dict__.pop('summary_stats', None)
+            self.__dict__.pop('executive_summary', None)
+            print(f"Fetched {len(self.results)} rows in {rows.page_number} page(s)")
+
+            try:
+                self.summary_stats = _stats_from_aggregates(stats_job.result())
+            except Exception as e:
+                # summary_stats falls back to tallying the fetched detail rows
+                print(f"Summary aggregate query failed, using detail rows: {e}")
+            return self.results
 
         except Exception as e:
             print(f"Error extracting BigQuery results: {e}")
             return []
 
+    def iter_processed_rows(self, raw_results: Iterable[Any]) -> Iterator[Dict]:
+        """Lazily normalise raw BigQuery rows into the report's row shape"""
+        for row in raw_results:
+            fit_labels = list(row.get('fit_labels') or [])
+            yield {
+                'meeting_id': row.get('meeting_id', ''),
+                'title': row.get('title', ''),
+                'date': row.get('date', ''),
+                'participants': row.get('participants') or [],
+                'total_qualified_sections': int(row.get('total_qualified_sections') or 0),
+                'qualified': row.get('qualified') in (True, 'true'),
+                'scored_at': row.get('scored_at', ''),
+                'llm_model': row.get('llm_model', ''),
+                'now': _check_from_columns(row, 'now'),
+                'next': _check_from_columns(row, 'next'),
+                'measure': _check_from_columns(row, 'measure'),
+                'blocker': _check_from_columns(row, 'blocker'),
+                'fit': {
+                    **_check_from_columns(row, 'fit'),
+                    'services': fit_labels,
+                },
+                'fit_labels_norm': tuple(label.lower() for label in fit_labels),
+                'challenges': row.get('challenges') or [],
+                'results': row.get('results') or [],
+                'offering': row.get('offering', '')
+            }
+
+    @cached_property
+    def summary_stats(self) -> Dict[str, Any]:
+        """
+        Executive-summary numbers, tallied in one pass over self.results
+
+        extract_bq_results normally seeds this from _SUMMARY_STATS_QUERY;
+        the local tally is the fallback when that query fails.
+        """
+        qualified_meetings = 0
+        score_dist = Counter()
+        fit_categories = Counter()
+        for r in self.results:
+            qualified_meetings += r['qualified']
+            score_dist[r['total_qualified_sections']] += 1
+
+            # Category breakdown from fit services/labels (lowercased at ingest)
+            fit_categories.update(label for label in r['fit_labels_norm'] if label in _FIT_SET)
+
+        return {
+            'total_meetings': len(self.results),
+            'qualified_meetings': qualified_meetings,
+            'score_dist': score_dist,
+            'fit_categories': fit_categories,
+        }
+
     def generate_executive_summary(self) -> str:
         """Generate executive summary statistics"""
+        return self.executive_summary
+
+    @cached_property
+    def executive_summary(self) -> str:
+        """Rendered summary text, built once and shared by the HTML and email reports"""
         if not self.results:
             return "No results available"
 
-        total_meetings = len(self.results)
-        qualified_meetings = sum(1 for r in self.results if r['qualified'])
+        stats = self.summary_stats
+        total_meetings = stats['total_meetings']
+        qualified_meetings = stats['qualified_meetings']
         qualification_rate = (qualified_meetings / total_meetings * 100) if total_meetings > 0 else 0
+        score_dist = stats['score_dist']
+        fit_categories = stats['fit_categories']
 
-        # Score distribution
-        score_dist = {}
-        for r in self.results:
-            score = r['total_qualified_sections']
-            score_dist[score] = score_dist.get(score, 0) + 1
-
-        # Top opportunities (5/5 scores)
-        top_opportunities = [r for r in self.results if r['total_qualified_sections'] == 5]
-
-        # Category breakdown from fit services/labels
-        fit_categories = {'access': 0, 'transform': 0, 'ventures': 0, 'talent': 0, 'evolve': 0}
-        for r in self.results:
-            fit_data = r.get('fit', {})
-            if isinstance(fit_data, dict):
-                # Try both 'services' and 'fit_labels' fields
-                services = fit_data.get('services', [])
-                fit_labels = fit_data.get('fit_labels', [])
-                labels = services if services else fit_labels
-                if labels:
-                    for label in labels:
-                        if label.lower() in fit_categories:
-                            fit_categories[label.lower()] += 1
-
-        current_date_exec = datetime.now().strftime('%B %d, %Y')
         summary = f"""
 **UNKNOWN Brain - Transcript Analysis Results**
-**Analysis Date**: {current_date_exec}
+**Analysis Date**: {self.report_date}
 
 **Executive Summary:**
 • **{total_meetings} meetings analyzed** using GPT-5-mini model
 • **{qualified_meetings} qualified opportunities** identified ({qualification_rate:.1f}% qualification rate)
-• **{len(top_opportunities)} high-priority prospects** (perfect 5/5 scores)
+• **{score_dist[5]} high-priority prospects** (perfect 5/5 scores)
 • **{score_dist.get(4, 0)} strong prospects** (4/5 scores)
 • **{score_dist.get(3, 0)} moderate prospects** (3/5 scores)
 
@@ -155,118 +338,83 @@ class ClientReportGenerator:
 """
         return summary
 
-    def generate_detailed_csv(self) -> str:
-        """Generate detailed CSV with all scoring data"""
+    def generate_detailed_csv(self, rows: Optional[Iterable[Dict]] = None) -> str:
+        """
+        Generate detailed CSV with all scoring data
+
+        Args:
+            rows: Processed rows to write; consumed in a single pass so a
+                generator (e.g. iter_processed_rows) streams straight to disk.
+                Defaults to self.results.
+        """
+        if rows is None:
+            rows = self.results
         csv_path = self.output_dir / "detailed_scoring_results.csv"
 
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
             writer = csv.writer(f)
 
-            # Header
-            writer.writerow([
-                'Meeting ID', 'Title', 'Date', 'Participants', 'Total Score', 'Qualified',
-                'NOW Score', 'NOW Evidence', 'NOW Reason', 'NOW Summary',
-                'NEXT Score', 'NEXT Evidence', 'NEXT Reason', 'NEXT Summary',
-                'MEASURE Score', 'MEASURE Evidence', 'MEASURE Reason', 'MEASURE Summary',
-                'BLOCKER Score', 'BLOCKER Evidence', 'BLOCKER Reason', 'BLOCKER Summary',
-                'FIT Score', 'FIT Labels', 'FIT Evidence', 'FIT Reason', 'FIT Summary',
-                'Challenges', 'Results', 'Offering',
-                'Scored At', 'Model'
-            ])
-
-            # Data rows
-            for r in self.results:
-                def get_evidence(check_data):
-                    if isinstance(check_data, dict):
-                        return check_data.get('evidence', '')
-                    return ''
-
-                def get_reason(check_data):
-                    if isinstance(check_data, dict):
-                        return check_data.get('reason', '')
-                    return ''
-
-                def get_summary(check_data):
-                    if isinstance(check_data, dict):
-                        return check_data.get('summary', '')
-                    return ''
-
-                def get_score(check_data):
-                    if isinstance(check_data, dict):
-                        qualified = check_data.get('qualified', False)
-                        return 1 if qualified else 0
-                    return 0
-
-                def get_fit_labels(fit_data):
-                    if isinstance(fit_data, dict):
-                        # Try both 'services' and 'fit_labels' fields
-                        services = fit_data.get('services', [])
-                        fit_labels = fit_data.get('fit_labels', [])
-                        labels = services if services else fit_labels
-                        return '; '.join(labels) if labels else ''
-                    return ''
-
-                participants_str = '; '.join(r['participants']) if r['participants'] else ''
-
-                challenges_str = '; '.join(r['challenges']) if r['challenges'] else ''
-                results_str = '; '.join(r['results']) if r['results'] else ''
-
-                writer.writerow([
-                    r['meeting_id'],
-                    r['title'],
-                    r['date'],
-                    participants_str,
-                    r['total_qualified_sections'],
-                    'Yes' if r['qualified'] else 'No',
-                    get_score(r['now']),
-                    get_evidence(r['now']),
-                    get_reason(r['now']),
-                    get_summary(r['now']),
-                    get_score(r['next']),
-                    get_evidence(r['next']),
-                    get_reason(r['next']),
-                    get_summary(r['next']),
-                    get_score(r['measure']),
-                    get_evidence(r['measure']),
-                    get_reason(r['measure']),
-                    get_summary(r['measure']),
-                    get_score(r['blocker']),
-                    get_evidence(r['blocker']),
-                    get_reason(r['blocker']),
-                    get_summary(r['blocker']),
-                    get_score(r['fit']),
-                    get_fit_labels(r['fit']),
-                    get_evidence(r['fit']),
-                    get_reason(r['fit']),
-                    get_summary(r['fit']),
-                    challenges_str,
-                    results_str,
-                    r['offering'],
-                    r['scored_at'],
-                    r['llm_model']
-                ])
+            writer.writerow(_DETAIL_HEADER)
+
+            # Data rows, handed to the C writer as one generator
+            writer.writerows(_csv_row(r) for r in rows)
 
         return str(csv_path)
 
+    def generate_xlsx_report(self) -> Optional[str]:
+        """
+        Generate an Excel workbook with Summary and Opportunities sheets
+
+        Returns None when rustpy-xlsxwriter is not installed.
+        """
+        if FastExcel is None:
+            return None
+        xlsx_path = self.output_dir / "client_report.xlsx"
+
+        stats = self.summary_stats
+        total = stats['total_meetings']
+        qualified = stats['qualified_meetings']
+        summary_rows = [
+            {'Metric': 'Report Date', 'Value': self.report_date},
+            {'Metric': 'Total Meetings Analyzed', 'Value': total},
+            {'Metric': 'Qualified Opportunities', 'Value': qualified},
+            {'Metric': 'Qualification Rate (%)', 'Value': round(qualified / total * 100, 1) if total else 0.0},
+            *({'Metric': f"Score {score}/5", 'Value': stats['score_dist'][score]} for score in range(5, -1, -1)),
+            *({'Metric': f"FIT: {category.title()}", 'Value': stats['fit_categories'][category]}
+              for category in ('access', 'transform', 'ventures', 'talent', 'evolve')),
+        ]
+
+        # Rows are streamed to the writer rather than materialised as dicts
+        opportunity_rows = (dict(zip(_DETAIL_HEADER, _csv_row(r))) for r in self.results)
+
+        (
+            FastExcel(str(xlsx_path))
+            .freeze(row=1)
+            .sheet('Summary', summary_rows)
+            .sheet('Opportunities', opportunity_rows, autofilter=True)
+            .save()
+        )
+        return str(xlsx_path)
+
     def generate_html_report(self) -> str:
         """Generate HTML report for email sharing"""
         html_path = self.output_dir / "client_report.html"
 
         summary = self.generate_executive_summary()
-        current_date = datetime.now().strftime('%B %d, %Y')
 
-        # Top opportunities table
-        top_opportunities = [r for r in self.results if r['total_qualified_sections'] >= 4]
+        # Top opportunities table (rows are already sorted by score)
+        top_opportunities = (r for r in self.results if r['total_qualified_sections'] >= 4)
 
-        opportunities_html = ""
-        for i, opp in enumerate(top_opportunities[:10], 1):  # Top 10
+        # Collect row fragments and join once, rather than growing a string
+        opportunity_rows = []
+        for i, opp in enumerate(islice(top_opportunities, 10), 1):  # Top 10
             score_badge = f"""<span class="score-badge score-{opp['total_qualified_sections']}">{opp['total_qualified_sections']}/5</span>"""
 
             participants = ', '.join(opp['participants'][:3]) if opp['participants'] else 'N/A'
             if len(opp['participants']) > 3:
                 participants += f" (+{len(opp['participants'])-3} more)"
 
-            opportunities_html += f"""
+            opportunity_rows.append(f"""
             <tr>
                 <td>{i}</td>
                 <td><strong>{opp['title']}</strong></td>
@@ -274,7 +422,8 @@ class ClientReportGenerator:
                 <td>{participants}</td>
                 <td>{score_badge}</td>
             </tr>
-            """
+            """)
+        opportunities_html = "".join(opportunity_rows)
 
         html_content = f"""
 <!DOCTYPE html>
@@ -308,7 +457,7 @@ class ClientReportGenerator:
 <body>
     <div class="header">
         <h1>🧠 UNKNOWN Brain Analysis</h1>
-        <p>Transcript Analysis Results - {current_date}</p>
+        <p>Transcript Analysis Results - {self.report_date}</p>
     </div>
 
     <div class="summary">
@@ -356,9 +505,10 @@ class ClientReportGenerator:
         email_path = self.output_dir / "email_template.txt"
 
         summary = self.generate_executive_summary()
-        top_count = len([r for r in self.results if r['total_qualified_sections'] == 5])
-        qualified_count = len([r for r in self.results if r['qualified']])
-        current_time = datetime.now().strftime('%B %d, %Y at %I:%M %p')
+        stats = self.summary_stats
+        top_count = stats['score_dist'][5]
+        qualified_count = stats['qualified_meetings']
+        current_time = self.generated_at.strftime('%B %d, %Y at %I:%M %p')
 
         email_content = f"""Subject: UNKNOWN Brain Analysis Results - {qualified_count} Qualified Opportunities Identified
 
@@ -412,6 +562,11 @@ Generated by UNKNOWN Brain AI Analysis
         print("📊 Generating CSV export...")
         csv_path = self.generate_detailed_csv()
 
+        print("📗 Generating XLSX workbook...")
+        xlsx_path = self.generate_xlsx_report()
+        if xlsx_path is None:
+            print("⚠️  rustpy-xlsxwriter not installed; skipping XLSX workbook")
+
         print("📄 Generating HTML report...")
         html_path = self.generate_html_report()
 
@@ -424,6 +579,7 @@ Generated by UNKNOWN Brain AI Analysis
 Files created:
 • HTML Report: {html_path}
 • CSV Export: {csv_path}
+• XLSX Workbook: {xlsx_path or 'skipped'}
 • Email Template: {email_path}
 
 Ready to share:
@@ -3,17 +3,21 @@ FastAPI wrapper for UNKNOWN Brain CLI - Cloud Run deployment
 """
 
 import os
-import json
 import asyncio
+import functools
+import hashlib
 import logging
-from typing import List, Dict, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Set, Tuple, TypedDict
 from pathlib import Path
 from datetime import datetime, timezone
-import uuid
 import re
 
+import orjson
 from fastapi import FastAPI, HTTPException, BackgroundTasks, status, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from cloudevents.http import from_http
 import uvicorn
@@ -28,50 +32,90 @@ logger = logging.getLogger(__name__)
 # Utility functions for safe type conversions
 def safe_int_convert(value) -> Optional[int]:
     """Safely convert value to integer, handling strings and None"""
-    if value is None:
-        return None
     if isinstance(value, int):
         return value
-    if isinstance(value, str) and value.strip():
-        try:
-            return int(value.strip())
-        except ValueError:
-            return None
-    return None
+    if not isinstance(value, str):
+        return None
+    stripped = value.strip()
+    # Plain digit strings (the usual Zapier/Drive payload) skip the try
+    if stripped.isdecimal():
+        return int(stripped)
+    try:
+        return int(stripped) if stripped else None
+    except ValueError:
+        return None
 
 def convert_to_utc_timestamp(timestamp_str) -> Optional[str]:
     """Convert timezone-aware timestamp to UTC timestamp string for BigQuery"""
-    if not timestamp_str:
+    if not timestamp_str or not isinstance(timestamp_str, str):
         return None
+    return _utc_timestamp(timestamp_str)
 
+@functools.lru_cache(maxsize=4096)
+def _utc_timestamp(timestamp_str: str) -> Optional[str]:
+    # Memoised: the same calendar time recurs across a meeting's rows and
+    # re-runs, and the result is a pure function of the string
     try:
-        # Parse timezone-aware timestamp
-        if isinstance(timestamp_str, str):
-            # Handle formats like "2025-09-12T11:17:00+01:00"
-            dt = datetime.fromisoformat(timestamp_str)
-            # Convert to UTC and format for BigQuery TIMESTAMP
-            utc_dt = dt.astimezone(timezone.utc)
-            return utc_dt.isoformat(timespec='seconds').replace('+00:00', 'Z')
-        return None
-    except (ValueError, AttributeError):
+        # Handle formats like "2025-09-12T11:17:00+01:00"
+        dt = datetime.fromisoformat(timestamp_str)
+        # Convert to UTC and format for BigQuery TIMESTAMP
+        utc_dt = dt.astimezone(timezone.utc)
+        return utc_dt.isoformat(timespec='seconds').replace('+00:00', 'Z')
+    except ValueError:
         # If parsing fails, return None
         return None
 
 # Import existing CLI functionality
 from src.importers.plaintext import PlaintextImporter
 from src.importers.granola_drive import GranolaDriveImporter
-from src.scorers import ClientScorer
 from src.scoring import OutputGenerator
-from src.bq_loader import BigQueryLoader, upload_to_new_bigquery
-from src.gcs_client import GCSClient, get_gcs_client
+from src.bq_loader import get_loader, upload_to_new_bigquery
+from src.gcs_client import GCSClient
 from src.router import resolve_source, get_scorer
+from src.status_store import RedisStatusStore, StatusStore, get_redis, make_status_store
 from src.scorers.talent_scorer import Article9RedactionError
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build the default GCS and BigQuery clients and one client scorer for the
+    default model once, before the first request, and check that the shared
+    status store (Redis) is reachable. On shutdown, flush any rows still
+    queued for a batched MERGE.
+    """
+    try:
+        await asyncio.to_thread(_gcs_for_bucket, None)
+        await asyncio.to_thread(get_loader)
+        default_model = os.getenv("DEFAULT_LLM_MODEL", "gpt-5-mini")
+        scorer = await asyncio.to_thread(get_scorer, "client", model=default_model)
+        _idle_scorers[("client", default_model)].append(scorer)
+    except Exception as e:
+        # Not fatal: the pipeline builds (and caches) them on first use
+        logger.warning(f"Client warm-up failed: {e}")
+
+    try:
+        # Opens the first pooled Redis connection (a no-op for the local
+        # store); every status read/write depends on it, so an unreachable
+        # server should show at boot
+        await processing_status.ping()
+    except Exception as e:
+        # Status calls will keep failing, each after at most the client's
+        # socket timeout; failure paths log them (_update_status_safely)
+        logger.error(f"REDIS_URL is set but Redis is unreachable: {e}")
+    yield
+    # Don't strand rows still waiting out the MERGE batching window
+    await _merge_batcher.drain()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="UNKNOWN Brain - Transcript Scoring API",
     description="LLM-powered transcript analysis for business opportunities",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson renders the (large) /status and /score payloads several times
+    # faster than the stdlib encoder behind JSONResponse
+    default_response_class=ORJSONResponse,
 )
 
 # Request/Response models
@@ -85,6 +129,9 @@ class BatchRequest(BaseModel):
     prefix: str = "transcripts/"
     model: Optional[str] = None
     max_files: int = 10
+    # Explicit files to process; when set, prefix/max_files are ignored and
+    # the bucket isn't listed
+    file_paths: Optional[List[str]] = None
 
 class ProcessingStatus(BaseModel):
     meeting_id: str
@@ -93,9 +140,62 @@ class ProcessingStatus(BaseModel):
     completed_at: Optional[str] = None
     score: Optional[int] = None
     error: Optional[str] = None
+    file_path: Optional[str] = None  # bucket/path for /process-transcript jobs
+    total_files: Optional[int] = None  # batch jobs only
+    processed: Optional[int] = None    # batch jobs only: files finished so far
+
+
+class ProcessingStatusDict(TypedDict, total=False):
+    """Stored form of a job status; ProcessingStatus is built from it for /status."""
+    meeting_id: str
+    status: str
+    created_at: str
+    completed_at: str
+    score: Optional[int]
+    error: str
+    file_path: str
+    total_files: int
+    processed: int
+
+# Job status: Redis when REDIS_URL is set (shared across workers/replicas,
+# TTL-bounded), else a TTL- and size-bounded in-process store. Every access
+# is awaited. Entries are plain dicts (ProcessingStatusDict): the pipeline
+# updates them several times per file, and validating a pydantic model on
+# every update bought nothing.
+processing_status: StatusStore = make_status_store()
+
 
-# In-memory status tracking (in production, use Firestore or Redis)
-processing_status: Dict[str, ProcessingStatus] = {}
+def _now_iso() -> str:
+    """Status timestamp: UTC, second precision (e.g. 2025-09-12T10:17:00+00:00)."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+def _job_id(bucket: str, file_path: str) -> str:
+    """Stable 20-char tracking id for a bucket/path (BLAKE2b, 64-bit digest)."""
+    return "job-" + hashlib.blake2b(f"{bucket}/{file_path}".encode(), digest_size=8).hexdigest()
+
+
+def _batch_id(bucket: str, files: List[str]) -> str:
+    """Stable tracking id for a set of files in a bucket, whatever their order."""
+    key = "\n".join([bucket, *sorted(files)])
+    return "batch-" + hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+async def _update_status(meeting_id: str, **fields) -> None:
+    """Write status fields back through the store (a Redis read is a snapshot)."""
+    await processing_status.update(meeting_id, **fields)
+
+
+async def _update_status_safely(meeting_id: str, **fields) -> None:
+    """
+    _update_status for failure and progress paths: a status store that is
+    itself failing (Redis down) is logged rather than raised, so it can't
+    replace the pipeline error being recorded or stop a batch worker.
+    """
+    try:
+        await _update_status(meeting_id, **fields)
+    except Exception as e:
+        logger.error(f"Status update for {meeting_id} failed ({fields.get('status', 'progress')}): {e}")
 
 
 class PermanentProcessingError(Exception):
@@ -110,30 +210,130 @@ class PermanentProcessingError(Exception):
 
 # Bounds how many ~90s scorings run concurrently IN THIS PROCESS so a burst of
 # poller-driven CloudEvents can't fan out enough to trip OpenAI rate limits.
-# Cross-instance fan-out is governed separately by Cloud Run max-instances.
+# Cross-instance fan-out is governed separately by Cloud Run max-instances;
+# with WEB_CONCURRENCY > 1 each uvicorn worker gets its own semaphore.
 # Scoring is offloaded to a thread (asyncio.to_thread) so the event loop stays
 # responsive to health checks while a scoring is in flight.
 SCORING_MAX_CONCURRENCY = int(os.getenv("SCORING_MAX_CONCURRENCY", "3"))
 _scoring_semaphore = asyncio.Semaphore(SCORING_MAX_CONCURRENCY)
 
+# Lifetime of a score copied from the GCS cache into Redis. GCS cache keys
+# are date-scoped, so a day covers every key that can still be looked up.
+SCORE_CACHE_TTL_SECONDS = 86400
+
+# /process-transcript and /process-batch runs in flight in this process, by
+# status id (a file's _job_id, or a batch's _batch_id). Only touched on the
+# event loop thread. Cross-instance duplicates are still
+# stopped before scoring by the GCS claim in process_pipeline.
+_inflight_pipelines: Set[str] = set()
+
+# Batch files a pipeline may download + ingest ahead of a free scoring slot.
+# process_pipeline only waits on _scoring_semaphore after its download and
+# parse, so files in flight beyond SCORING_MAX_CONCURRENCY are prefetched
+# while the scoring slots are busy with (multi-second) LLM calls.
+BATCH_PREFETCH = int(os.getenv("BATCH_PREFETCH", "5"))
+
+# Files from one /process-batch request processed concurrently: the scoring
+# slots plus the prefetch window.
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", str(SCORING_MAX_CONCURRENCY + BATCH_PREFETCH)))
+
+# Idle scorers per (source, model). A scorer is checked out for the duration
+# of one scoring and returned afterwards, so its OpenAI client (connection
+# pool, TLS sessions) is reused across transcripts. Instances are never shared
+# by two concurrent scorings: ClientScorer keeps per-call state on self
+# (_current_meeting_id, a temporary model swap on fallback). Only touched from
+# the event loop thread, so no lock is needed; the pool per key never exceeds
+# SCORING_MAX_CONCURRENCY in the pipeline.
+_idle_scorers: Dict[Tuple[str, str], List] = defaultdict(list)
+
+
+@asynccontextmanager
+async def _checkout_scorer(source: str, model: str):
+    """Borrow an idle scorer for (source, model), building one if none is free."""
+    idle = _idle_scorers[(source, model)]
+    scorer = idle.pop() if idle else get_scorer(source, model=model)
+    try:
+        yield scorer
+    finally:
+        idle.append(scorer)
+
+
+# Importers only hold precompiled regexes, so one instance per format is
+# shared by every request. Anything not listed here is parsed as plaintext.
+DEFAULT_IMPORTER = PlaintextImporter()
+IMPORTERS = {
+    ".txt": GranolaDriveImporter(),
+    ".md": DEFAULT_IMPORTER,
+}
+
+# Uploads the storage webhook picks up: any registered extension anywhere
+# under transcripts/, so adding a format to IMPORTERS is the only edit needed
+TRANSCRIPT_FILE_RE = re.compile(
+    r"^transcripts/.+(?:%s)$" % "|".join(map(re.escape, IMPORTERS))
+)
+
+
+def pick_importer(path: str):
+    """Importer for a transcript file, chosen by its extension."""
+    return IMPORTERS.get(os.path.splitext(path)[1].lower(), DEFAULT_IMPORTER)
+
+
+@functools.lru_cache(maxsize=16)
+def _gcs_for_bucket(bucket: Optional[str]) -> GCSClient:
+    """One GCSClient (authenticated session) per bucket for the process."""
+    return GCSClient(bucket_name=bucket)
+
+
+# All handlers are `async def` and share one event loop, so none of them may
+# call the GCS / BigQuery / OpenAI SDKs directly: every such call goes through
+# asyncio.to_thread or _run_bq, or one slow request stalls all the others.
+#
+# google-cloud-bigquery has no async API, and a MERGE load job blocks for
+# ~10-15s. Those calls get their own pool so they can't starve the default
+# executor that asyncio.to_thread uses for GCS and importer I/O.
+_bq_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("BQ_EXECUTOR_WORKERS", "32")),
+    thread_name_prefix="bq",
+)
+
+# Bodies for the probe/config endpoints never change while the process runs
+# (Cloud Run hits /health several times a second), so they are encoded once
+# here and returned as-is. /health/detailed adds the live timestamp.
+_HEALTH = {
+    "status": "healthy",
+    "service": "unknown-brain-api",
+    "environment": os.getenv("ENVIRONMENT", "development"),
+}
+_ROOT_BODY = orjson.dumps({
+    "message": "UNKNOWN Brain Transcript Scoring API",
+    "status": "healthy",
+    "version": "1.0.0"
+})
+_HEALTH_BODY = orjson.dumps(_HEALTH)
+_MODELS_BODY = orjson.dumps({
+    "models": [
+        {"name": "gpt-5-mini", "description": "Best performance, recommended default"},
+        {"name": "gpt-4o-mini", "description": "Reliable fallback option"},
+        {"name": "gpt-4o", "description": "Standard option"},
+        {"name": "gpt-5", "description": "Full reasoning with 400k context"}
+    ],
+    "default": os.getenv("DEFAULT_LLM_MODEL", "gpt-5-mini")
+})
+
 @app.get("/", tags=["Health"])
 async def root():
     """Root endpoint"""
-    return {
-        "message": "UNKNOWN Brain Transcript Scoring API",
-        "status": "healthy",
-        "version": "1.0.0"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Health check endpoint for Cloud Run"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "unknown-brain-api",
-        "environment": os.getenv("ENVIRONMENT", "development")
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
+
+@app.get("/health/detailed", tags=["Health"])
+async def health_check_detailed():
+    """Health check with the server's current time, for debugging"""
+    return {**_HEALTH, "timestamp": _now_iso()}
 
 @app.post("/process-transcript", tags=["Processing"])
 async def process_transcript(
@@ -144,19 +344,33 @@ async def process_transcript(
     Process a single transcript through the complete pipeline
     """
     try:
-        # Generate a temporary meeting_id for tracking
-        meeting_id = f"processing-{request.file_path.replace('/', '-')}"
+        # Fixed-length tracking id for this bucket/path, so deep paths don't
+        # make long or URL-unsafe /status/{meeting_id} keys. The path itself
+        # is kept on the status entry.
+        meeting_id = _job_id(request.bucket, request.file_path)
+
+        # Coalesce repeat POSTs for a file whose run hasn't finished yet: the
+        # caller polls the same meeting_id instead of paying for a second
+        # download + LLM scoring + MERGE.
+        if meeting_id in _inflight_pipelines:
+            return {
+                "message": "Already processing",
+                "meeting_id": meeting_id,
+                "status": "pending"
+            }
+        _inflight_pipelines.add(meeting_id)
         
         # Initialize status
-        processing_status[meeting_id] = ProcessingStatus(
-            meeting_id=meeting_id,
-            status="pending",
-            created_at=str(__import__('datetime').datetime.now())
-        )
+        await processing_status.set(meeting_id, {
+            "meeting_id": meeting_id,
+            "status": "pending",
+            "created_at": _now_iso(),
+            "file_path": f"{request.bucket}/{request.file_path}",
+        })
         
         # Start background processing
         background_tasks.add_task(
-            process_pipeline, 
+            _process_pipeline_coalesced,
             request.bucket, 
             request.file_path,
             request.model,
@@ -170,6 +384,7 @@ async def process_transcript(
         }
         
     except Exception as e:
+        _inflight_pipelines.discard(meeting_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to start processing: {str(e)}"
@@ -183,21 +398,50 @@ async def process_batch(
     """
     Process multiple transcripts in parallel
     """
+    claimed: List[str] = []
     try:
-        batch_id = f"batch-{__import__('uuid').uuid4().hex[:8]}"
-        
-        # In production, list files from GCS bucket
-        # For now, simulate with local directory
-        files = ["file1.txt", "file2.txt"]  # TODO: Replace with GCS listing
-        
+        # At most one listing call up front; the whole batch is then handed to
+        # a single background task that fans out under BATCH_CONCURRENCY.
+        if request.file_paths is not None:
+            files = list(dict.fromkeys(request.file_paths))
+        else:
+            gcs = _gcs_for_bucket(request.bucket)
+            blobs = await asyncio.to_thread(gcs.list_transcripts, request.prefix, request.max_files)
+            files = [blob.name for blob in blobs]
+
+        # Stable id for this set of files, so a client retrying a POST whose
+        # response it never saw gets the batch that is already running rather
+        # than a second one, as repeat /process-transcript POSTs do
+        batch_id = _batch_id(request.bucket, files)
+        if batch_id in _inflight_pipelines:
+            return {
+                "message": "Already processing",
+                "batch_id": batch_id,
+                "status": "pending"
+            }
+        # Files already running here (an overlapping batch or a
+        # /process-transcript call) stay on that run; each file's status is
+        # under its _job_id either way
+        files = [f for f in files if _job_id(request.bucket, f) not in _inflight_pipelines]
+
         batch_status = {
             "batch_id": batch_id,
             "status": "pending",
             "total_files": len(files),
             "processed": 0,
-            "created_at": str(__import__('datetime').datetime.now())
+            "created_at": _now_iso()
         }
         
+        if not files:
+            batch_status["status"] = "empty"
+            return batch_status
+
+        claimed = [batch_id, *(_job_id(request.bucket, f) for f in files)]
+        _inflight_pipelines.update(claimed)
+
+        # Pollable via /status/{batch_id}; process_batch_pipeline advances it
+        await processing_status.set(batch_id, {"meeting_id": batch_id, **batch_status})
+
         # Process files in parallel
         background_tasks.add_task(
             process_batch_pipeline,
@@ -210,23 +454,25 @@ async def process_batch(
         return batch_status
         
     except Exception as e:
+        _inflight_pipelines.difference_update(claimed)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to start batch processing: {str(e)}"
         )
 
-@app.get("/status/{meeting_id}", tags=["Status"])
+@app.get("/status/{meeting_id}", tags=["Status"], response_model=ProcessingStatus)
 async def get_status(meeting_id: str):
     """
     Get processing status for a transcript
     """
-    if meeting_id not in processing_status:
+    job_status = await processing_status.get(meeting_id)
+    if job_status is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Meeting ID not found"
         )
     
-    return processing_status[meeting_id]
+    return ProcessingStatus(**job_status)
 
 @app.post("/ingest", tags=["Pipeline Steps"])
 async def ingest_transcript(request: TranscriptRequest):
@@ -238,10 +484,7 @@ async def ingest_transcript(request: TranscriptRequest):
         # For now, simulate with local processing
         
         # Determine format and use appropriate importer
-        if request.file_path.endswith('.txt'):
-            importer = GranolaDriveImporter()
-        else:
-            importer = PlaintextImporter()
+        importer = pick_importer(request.file_path)
         
         # Process the transcript (this would use GCS in production)
         # transcript = importer.import_file(local_file_path)
@@ -270,19 +513,18 @@ async def score_transcript(
         # Use default model from environment
         scoring_model = model or os.getenv("DEFAULT_LLM_MODEL", "gpt-5-mini")
         
-        # Initialize scorer
-        scorer = ClientScorer(model=scoring_model)
-        
-        # TODO: Load transcript from storage and score it
-        # For now, return simulated response
-        
-        return {
-            "meeting_id": meeting_id,
-            "model": scoring_model,
-            "total_qualified_sections": 5,
-            "qualified": True,
-            "message": "Scoring completed"
-        }
+        # Check out a pooled scorer (shared with the pipeline for this model)
+        async with _checkout_scorer("client", scoring_model) as scorer:
+            # TODO: Load transcript from storage and score it
+            # For now, return simulated response
+            
+            return {
+                "meeting_id": meeting_id,
+                "model": scoring_model,
+                "total_qualified_sections": 5,
+                "qualified": True,
+                "message": "Scoring completed"
+            }
         
     except Exception as e:
         raise HTTPException(
@@ -296,7 +538,7 @@ async def upload_to_bigquery():
     Upload scored results to BigQuery using MERGE (prevents duplicates)
     """
     try:
-        loader = BigQueryLoader()
+        loader = await asyncio.to_thread(get_loader)
         
         # TODO: Load JSONL file from GCS and upload
         # For now, simulate upload
@@ -324,7 +566,7 @@ async def upload_to_new_bigquery_endpoint():
         jsonl_path = Path("out/bq_export_new.jsonl")
 
         if jsonl_path.exists():
-            success = upload_to_new_bigquery(jsonl_path, use_merge=True)
+            success = await _run_bq(upload_to_new_bigquery, jsonl_path, use_merge=True)
 
             if success:
                 return {
@@ -350,15 +592,7 @@ async def list_available_models():
     """
     List available LLM models
     """
-    return {
-        "models": [
-            {"name": "gpt-5-mini", "description": "Best performance, recommended default"},
-            {"name": "gpt-4o-mini", "description": "Reliable fallback option"},
-            {"name": "gpt-4o", "description": "Standard option"},
-            {"name": "gpt-5", "description": "Full reasoning with 400k context"}
-        ],
-        "default": os.getenv("DEFAULT_LLM_MODEL", "gpt-5-mini")
-    }
+    return Response(content=_MODELS_BODY, media_type="application/json")
 
 @app.post("/cloudevents", tags=["Automation"])
 async def handle_storage_event(
@@ -389,8 +623,7 @@ async def handle_storage_event(
         bucket = data.get('bucket', '')
         
         if (event_type == "google.cloud.storage.object.v1.finalized"
-            and file_name.startswith("transcripts/")
-            and (file_name.endswith(".txt") or file_name.endswith(".md"))):
+            and TRANSCRIPT_FILE_RE.match(file_name)):
             
             # Use generation for idempotency (prevents double processing on retries)
             generation = data.get('generation')
@@ -400,23 +633,23 @@ async def handle_storage_event(
             # in flight or already succeeded. A *failed* (or absent) entry must
             # fall through so an Eventarc redelivery can RE-RUN it — otherwise a
             # transient failure would be permanently masked as "duplicate".
-            # (The GCS claim is the real cross-instance dedup; this dict is a
-            # per-instance fast-path only.)
-            existing = processing_status.get(meeting_id)
-            if existing is not None and existing.status in ("pending", "processing", "completed"):
-                logger.info(f"Already processing/processed: {meeting_id} ({existing.status})")
+            # (The GCS claim is the real cross-instance dedup; this store is a
+            # fast-path only — per-instance unless REDIS_URL is set.)
+            existing = await processing_status.get(meeting_id)
+            if existing is not None and existing["status"] in ("pending", "processing", "completed"):
+                logger.info(f"Already processing/processed: {meeting_id} ({existing['status']})")
                 return {
                     "status": "duplicate",
                     "meeting_id": meeting_id,
-                    "message": f"Already {existing.status}",
+                    "message": f"Already {existing['status']}",
                 }
 
             # Mark in-flight
-            processing_status[meeting_id] = ProcessingStatus(
-                meeting_id=meeting_id,
-                status="pending",
-                created_at=datetime.now().isoformat()
-            )
+            await processing_status.set(meeting_id, {
+                "meeting_id": meeting_id,
+                "status": "pending",
+                "created_at": _now_iso(),
+            })
 
             # Process SYNCHRONOUSLY so the HTTP status reflects the real outcome.
             # Eventarc is at-least-once and redelivers on non-2xx — the old
@@ -432,9 +665,9 @@ async def handle_storage_event(
             )
 
             if outcome == "transient_failure":
-                err = getattr(processing_status.get(meeting_id), "error", None)
+                err = (await processing_status.get(meeting_id) or {}).get("error")
                 logger.warning(f"Transient failure for {meeting_id}; returning 503 for Eventarc redelivery")
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                     content={
                         "status": "retry",
@@ -470,50 +703,64 @@ async def handle_storage_event(
 async def get_recent_jobs(limit: int = 10):
     """Get list of recent processing jobs"""
     jobs = []
-    # Get the most recent jobs (last N items)
-    recent_items = list(processing_status.items())[-limit:]
+    # Get the most recent jobs (last N items) without materialising the rest
+    recent_items, total = await asyncio.gather(processing_status.recent(limit), processing_status.count())
     
     for mid, status in recent_items:
+        error = status.get("error")
         jobs.append({
             "meeting_id": mid,
-            "status": status.status,
-            "created_at": status.created_at,
-            "completed_at": getattr(status, 'completed_at', None),
-            "score": getattr(status, 'score', None),
-            "error": status.error[:100] + "..." if status.error and len(status.error) > 100 else status.error
+            "status": status["status"],
+            "created_at": status.get("created_at"),
+            "completed_at": status.get("completed_at"),
+            "score": status.get("score"),
+            "error": error[:100] + "..." if error and len(error) > 100 else error
         })
     
     return {
         "jobs": jobs,
-        "total": len(processing_status),
+        "total": total,
         "showing": len(jobs)
     }
 
+# Partial-response projection for the /cached-results listing
+_CACHED_RESULTS_FIELDS = "items(name,timeCreated,size),nextPageToken"
+
+# cache/<date>/<meeting_id>-<suffix>.json, split at the last dash
+CACHE_BLOB_NAME_RE = re.compile(r"^cache/[^/]+/(?:(?P<meeting_id>.+)-)?(?P<model>[^-]*)\.json$")
+
+
 @app.get("/cached-results", tags=["Status"])
 async def list_cached_results():
     """List cached scoring results from GCS"""
     try:
-        gcs = GCSClient()
+        gcs = _gcs_for_bucket(None)
         today = datetime.now().strftime('%Y-%m-%d')
         cache_prefix = f"cache/{today}/"
         
-        blobs = gcs.client.list_blobs(
+        # list_blobs pages lazily, so drain it in the worker thread too. The
+        # listing only needs to return the three properties read below.
+        blobs = await asyncio.to_thread(lambda: list(gcs.client.list_blobs(
             gcs.bucket_name,
             prefix=cache_prefix,
-            max_results=20
-        )
+            max_results=20,
+            fields=_CACHED_RESULTS_FIELDS,
+        )))
         
         results = []
         for blob in blobs:
-            # Extract meeting_id from filename (remove cache prefix and .json extension)
-            name = blob.name.replace(cache_prefix, "").replace(".json", "")
-            # Remove model suffix (everything after last dash)
-            meeting_id = name.rsplit("-", 1)[0] if "-" in name else name
-            
+            match = CACHE_BLOB_NAME_RE.match(blob.name)
+            if match and match["meeting_id"]:
+                meeting_id, model = match["meeting_id"], match["model"]
+            else:
+                # No dash to split a model suffix off
+                meeting_id = blob.name[len(cache_prefix):].removesuffix(".json")
+                model = "unknown"
+
             results.append({
                 "cache_file": blob.name,
                 "meeting_id": meeting_id,
-                "model": name.split("-")[-1] if "-" in name else "unknown",
+                "model": model,
                 "created": blob.time_created.isoformat() if blob.time_created else None,
                 "size_bytes": blob.size
             })
@@ -547,10 +794,10 @@ async def process_pipeline(
 
     try:
         # Update status
-        processing_status[meeting_id].status = "processing"
+        await _update_status(meeting_id, status="processing")
 
-        # Initialize GCS client
-        gcs = GCSClient(bucket_name=bucket)
+        # Shared per-bucket GCS client
+        gcs = _gcs_for_bucket(bucket)
         
         # Use default model if not specified
         scoring_model = model or os.getenv("DEFAULT_LLM_MODEL", "gpt-5-mini")
@@ -561,8 +808,25 @@ async def process_pipeline(
         # source on every new upload, and historicals are backfilled (see
         # scripts/backfill_unlabelled_client_blobs.py). Missing source now
         # signals a real bug rather than legacy data.
+        #
+        # 1. The download doesn't depend on the metadata, so it is fetched
+        # alongside the reload rather than after it: two GCS round trips
+        # overlap instead of queueing. A downloaded file is registered for
+        # cleanup even if the reload fails.
         blob = gcs.bucket.blob(file_path)
-        blob.reload()
+        print(f"Downloading {file_path} from bucket {bucket}")
+        reloaded, downloaded = await asyncio.gather(
+            asyncio.to_thread(blob.reload),
+            asyncio.to_thread(gcs.download_to_temp_file, file_path),
+            return_exceptions=True,
+        )
+        if not isinstance(downloaded, BaseException):
+            temp_files.append(downloaded)
+        for outcome in (reloaded, downloaded):
+            if isinstance(outcome, BaseException):
+                raise outcome
+        temp_file_path = downloaded
+
         try:
             source = resolve_source(blob.metadata)
         except ValueError as e:
@@ -571,19 +835,10 @@ async def process_pipeline(
             raise PermanentProcessingError(f"Unresolvable source for {file_path}: {e}") from e
         logger.info(f"Processing CloudEvent: object={file_path} source={source}")
 
-        # 1. Download file from GCS
-        print(f"Downloading {file_path} from bucket {bucket}")
-        temp_file_path = gcs.download_to_temp_file(file_path)
-        temp_files.append(temp_file_path)
-
         # 2. Ingest (convert to JSON)
         print(f"Ingesting transcript from {temp_file_path}")
-        if file_path.endswith('.txt'):
-            importer = GranolaDriveImporter()
-        else:
-            importer = PlaintextImporter()
-
-        transcript = importer.parse_file(temp_file_path)
+        importer = pick_importer(file_path)
+        transcript = await asyncio.to_thread(importer.parse_file, temp_file_path)
 
         # Extract the real meeting_id from the transcript (for Granola files)
         real_meeting_id = getattr(transcript, 'granola_note_id', None) or getattr(transcript, 'meeting_id', meeting_id)
@@ -621,18 +876,19 @@ async def process_pipeline(
             cache_variant = f"a9-{_article9_mode()}"
 
         # 3. Check cache with real meeting_id
-        cached_result = gcs.get_cached_score(
-            real_meeting_id, scoring_model, source, variant=cache_variant
+        cached_result = await asyncio.to_thread(
+            _lookup_cached_score, gcs, real_meeting_id, scoring_model, source, cache_variant
         )
         if cached_result:
             print(f"Using cached result for real meeting_id {real_meeting_id}")
-            processing_status[meeting_id].status = "completed"
-            processing_status[meeting_id].completed_at = datetime.now().isoformat()
             # `total_qualified_sections` is a client-domain concept; talent
             # caches omit it. Use .get() so the talent cache-hit path
             # doesn't KeyError.
-            processing_status[meeting_id].score = cached_result.get("results", {}).get(
-                "total_qualified_sections"
+            await _update_status(
+                meeting_id,
+                status="completed",
+                completed_at=_now_iso(),
+                score=cached_result.get("results", {}).get("total_qualified_sections"),
             )
             return "cached"
 
@@ -647,10 +903,9 @@ async def process_pipeline(
         # cross-instance) so exactly one delivery proceeds; the loser skips
         # before scoring (also saving its LLM cost). On failure we release the
         # claim so the meeting can retry.
-        if not gcs.claim_meeting(real_meeting_id, scoring_model, source):
+        if not await asyncio.to_thread(gcs.claim_meeting, real_meeting_id, scoring_model, source):
             print(f"Skipping {real_meeting_id}: already claimed by a concurrent delivery")
-            processing_status[meeting_id].status = "completed"
-            processing_status[meeting_id].completed_at = datetime.now().isoformat()
+            await _update_status(meeting_id, status="completed", completed_at=_now_iso())
             return "duplicate"
         claimed = True
 
@@ -664,8 +919,7 @@ async def process_pipeline(
         # "transient_failure" (handler -> 503 -> Eventarc retries) and `finally`
         # releases the claim so the redelivery can re-claim.
         print(f"Scoring with {scoring_model}")
-        scorer = get_scorer(source, model=scoring_model)
-        async with _scoring_semaphore:
+        async with _scoring_semaphore, _checkout_scorer(source, scoring_model) as scorer:
             new_score_result = await asyncio.to_thread(scorer.score_transcript_new, transcript)
 
             # 4.5 Sales assessment runs ONLY on client transcripts. Talent
@@ -681,38 +935,55 @@ async def process_pipeline(
                     print(f"Sales scoring failed (non-fatal): {e}")
                     # Continue without sales data - this is not critical
 
-        # 5. Cache the results using real meeting_id. The talent result is
-        # a Pydantic model with nested Pydantic submodels (TalentNow,
+        # 5. Cache the results using real meeting_id. Both result types are
+        # Pydantic models with nested submodels (SectionResult, TalentNow,
         # MentionedCompany, ...); .__dict__ alone wouldn't recursively
-        # serialise, so use model_dump for talent. The client path keeps
-        # using .__dict__ for backward-compatibility.
+        # serialise them (the client cache used to hold their str() reprs),
+        # so dump both domains with model_dump. Cache readers only look at
+        # top-level keys (total_qualified_sections), which are unchanged.
         print("Caching results")
-        if source == "talent":
-            cache_payload = new_score_result.model_dump(mode="json")
-        else:
-            cache_payload = new_score_result.__dict__
-        gcs.cache_score(real_meeting_id, scoring_model, source, cache_payload, variant=cache_variant)
+        cache_payload = new_score_result.model_dump(mode="json")
+        cache_write = asyncio.to_thread(
+            gcs.cache_score, real_meeting_id, scoring_model, source, cache_payload, variant=cache_variant
+        )
 
         # 6. Upload to meeting_intel BigQuery table — dispatch by domain so
         # each path writes only its own columns (sales_* stay NULL on
         # talent rows; talent_*/perception/blockers stay NULL on client rows).
         print("Uploading to BigQuery")
         if source == "talent":
-            await upload_talent_format_to_bigquery(
-                transcript, new_score_result, scoring_model, real_meeting_id, temp_files
+            bq_write = upload_talent_format_to_bigquery(
+                transcript, new_score_result, scoring_model, real_meeting_id
             )
         else:
-            await upload_new_format_to_bigquery(
-                transcript, new_score_result, sales_score_result, scoring_model, real_meeting_id, temp_files
+            bq_write = upload_new_format_to_bigquery(
+                transcript, new_score_result, sales_score_result, scoring_model, real_meeting_id
             )
 
+        # The cache write and the MERGE are independent, so they run together.
+        # Only the MERGE decides the outcome: a successful run keeps its claim,
+        # which already turns later deliveries into "duplicate", whereas
+        # failing the run over a cache miss would re-score the meeting. A
+        # failed MERGE takes its cache entry with it, since a redelivery that
+        # hit the cache would report "cached" without ever writing the row.
+        cache_outcome, bq_outcome = await asyncio.gather(cache_write, bq_write, return_exceptions=True)
+        if isinstance(bq_outcome, BaseException):
+            if not isinstance(cache_outcome, BaseException):
+                await asyncio.to_thread(
+                    gcs.discard_cached_score, real_meeting_id, scoring_model, source, variant=cache_variant
+                )
+            raise bq_outcome
+        if isinstance(cache_outcome, BaseException):
+            logger.warning(f"Result cache write failed for {real_meeting_id}: {cache_outcome}")
+
         # Update status with completion. Talent results don't have a
         # `total_qualified_sections` (they're structured intelligence, not
         # a binary score); fall back to None on that path.
-        processing_status[meeting_id].status = "completed"
-        processing_status[meeting_id].completed_at = datetime.now().isoformat()
-        processing_status[meeting_id].score = getattr(
-            new_score_result, "total_qualified_sections", None
+        await _update_status(
+            meeting_id,
+            status="completed",
+            completed_at=_now_iso(),
+            score=getattr(new_score_result, "total_qualified_sections", None),
         )
 
         print(f"Successfully processed {meeting_id}")
@@ -733,8 +1004,7 @@ async def process_pipeline(
             f"ARTICLE9_REDACT_DROP meeting={meeting_id}: redaction did not "
             f"converge; failing closed — row NOT written (no retention): {e}"
         )
-        processing_status[meeting_id].status = "failed"
-        processing_status[meeting_id].error = str(e)
+        await _update_status_safely(meeting_id, status="failed", error=str(e))
         return "permanent_failure"
 
     except PermanentProcessingError as e:
@@ -742,8 +1012,7 @@ async def process_pipeline(
         # so the handler ACKs (2xx) — no Eventarc redelivery. (Claim release is
         # handled uniformly in `finally`.)
         logger.error(f"Permanent failure processing {meeting_id}: {e}")
-        processing_status[meeting_id].status = "failed"
-        processing_status[meeting_id].error = str(e)
+        await _update_status_safely(meeting_id, status="failed", error=str(e))
         return "permanent_failure"
 
     except Exception as e:
@@ -751,8 +1020,7 @@ async def process_pipeline(
         # a TRANSIENT failure so the handler returns non-2xx and Eventarc
         # redelivers. (Claim release is handled uniformly in `finally` — see below.)
         logger.error(f"Transient error processing {meeting_id}: {e}", exc_info=True)
-        processing_status[meeting_id].status = "failed"
-        processing_status[meeting_id].error = str(e)
+        await _update_status_safely(meeting_id, status="failed", error=str(e))
         return "transient_failure"
 
     finally:
@@ -765,99 +1033,221 @@ async def process_pipeline(
         # intentionally keeps the claim + result cache so same-day re-deliveries
         # short-circuit. `claimed` is only True after real_meeting_id/
         # scoring_model/source are all bound, so they're safe to reference here.
+        # Kept synchronous (no to_thread): an await here could itself be
+        # cancelled, and the release must not be skipped.
         if claimed and not succeeded and gcs is not None:
             try:
                 gcs.release_claim(real_meeting_id, scoring_model, source)
             except Exception:
                 pass
-        # Clean up temporary files
+        # Clean up temporary files (local unlinks only; sync for the same
+        # cancellation reason as the claim release)
         if temp_files and gcs is not None:
             gcs.cleanup_temp_files(temp_files)
 
 
+def _lookup_cached_score(
+    gcs: GCSClient, meeting_id: str, model: str, source: str, variant: Optional[str]
+) -> Optional[Dict]:
+    """
+    Read-through score cache: Redis (when REDIS_URL is set) in front of the
+    authoritative GCS cache object. A GCS hit is copied into Redis so repeat
+    deliveries skip the GCS round trips. Redis errors fall back to GCS.
+    Blocking; call via asyncio.to_thread.
+    """
+    redis_client = get_redis()
+    if redis_client is None:
+        return gcs.get_cached_score(meeting_id, model, source, variant=variant)
+
+    # Same key as the GCS object (date-scoped), so both layers agree
+    redis_key = "score:" + gcs.create_cache_key(meeting_id, model, source, variant)
+    try:
+        raw = redis_client.get(redis_key)
+        if raw is not None:
+            return orjson.loads(raw)
+    except Exception as e:
+        logger.warning(f"Redis score-cache read failed for {meeting_id}: {e}")
+
+    cached = gcs.get_cached_score(meeting_id, model, source, variant=variant)
+    if cached is not None:
+        try:
+            redis_client.set(redis_key, orjson.dumps(cached), ex=SCORE_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Redis score-cache write failed for {meeting_id}: {e}")
+    return cached
+
+
+async def _process_pipeline_coalesced(
+    bucket: str,
+    file_path: str,
+    model: Optional[str],
+    meeting_id: str
+):
+    """process_pipeline for /process-transcript; clears the in-flight entry when done."""
+    try:
+        return await process_pipeline(bucket, file_path, model, meeting_id)
+    finally:
+        _inflight_pipelines.discard(meeting_id)
+
+
+def _merge_rows(rows: List[Dict], **merge_kwargs) -> bool:
+    """MERGE rows into meeting_intel from one in-memory JSONL (blocking)."""
+    # OPT_APPEND_NEWLINE writes each terminator in the row's own buffer;
+    # `+ b"\n"` would copy every (multi-MB, transcript-bearing) row again
+    jsonl = b"".join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+    return upload_to_new_bigquery(jsonl, use_merge=True, show_status=False, **merge_kwargs)
+
+
+async def _run_bq(func, *args, **kwargs):
+    """Run a blocking BigQuery call on the dedicated BQ executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bq_executor, functools.partial(func, *args, **kwargs))
+
+
+# Rows waiting for the shared MERGE: at most BQ_MERGE_MAX_BATCH rows or
+# BQ_MERGE_MAX_BYTES of row text, and no row waits longer than
+# BQ_MERGE_FLUSH_SECONDS for its batch to fill. The byte cap keeps a batch of
+# long transcripts, once gzipped, inside the loader's single-request upload.
+BQ_MERGE_MAX_BATCH = int(os.getenv("BQ_MERGE_MAX_BATCH", "50"))
+BQ_MERGE_MAX_BYTES = int(os.getenv("BQ_MERGE_MAX_BYTES", str(16 * 1024 * 1024)))
+BQ_MERGE_FLUSH_SECONDS = float(os.getenv("BQ_MERGE_FLUSH_SECONDS", "5"))
+
+
+def _row_text_size(row: Dict) -> int:
+    """Rough row size: its top-level strings, where the transcript text lives."""
+    return sum(len(value) for value in row.values() if isinstance(value, str))
+
+
+class _MergeBatcher:
+    """
+    Coalesces meeting_intel rows from concurrent pipelines into one MERGE.
+
+    Each MERGE is a load job + query (~10-15s fixed cost, and load jobs count
+    against the per-table daily quota), so rows submitted within the flush
+    window share one. Rows are grouped by merge kwargs (scoring_domain), since
+    each domain runs its own MERGE statement. submit() resolves with that
+    batch's upload result once the MERGE finishes, or raises its error; the
+    upload helpers turn either failure into a transient pipeline failure for
+    every meeting in the batch.
+    """
+
+    def __init__(self, max_batch: int, flush_seconds: float, max_bytes: Optional[int] = None):
+        self.max_batch = max_batch
+        self.max_bytes = max_bytes
+        self.flush_seconds = flush_seconds
+        self._pending: Dict[tuple, List[Tuple[Dict, asyncio.Future]]] = {}
+        self._pending_bytes: Dict[tuple, int] = {}
+        self._timers: Dict[tuple, asyncio.Task] = {}
+        self._tasks: Set[asyncio.Task] = set()  # strong refs until done
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def submit(self, row: Dict, **merge_kwargs) -> bool:
+        key = tuple(sorted(merge_kwargs.items()))
+        done = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(key, [])
+        batch.append((row, done))
+        size = self._pending_bytes[key] = self._pending_bytes.get(key, 0) + _row_text_size(row)
+        if len(batch) >= self.max_batch or (self.max_bytes is not None and size >= self.max_bytes):
+            timer = self._timers.pop(key, None)
+            if timer is not None:
+                timer.cancel()
+            self._spawn(self._flush(key))
+        elif len(batch) == 1:
+            self._timers[key] = self._spawn(self._flush_after_window(key))
+        return await done
+
+    async def drain(self):
+        """Flush every open batch now (shutdown), without waiting out the window."""
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        await asyncio.gather(*(self._flush(key) for key in list(self._pending)))
+
+    async def _flush_after_window(self, key: tuple):
+        await asyncio.sleep(self.flush_seconds)
+        self._timers.pop(key, None)
+        await self._flush(key)
+
+    async def _flush(self, key: tuple):
+        batch = self._pending.pop(key, [])
+        self._pending_bytes.pop(key, None)
+        if not batch:
+            return
+        # MERGE rejects two source rows for one target row; a re-delivered
+        # meeting in the same window keeps only its latest row
+        rows = list({row["meeting_id"]: row for row, _ in batch}.values())
+        try:
+            success = await _run_bq(_merge_rows, rows, **dict(key))
+        except Exception as e:
+            for _, done in batch:
+                if not done.done():
+                    done.set_exception(e)
+        else:
+            for _, done in batch:
+                if not done.done():
+                    done.set_result(success)
+
+
+_merge_batcher = _MergeBatcher(BQ_MERGE_MAX_BATCH, BQ_MERGE_FLUSH_SECONDS, BQ_MERGE_MAX_BYTES)
+
+
+# JSON blob sections of the client and sales scorers, in table column order
+CLIENT_SECTIONS = ("now", "next", "measure", "blocker", "fit")
+SALES_SECTIONS = (
+    "introduction", "discovery", "scoping", "solution",
+    "commercial", "case_studies", "next_steps", "strategic_context",
+)
+_CLIENT_BLOB_FIELDS = frozenset({"client_info", *CLIENT_SECTIONS})
+
+# Transcript fields copied into the meeting_intel row unchanged
+_TRANSCRIPT_PASSTHROUGH_FIELDS = frozenset({
+    "date", "participants", "desk", "source",
+    "granola_note_id", "title", "creator_name", "creator_email",
+    "calendar_event_title", "calendar_event_id", "granola_link",
+    "enhanced_notes", "my_notes", "full_transcript",
+})
+
+
 async def upload_new_format_to_bigquery(
     transcript,
     new_score_result,
     sales_score_result,
     model: str,
     meeting_id: str,
-    temp_files: List[Path]
 ):
     """Upload using new meeting_intel table format with JSON blobs and sales assessment"""
     try:
         # Use the provided score result directly (no re-scoring needed)
 
+        # One pydantic-core pass per model instead of an attribute lookup or
+        # model_dump call per column
+        blobs = new_score_result.model_dump(mode='json', include=_CLIENT_BLOB_FIELDS)
+
         # Create new BigQuery data mapping
         new_bq_data = {
-            # Core transcript fields
+            # Core transcript fields, Granola metadata and content sections
+            **transcript.model_dump(mode='json', include=_TRANSCRIPT_PASSTHROUGH_FIELDS),
             'meeting_id': new_score_result.meeting_id,
-            'date': transcript.date.isoformat() if transcript.date else None,
-            'participants': getattr(transcript, 'participants', []),
-            'desk': getattr(transcript, 'desk', 'Unknown'),
-            'source': getattr(transcript, 'source', None),
 
             # Client info as JSON blob
-            'client_info': {
-                'client_id': new_score_result.client_info.client_id,
-                'client': new_score_result.client_info.client,
-                'domain': new_score_result.client_info.domain,
-                'size': new_score_result.client_info.size,
-                'source': new_score_result.client_info.source
-            },
-
-            # Granola specific fields
-            'granola_note_id': getattr(transcript, 'granola_note_id', None),
-            'title': getattr(transcript, 'title', None),
-            'creator_name': getattr(transcript, 'creator_name', None),
-            'creator_email': getattr(transcript, 'creator_email', None),
-            'calendar_event_title': getattr(transcript, 'calendar_event_title', None),
-            'calendar_event_id': getattr(transcript, 'calendar_event_id', None),
-            'calendar_event_time': convert_to_utc_timestamp(getattr(transcript, 'calendar_event_time', None)),
-            'granola_link': getattr(transcript, 'granola_link', None),
-            'file_created_timestamp': safe_int_convert(getattr(transcript, 'file_created_timestamp', None)),
-            'zapier_step_id': safe_int_convert(getattr(transcript, 'zapier_step_id', None)),
-
-            # Content sections
-            'enhanced_notes': getattr(transcript, 'enhanced_notes', None),
-            'my_notes': getattr(transcript, 'my_notes', None),
-            'full_transcript': getattr(transcript, 'full_transcript', None),
+            'client_info': blobs['client_info'],
+
+            # Granola fields the table stores as TIMESTAMP / INT64
+            'calendar_event_time': convert_to_utc_timestamp(transcript.calendar_event_time),
+            'file_created_timestamp': safe_int_convert(transcript.file_created_timestamp),
+            'zapier_step_id': safe_int_convert(transcript.zapier_step_id),
 
             # Scoring results
             'total_qualified_sections': new_score_result.total_qualified_sections,
             'qualified': new_score_result.qualified,
 
-            # JSON blob scoring sections
-            'now': {
-                'qualified': new_score_result.now.qualified,
-                'reason': new_score_result.now.reason,
-                'summary': new_score_result.now.summary,
-                'evidence': new_score_result.now.evidence
-            },
-            'next': {
-                'qualified': new_score_result.next.qualified,
-                'reason': new_score_result.next.reason,
-                'summary': new_score_result.next.summary,
-                'evidence': new_score_result.next.evidence
-            },
-            'measure': {
-                'qualified': new_score_result.measure.qualified,
-                'reason': new_score_result.measure.reason,
-                'summary': new_score_result.measure.summary,
-                'evidence': new_score_result.measure.evidence
-            },
-            'blocker': {
-                'qualified': new_score_result.blocker.qualified,
-                'reason': new_score_result.blocker.reason,
-                'summary': new_score_result.blocker.summary,
-                'evidence': new_score_result.blocker.evidence
-            },
-            'fit': {
-                'qualified': new_score_result.fit.qualified,
-                'reason': new_score_result.fit.reason,
-                'summary': new_score_result.fit.summary,
-                'services': new_score_result.fit.services,
-                'evidence': new_score_result.fit.evidence
-            },
+            # JSON blob scoring sections (field order matches the table's JSON)
+            **{section: blobs[section] for section in CLIENT_SECTIONS},
 
             # Client taxonomy tagging
             'challenges': new_score_result.challenges,
@@ -887,20 +1277,14 @@ async def upload_new_format_to_bigquery(
 
         # Add sales assessment fields if available (all nullable)
         if sales_score_result:
+            sales_blobs = sales_score_result.model_dump(mode='json', include=set(SALES_SECTIONS))
             new_bq_data.update({
                 'salesperson_name': sales_score_result.salesperson_name,
                 'salesperson_email': sales_score_result.salesperson_email,
                 'sales_total_score': sales_score_result.total_score,
                 'sales_total_qualified': sales_score_result.total_qualified,
                 'sales_qualified': sales_score_result.qualified,
-                'sales_introduction': sales_score_result.introduction.__dict__,
-                'sales_discovery': sales_score_result.discovery.__dict__,
-                'sales_scoping': sales_score_result.scoping.__dict__,
-                'sales_solution': sales_score_result.solution.__dict__,
-                'sales_commercial': sales_score_result.commercial.__dict__,
-                'sales_case_studies': sales_score_result.case_studies.__dict__,
-                'sales_next_steps': sales_score_result.next_steps.__dict__,
-                'sales_strategic_context': sales_score_result.strategic_context.__dict__,
+                **{f'sales_{section}': sales_blobs[section] for section in SALES_SECTIONS},
                 'sales_strengths': sales_score_result.strengths,
                 'sales_improvements': sales_score_result.improvements,
                 'sales_overall_coaching': sales_score_result.overall_coaching
@@ -927,20 +1311,16 @@ async def upload_new_format_to_bigquery(
             })
 
         # Upload to new BigQuery table using MERGE
-        temp_new_jsonl_path = Path(f"/tmp/{meeting_id}_new.jsonl")
-        temp_files.append(temp_new_jsonl_path)
-
-        with open(temp_new_jsonl_path, 'w') as f:
-            f.write(json.dumps(new_bq_data) + "\n")
-
-        success = upload_to_new_bigquery(temp_new_jsonl_path, use_merge=True)
-        if success:
-            print(f"Successfully uploaded {meeting_id} to new meeting_intel table")
-        else:
-            print(f"Failed to upload {meeting_id} to new meeting_intel table")
+        success = await _merge_batcher.submit(new_bq_data)
+        if not success:
+            raise RuntimeError(f"MERGE wrote no rows for {meeting_id}")
+        print(f"Successfully uploaded {meeting_id} to new meeting_intel table")
 
     except Exception as e:
+        # Re-raised so process_pipeline reports a transient failure: the claim
+        # is released and Eventarc redelivers rather than the row being lost
         logger.error(f"Error uploading new format to BigQuery for {meeting_id}: {e}", exc_info=True)
+        raise
 
 
 async def upload_talent_format_to_bigquery(
@@ -948,7 +1328,6 @@ async def upload_talent_format_to_bigquery(
     talent_result,
     model: str,
     meeting_id: str,
-    temp_files: List[Path],
 ):
     """
     Upload a TalentScoringResult to meeting_intel.
@@ -1022,20 +1401,15 @@ async def upload_talent_format_to_bigquery(
             "article9_status": talent_result.article9_status,
         }
 
-        temp_jsonl_path = Path(f"/tmp/{meeting_id}_talent.jsonl")
-        temp_files.append(temp_jsonl_path)
-
-        with open(temp_jsonl_path, "w") as f:
-            f.write(json.dumps(bq_row) + "\n")
-
-        success = upload_to_new_bigquery(temp_jsonl_path, use_merge=True, scoring_domain="talent")
-        if success:
-            print(f"Successfully uploaded {meeting_id} to meeting_intel as scoring_domain=talent")
-        else:
-            print(f"Failed to upload {meeting_id} to meeting_intel (talent path)")
+        success = await _merge_batcher.submit(bq_row, scoring_domain="talent")
+        if not success:
+            raise RuntimeError(f"MERGE wrote no rows for {meeting_id} (talent path)")
+        print(f"Successfully uploaded {meeting_id} to meeting_intel as scoring_domain=talent")
 
     except Exception as e:
+        # Re-raised, as on the client path: a lost MERGE is a transient failure
         logger.error(f"Error uploading talent format to BigQuery for {meeting_id}: {e}", exc_info=True)
+        raise
 
 
 async def process_batch_pipeline(
@@ -1045,27 +1419,87 @@ async def process_batch_pipeline(
     batch_id: str
 ):
     """
-    Background task to process multiple transcripts in parallel
+    Background task to process multiple transcripts in parallel.
+
+    BATCH_CONCURRENCY workers pull files off the list in order, so a large
+    batch can't open hundreds of GCS downloads / OpenAI calls / BQ merges
+    together, and holds that many tasks rather than one per file. One file
+    failing doesn't cancel its siblings; the error is recorded in that
+    file's processing_status entry.
+
+    Each worker records its file's outcome as soon as it finishes, so the
+    batch entry's `processed` count advances file by file, not when the
+    slowest file in the batch does.
     """
+    meeting_ids = [_job_id(bucket, file_path) for file_path in files]
+
+    # Seed every entry up front so /status shows queued files as pending
+    # (one round trip for the whole batch)
+    created_at = _now_iso()
+    batch_status = await processing_status.get(batch_id) or {}
+    await processing_status.set_many({
+        batch_id: {
+            "meeting_id": batch_id,
+            "status": "processing",
+            "total_files": len(files),
+            "processed": 0,
+            "created_at": batch_status.get("created_at", created_at),
+        },
+        **{
+            meeting_id: {"meeting_id": meeting_id, "status": "pending", "created_at": created_at}
+            for meeting_id in meeting_ids
+        },
+    })
+
+    # One shared iterator: each worker takes the next file in listing order
+    queue = iter(zip(files, meeting_ids))
+    processed = 0
+
+    async def worker():
+        nonlocal processed
+        for file_path, meeting_id in queue:
+            try:
+                await process_pipeline(bucket, file_path, model, meeting_id)
+            except Exception as e:
+                logger.error(f"Batch {batch_id}: {file_path} failed: {e}")
+                await _update_status_safely(meeting_id, status="failed", error=str(e))
+            finally:
+                _inflight_pipelines.discard(meeting_id)
+            processed += 1
+            await _update_status_safely(batch_id, processed=processed)
+
     try:
-        # Process files in parallel batches
-        tasks = []
-        for file_path in files:
-            meeting_id = f"{batch_id}-{file_path}"
-            tasks.append(process_pipeline(bucket, file_path, model, meeting_id))
-        
-        # Wait for all tasks to complete
-        await asyncio.gather(*tasks)
-        
-    except Exception as e:
-        print(f"Batch processing failed: {e}")
+        await asyncio.gather(*(worker() for _ in range(min(BATCH_CONCURRENCY, len(files)))))
+    finally:
+        # Files a failed or cancelled run never reached are free to run again
+        _inflight_pipelines.difference_update(meeting_ids)
+        _inflight_pipelines.discard(batch_id)
+
+    await _update_status(batch_id, status="completed", completed_at=_now_iso())
+    logger.info(f"Batch {batch_id} finished: {len(files)} file(s)")
+
+
+def _default_workers() -> int:
+    """
+    One event loop per core, but only when job status is actually shared via
+    Redis: with the in-process store each worker would see a disjoint set of
+    jobs. REDIS_URL alone isn't enough, since make_status_store falls back to
+    the local store when the redis package is missing.
+    """
+    if isinstance(processing_status, RedisStatusStore):
+        return os.cpu_count() or 2
+    return 1
+
 
 if __name__ == "__main__":
-    # For local development
+    # For local development. loop/http stay on "auto": uvicorn uses uvloop
+    # and httptools when installed (see requirements.txt) and falls back to
+    # asyncio/h11 where they aren't, e.g. on Windows.
     port = int(os.environ.get("PORT", 8080))
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=port,
+        workers=int(os.getenv("WEB_CONCURRENCY") or _default_workers()),
         log_level="info"
     )
\ No newline at end of file
@@ -6,6 +6,17 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Built on the first request and kept for the life of the instance, so warm
+# invocations reuse its credentials and HTTP connection pool
+_client = None
+
+
+def _get_client() -> bigquery.Client:
+    global _client
+    if _client is None:
+        _client = bigquery.Client(project="angular-stacker-471711-k4")
+    return _client
+
 @functions_framework.http
 def check_meeting_health(request):
     """
@@ -13,8 +24,6 @@ def check_meeting_health(request):
     Logs an ERROR if no meetings in the last 3 days, which triggers Cloud Monitoring alerts.
     """
 
-    client = bigquery.Client(project="angular-stacker-471711-k4")
-
     query = """
     SELECT COUNT(*) as meeting_count
     FROM `angular-stacker-471711-k4.unknown_brain.meeting_intel`
@@ -22,7 +31,7 @@ def check_meeting_health(request):
     """
 
     try:
-        result = client.query(query).result()
+        result = _get_client().query(query).result()
         row = list(result)[0]
         meeting_count = row.meeting_count
 
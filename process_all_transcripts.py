@@ -1,135 +1,195 @@
 #!/usr/bin/env python3
 """
-Script to process all transcript files through the API endpoint
+Script to process all transcript files through the API's batch endpoint
 """
-import requests
-import json
-import time
-from typing import List
+import asyncio
+import os
+from typing import List, Optional, Set
+
+import httpx
+import orjson
+from google.cloud import storage
 
 # API configuration
 API_BASE_URL = "https://unknown-brain-728000457978.us-central1.run.app"
 BUCKET = "unknown-brain-transcripts"
-
-# List of all transcript files (excluding .gitkeep)
-TRANSCRIPT_FILES = [
-    "transcripts/Matt__-_2025-09-18T13_07_07.566Z.txt",
-    "transcripts/Ollie_Alex_Lubar_call___-_2025-08-26T14_00_00_01_00.txt",
-    "transcripts/Ollie_Instrument_x_Unknown_Connect_-_2025-06-30T15_00_00_01_00.txt",
-    "transcripts/Ollie_Ollie_x_John_-_2025-09-22T14_00_00_01_00.txt",
-    "transcripts/Ollie_Ollie_x_Zulum_-_2025-08-26T12_15_00_01_00.txt",
-    "transcripts/Ollie_Scott_Laura_x_Carrie___Ollie_-_2025-03-28T13_00_00Z.txt",
-    "transcripts/Ollie_Scott_Ollie__Unknown__x_James__CO___-_Intro_chat_-_2025-04-08T10_30_00_01_00.txt",
-    "transcripts/Ollie_Scott_Ollie_x_Eric_-_2025-06-27T12_30_00_01_00.txt",
-    "transcripts/_Ellie_Gould__Diverse_candidate_recruitment_and_Taylor_s_potential_project_opportunity_-_2025-0.txt",
-    "transcripts/_Ellie__Bolder_studio_talent_and_hiring_strategy_planning_-_2025-08-19T16_32_32.431Z.txt",
-    "transcripts/_Ellie__Creative_talent_search_and_agency_strategy_review_for_Weareunknown_-_2025-08-27T14_06_3.txt",
-    "transcripts/_Ellie__Ellie_x_Ayo_-_2025-09-18T11_15_00_01_00.txt",
-    "transcripts/_Ellie__Ellie_x_Miranda__-_2025-07-21T15_00_00_01_00.txt",
-    "transcripts/_Ellie__Virtue_creative_agency_strategy_director_role_exploration_with_candidate_-_2025-08-28T1.txt",
-    "transcripts/_Erik_Lehmann_-_Spekk_Vibe_Interview_-_2025-06-11T16_30_00_01_00.txt",
-    "transcripts/_Matt__Granola_brain_project_planning_with_Access_Transform_Ventures_team_-_2025-09-18T13_07_07.txt",
-    "transcripts/_Matt__Matt_x_Unknown_Brain_Test_Meet_-_2025-09-16T15_45_00_01_00.txt",
-    "transcripts/_Molly_-_Atoms_Space_X_Unknown__-_2025-09-23T11_00_00_01_00.txt",
-    "transcripts/_Ollie__Sam__Ollie_x_Sam_connect_-_2025-10-01T10_30_00_01_00.txt",
-    "transcripts/_Recruiting_-_2025-07-24T17_00_00_01_00.txt",
-    "transcripts/_Sam_Winward__Briefing_Unknown__online__-_2025-09-04T11_30_00_01_00.txt",
-    "transcripts/_Sam_Winward__Effy__Ellie_x_Sam_connect_IRL._-_2025-09-24T13_00_00_01_00.txt",
-    "transcripts/_Sam_Winward__Gladwell_x_Sam_connect_-_2025-09-26T17_00_00_01_00.txt",
-    "transcripts/_Sam_Winward__Lorenzo_x_Sam_connect_-_2025-09-29T14_00_00_01_00.txt",
-    "transcripts/_Sam_Winward__Lucia_x_Sam_connect_-_2025-09-17T17_00_00_01_00.txt",
-    "transcripts/_Sam_Winward__Robin_x_Sam_connect_-_2025-09-19T14_30_00_01_00.txt",
-    "transcripts/_Sam_Winward__Stu_x_Sam_call_-_2025-09-23T16_00_00_01_00.txt",
-    "transcripts/_Sam_Winward__Toby_x_Sam_call_-_2025-09-18T15_00_00_01_00.txt",
-    "transcripts/_Sam_reconnect_-_2025-09-17T14_30_00_01_00.txt",
-    "transcripts/_Sean__Sean_x_Mohan_-_Design_connect_-_2025-10-02T14_00_00_01_00.txt",
-    "transcripts/_Tom_Philipson_-_VC_-_2025-09-26T15_30_00_01_00.txt",
-    "transcripts/_Unkown_-_2025-07-28T12_30_00_01_00.txt",
-    "transcripts/_We_are_unknown_-_2025-07-29T14_00_00_01_00.txt",
-    "transcripts/_Woody__Astronaut_Monastery_x_UNKNOWN__Design_-_2025-08-19T17_30_00_01_00.txt",
-    "transcripts/_Woody__BA_Kick_off_call-_UNKNOWN_-_2025-08-27T16_30_00_01_00.txt",
-    "transcripts/_Woody__Mark_Shanley_X_Woody___Joe_Connect_-_2025-09-16T14_00_00_01_00.txt",
-    "transcripts/_Woody__WatchHouse_x_UKNOWN_-_2025-09-29T12_30_00_01_00.txt"
-]
-
-def process_transcript(bucket: str, file_path: str, model: str = "gpt-5-mini") -> dict:
-    """Process a single transcript through the API"""
-    url = f"{API_BASE_URL}/process-transcript"
-
+TRANSCRIPT_PREFIX = "transcripts/"
+TRANSCRIPT_EXTENSIONS = (".txt", ".md")
+
+# Files per /process-batch request. The server fans each batch out under its
+# own concurrency cap, so this only trades request count against batch size.
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "8"))
+
+# The endpoint only queues a background task and returns, so submissions are
+# sent concurrently; this caps how many requests are open at once.
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "8"))
+
+# Stop submitting once this many files have failed (0 = never stop early);
+# a systematic error (bad URL, auth, outage) then costs a few batches, not all
+MAX_FAILURES = int(os.getenv("MAX_FAILURES", "0"))
+
+# One JSON line per file, appended as each batch returns
+RESULTS_PATH = "processing_results.jsonl"
+
+# Cloud Run answers 429/5xx while it scales out; those (and dropped
+# connections) are retried with exponential backoff: 1s, 2s, 4s, ... A retry
+# is safe even when the server already queued the batch: the batch id is
+# derived from its files, so the instance running it answers "Already
+# processing", and the GCS claim stops a copy on another instance before it
+# scores anything.
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 5
+
+
+def retry_delay(attempt: int, response: Optional[httpx.Response]) -> float:
+    """Seconds to wait before retry `attempt + 1`: the server's Retry-After
+    when it sends one in seconds, never less than the exponential backoff"""
+    delay = 2 ** attempt
+    retry_after = response.headers.get("Retry-After", "") if response is not None else ""
+    if retry_after.isdecimal():
+        delay = max(delay, int(retry_after))
+    return delay
+
+
+def list_transcript_files(bucket: str, prefix: str = TRANSCRIPT_PREFIX) -> List[str]:
+    """
+    Transcript paths currently in the bucket, largest first.
+
+    Big transcripts take longest to score, so starting them first keeps one
+    late giant from stretching the end of the run.
+    """
+    blobs = storage.Client().list_blobs(bucket, prefix=prefix, fields="items(name,size),nextPageToken")
+    transcripts = [b for b in blobs if b.name.endswith(TRANSCRIPT_EXTENSIONS)]
+    transcripts.sort(key=lambda b: b.size or 0, reverse=True)
+    return [b.name for b in transcripts]
+
+async def process_batch(client: httpx.AsyncClient, bucket: str, file_paths: List[str], model: str = "gpt-5-mini") -> List[dict]:
+    """Queue a batch of transcripts through the API; one result per file"""
     payload = {
         "bucket": bucket,
-        "file_path": file_path,
+        "file_paths": file_paths,
         "model": model
     }
-
-    headers = {
-        "Content-Type": "application/json"
-    }
+    label = f"{len(file_paths)} file(s) starting {file_paths[0]}"
 
     try:
-        print(f"Processing: {file_path}")
-        response = requests.post(url, json=payload, headers=headers, timeout=300)
+        for attempt in range(MAX_ATTEMPTS):
+            last_attempt = attempt == MAX_ATTEMPTS - 1
+            response = None
+            try:
+                response = await client.post("/process-batch", json=payload)
+            except httpx.TimeoutException:
+                raise  # already waited the full timeout; don't stack another
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUS_CODES or last_attempt:
+                    break
+            print(f"🔁 Retrying batch of {label} (attempt {attempt + 2}/{MAX_ATTEMPTS})")
+            await asyncio.sleep(retry_delay(attempt, response))
 
         if response.status_code == 200:
-            print(f"✅ Successfully processed: {file_path}")
-            return {"status": "success", "file": file_path, "response": response.json()}
+            batch_id = response.json().get("batch_id")
+            print(f"✅ Queued batch {batch_id}: {label}")
+            return [{"status": "success", "file": f, "batch_id": batch_id} for f in file_paths]
         else:
-            print(f"❌ Failed to process: {file_path} (Status: {response.status_code})")
+            print(f"❌ Failed to queue batch of {label} (Status: {response.status_code})")
             print(f"Response: {response.text}")
-            return {"status": "failed", "file": file_path, "error": response.text}
+            return [{"status": "failed", "file": f, "error": response.text} for f in file_paths]
 
-    except requests.exceptions.Timeout:
-        print(f"⏰ Timeout processing: {file_path}")
-        return {"status": "timeout", "file": file_path}
+    except httpx.TimeoutException:
+        print(f"⏰ Timeout queueing batch of {label}")
+        return [{"status": "timeout", "file": f} for f in file_paths]
     except Exception as e:
-        print(f"💥 Error processing: {file_path} - {str(e)}")
-        return {"status": "error", "file": file_path, "error": str(e)}
+        print(f"💥 Error queueing batch of {label} - {str(e)}")
+        return [{"status": "error", "file": f, "error": str(e)} for f in file_paths]
+
+def load_queued_files(path: str) -> Set[str]:
+    """Files a previous run already queued successfully, from its results log"""
+    if not os.path.exists(path):
+        return set()
+    with open(path, "rb") as f:
+        records = (orjson.loads(line) for line in f if line.strip())
+        return {r["file"] for r in records if r["status"] == "success"}
 
-def main():
+
+async def main():
     """Process all transcript files"""
-    print(f"Starting to process {len(TRANSCRIPT_FILES)} transcript files...")
-    print(f"API Endpoint: {API_BASE_URL}/process-transcript")
+    # Results are appended one line per file as each batch returns, so a run
+    # that dies partway keeps its progress and the next run skips those files.
+    # Delete the log to queue everything again.
+    transcript_files = await asyncio.to_thread(list_transcript_files, BUCKET)
+    already_queued = load_queued_files(RESULTS_PATH)
+    pending = [f for f in transcript_files if f not in already_queued]
+
+    print(f"Starting to process {len(pending)} transcript files...")
+    if already_queued:
+        print(f"Skipping {len(transcript_files) - len(pending)} already queued (see {RESULTS_PATH})")
+    print(f"API Endpoint: {API_BASE_URL}/process-batch")
     print(f"Bucket: {BUCKET}")
     print("-" * 60)
 
-    results = []
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    batches = [
+        pending[i:i + BATCH_SIZE]
+        for i in range(0, len(pending), BATCH_SIZE)
+    ]
     successful = 0
-    failed = 0
-
-    for i, file_path in enumerate(TRANSCRIPT_FILES, 1):
-        print(f"\n[{i}/{len(TRANSCRIPT_FILES)}] Processing: {file_path}")
-
-        result = process_transcript(BUCKET, file_path)
-        results.append(result)
-
-        if result["status"] == "success":
-            successful += 1
-        else:
-            failed += 1
-
-        # Add a small delay between requests to be respectful
-        if i < len(TRANSCRIPT_FILES):
-            print("Waiting 2 seconds before next request...")
-            time.sleep(2)
+    failures: List[dict] = []
+
+    async def bounded(i: int, file_paths: List[str]) -> List[dict]:
+        async with semaphore:
+            print(f"\n[{i}/{len(batches)}] Submitting {len(file_paths)} file(s)")
+            return await process_batch(client, BUCKET, file_paths)
+
+    # One pooled client for the run: every submission after the first reuses
+    # a kept-alive TLS connection instead of handshaking with Cloud Run again
+    pool = httpx.Limits(
+        max_connections=MAX_CONCURRENT_REQUESTS,
+        max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+    )
+    with open(RESULTS_PATH, "ab") as results_log:
+        async with httpx.AsyncClient(base_url=API_BASE_URL, timeout=300, limits=pool) as client:
+            tasks = [asyncio.create_task(bounded(i, b)) for i, b in enumerate(batches, 1)]
+            # Handle batches as they finish, so progress and failures show up
+            # while slower batches are still in flight
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    results_log.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+                    if result["status"] == "success":
+                        successful += 1
+                    else:
+                        failures.append(result)
+                results_log.flush()
+                print(f"Progress: {successful + len(failures)}/{len(pending)} files, "
+                      f"{len(failures)} failed")
+
+                if MAX_FAILURES and len(failures) >= MAX_FAILURES:
+                    print(f"\n🛑 {len(failures)} failures (MAX_FAILURES={MAX_FAILURES}); "
+                          f"cancelling the remaining batches")
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                    break
 
     # Summary
     print("\n" + "=" * 60)
     print("PROCESSING SUMMARY")
     print("=" * 60)
-    print(f"Total files: {len(TRANSCRIPT_FILES)}")
+    print(f"Total files: {len(pending)}")
     print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
+    print(f"Failed: {len(failures)}")
+    skipped = len(pending) - successful - len(failures)
+    if skipped:
+        print(f"Cancelled: {skipped}")
 
-    if failed > 0:
+    if failures:
         print("\nFailed files:")
-        for result in results:
-            if result["status"] != "success":
-                print(f"  - {result['file']} ({result['status']})")
+        for result in failures:
+            print(f"  - {result['file']} ({result['status']})")
 
-    # Save detailed results
-    with open("processing_results.json", "w") as f:
-        json.dump(results, f, indent=2)
-    print(f"\nDetailed results saved to: processing_results.json")
+    print(f"\nDetailed results appended to: {RESULTS_PATH}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
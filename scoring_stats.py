@@ -21,33 +21,43 @@ def generate_scoring_stats():
     os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = 'gcp_service_account_creds.json'
     client = bigquery.Client(project='angular-stacker-471711-k4')
 
-    # Overall distribution
-    query_distribution = """
+    # One scan: the score distribution, with the per-criterion pass counts
+    # broken down by score. The criteria totals, overall count and average
+    # are summed from these few rows below instead of re-scanning the table.
+    query = """
     SELECT
       total_qualified_sections,
       COUNT(*) as meeting_count,
-      ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER(), 1) as percentage
+      COUNTIF(JSON_VALUE(now, '$.qualified') = 'true') as now_count,
+      COUNTIF(JSON_VALUE(next, '$.qualified') = 'true') as next_count,
+      COUNTIF(JSON_VALUE(measure, '$.qualified') = 'true') as measure_count,
+      COUNTIF(JSON_VALUE(blocker, '$.qualified') = 'true') as blocker_count,
+      COUNTIF(JSON_VALUE(fit, '$.qualified') = 'true') as fit_count
     FROM `angular-stacker-471711-k4.unknown_brain.meeting_intel`
     GROUP BY total_qualified_sections
     ORDER BY total_qualified_sections DESC
     """
 
-    # Criteria pass rates
-    query_criteria = """
-    SELECT
-      SUM(CASE WHEN JSON_VALUE(now, '$.qualified') = 'true' THEN 1 ELSE 0 END) as now_count,
-      SUM(CASE WHEN JSON_VALUE(next, '$.qualified') = 'true' THEN 1 ELSE 0 END) as next_count,
-      SUM(CASE WHEN JSON_VALUE(measure, '$.qualified') = 'true' THEN 1 ELSE 0 END) as measure_count,
-      SUM(CASE WHEN JSON_VALUE(blocker, '$.qualified') = 'true' THEN 1 ELSE 0 END) as blocker_count,
-      SUM(CASE WHEN JSON_VALUE(fit, '$.qualified') = 'true' THEN 1 ELSE 0 END) as fit_count,
-      COUNT(*) as total_meetings,
-      ROUND(AVG(total_qualified_sections), 2) as avg_score
-    FROM `angular-stacker-471711-k4.unknown_brain.meeting_intel`
-    """
+    dist_results = list(client.query(query).result())
 
-    # Get results
-    dist_results = list(client.query(query_distribution).result())
-    criteria_results = list(client.query(query_criteria).result())[0]
+    # Every summary figure in one pass over the grouped rows
+    criteria_columns = ("now_count", "next_count", "measure_count", "blocker_count", "fit_count")
+    criteria_counts = dict.fromkeys(criteria_columns, 0)
+    total = scored_count = score_sum = qualified_count = high_score_count = 0
+    for row in dist_results:
+        total += row.meeting_count
+        for column in criteria_columns:
+            criteria_counts[column] += getattr(row, column)
+        score = row.total_qualified_sections
+        if score is None:
+            continue
+        scored_count += row.meeting_count
+        score_sum += score * row.meeting_count
+        if score >= 3:
+            qualified_count += row.meeting_count
+        if score >= 4:
+            high_score_count += row.meeting_count
+    avg_score = round(score_sum / scored_count, 2) if scored_count else None
 
     # Display distribution
     console.print("\n[bold]Score Distribution[/bold]")
@@ -60,14 +70,13 @@ def generate_scoring_stats():
         table.add_row(
             f"{row.total_qualified_sections}/5",
             str(row.meeting_count),
-            f"{row.percentage}%"
+            f"{round(row.meeting_count * 100.0 / total, 1)}%"
         )
 
     console.print(table)
 
     # Display criteria pass rates
     console.print("\n[bold]Criteria Pass Rates[/bold]")
-    total = criteria_results.total_meetings
 
     criteria_table = Table()
     criteria_table.add_column("Criterion", style="cyan")
@@ -75,11 +84,11 @@ def generate_scoring_stats():
     criteria_table.add_column("Rate", style="yellow")
 
     criteria_data = [
-        ("NOW (Immediate Hiring)", criteria_results.now_count),
-        ("NEXT (Future Vision)", criteria_results.next_count),
-        ("MEASURE (Has KPIs)", criteria_results.measure_count),
-        ("BLOCKER (Growth Obstacles)", criteria_results.blocker_count),
-        ("FIT (UNKNOWN Match)", criteria_results.fit_count)
+        ("NOW (Immediate Hiring)", criteria_counts["now_count"]),
+        ("NEXT (Future Vision)", criteria_counts["next_count"]),
+        ("MEASURE (Has KPIs)", criteria_counts["measure_count"]),
+        ("BLOCKER (Growth Obstacles)", criteria_counts["blocker_count"]),
+        ("FIT (UNKNOWN Match)", criteria_counts["fit_count"])
     ]
 
     for name, count in criteria_data:
@@ -95,13 +104,11 @@ def generate_scoring_stats():
     # Summary stats
     console.print(f"\n[bold]Summary Statistics[/bold]")
     console.print(f"  Total meetings: {total}")
-    console.print(f"  Average score: {criteria_results.avg_score}/5")
+    console.print(f"  Average score: {avg_score}/5")
 
-    qualified_count = sum(row.meeting_count for row in dist_results if row.total_qualified_sections >= 3)
     qualified_pct = (qualified_count / total * 100) if total > 0 else 0
     console.print(f"  Qualified (≥3/5): {qualified_count}/{total} ({qualified_pct:.1f}%)")
 
-    high_score_count = sum(row.meeting_count for row in dist_results if row.total_qualified_sections >= 4)
     high_score_pct = (high_score_count / total * 100) if total > 0 else 0
     console.print(f"  High scores (≥4/5): {high_score_count}/{total} ({high_score_pct:.1f}%)")
 
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+"""
+Cluster meeting_intel on meeting_id.
+
+Every upsert MERGEs `ON target.meeting_id = source.meeting_id` and the
+dedup pass ranks rows per meeting_id, but the production table was
+created without clustering, so each of those reads every block of the
+table. New tables are created partitioned by date and clustered on
+meeting_id (bq_loader.create_new_table_if_not_exists); this brings the
+existing table's clustering in line.
+
+BigQuery lets clustering be set on an existing table: rows written from
+then on are clustered, and automatic re-clustering works through the
+existing rows in the background at no charge. Partitioning can NOT be
+added in place — that needs a `CREATE TABLE ... PARTITION BY date
+CLUSTER BY meeting_id AS SELECT * FROM meeting_intel` copy and a swap,
+which this script deliberately does not do.
+
+Usage:
+    python scripts/migrate_cluster_meeting_intel.py           # dry-run
+    python scripts/migrate_cluster_meeting_intel.py --apply   # execute
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=Path(".env").resolve())
+
+from google.cloud import bigquery  # noqa: E402
+
+PROJECT = os.getenv("BQ_PROJECT_ID")
+DATASET = os.getenv("BQ_NEW_DATASET", "unknown_brain")
+TABLE = os.getenv("BQ_NEW_TABLE", "meeting_intel")
+
+CLUSTERING_FIELDS = ["meeting_id"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Actually update the table. Without this flag, dry-run.",
+    )
+    args = parser.parse_args()
+
+    if not PROJECT:
+        print("ERROR: BQ_PROJECT_ID is not set in environment or .env", file=sys.stderr)
+        return 2
+
+    fq_table = f"{PROJECT}.{DATASET}.{TABLE}"
+    print(f"Target: {fq_table}\n")
+
+    client = bigquery.Client(project=PROJECT)
+    table = client.get_table(fq_table)
+
+    print("=== Current ===")
+    print(f"  clustering_fields: {table.clustering_fields}")
+    print(f"  time_partitioning: {table.time_partitioning}")
+
+    if table.clustering_fields == CLUSTERING_FIELDS:
+        print("\nNothing to do — table is already clustered on meeting_id.")
+        return 0
+
+    print(f"\n=== Plan ===\n  clustering_fields: {table.clustering_fields} -> {CLUSTERING_FIELDS}")
+    if table.time_partitioning is None:
+        print("  (table stays unpartitioned — see the module docstring)")
+
+    if not args.apply:
+        print("\nDry-run. Re-run with --apply to execute.")
+        return 0
+
+    print("\n=== Executing ===")
+    table.clustering_fields = CLUSTERING_FIELDS
+    client.update_table(table, ["clustering_fields"])
+
+    print("\n=== Verification ===")
+    updated = client.get_table(fq_table)
+    print(f"  clustering_fields: {updated.clustering_fields}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,20 +1,188 @@
 """BigQuery loader for UNKNOWN Brain transcript data."""
 
+import atexit
+import gzip
+import io
 import json
 import os
+import threading
 import time
 import uuid
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set, Union
 
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.table import Table
 
 console = Console()
 
 
+# meeting_intel columns, shared by table creation and the sales-column
+# migration. SchemaField is an immutable value object, so one list serves
+# every loader.
+_MEETING_INTEL_SCHEMA: List[bigquery.SchemaField] = [
+    bigquery.SchemaField("meeting_id", "STRING", mode="REQUIRED", description="Unique meeting identifier"),
+    bigquery.SchemaField("date", "DATE", mode="REQUIRED", description="Meeting date"),
+    bigquery.SchemaField("participants", "STRING", mode="REPEATED", description="List of participants"),
+    bigquery.SchemaField("desk", "STRING", mode="NULLABLE", description="Business category"),
+    bigquery.SchemaField("source", "STRING", mode="REQUIRED", description="Source of transcript"),
+
+    # Enhanced client information as JSON. NULLABLE since Brief 4 —
+    # talent rows leave it NULL; the relax-client-required-columns
+    # migration relaxed this in production.
+    bigquery.SchemaField("client_info", "JSON", mode="NULLABLE", description="Client information as JSON blob"),
+
+    # Granola metadata fields
+    bigquery.SchemaField("granola_note_id", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("title", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("creator_name", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("creator_email", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("calendar_event_title", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("calendar_event_id", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("calendar_event_time", "TIMESTAMP", mode="NULLABLE"),
+    bigquery.SchemaField("granola_link", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("file_created_timestamp", "INTEGER", mode="NULLABLE"),
+    bigquery.SchemaField("zapier_step_id", "INTEGER", mode="NULLABLE"),
+
+    # Content sections
+    bigquery.SchemaField("enhanced_notes", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("my_notes", "STRING", mode="NULLABLE"),
+    bigquery.SchemaField("full_transcript", "STRING", mode="NULLABLE"),
+
+    # Client-domain scoring results. NULLABLE since Brief 4 — talent
+    # rows leave these NULL; the relax-client-required-columns
+    # migration relaxed them in production.
+    bigquery.SchemaField("total_qualified_sections", "INTEGER", mode="NULLABLE", description="Total qualified sections (0-5)"),
+    bigquery.SchemaField("qualified", "BOOLEAN", mode="NULLABLE", description="True if meets threshold"),
+
+    # JSON blob scoring sections (client-domain, NULLABLE on talent rows)
+    bigquery.SchemaField("now", "JSON", mode="NULLABLE", description="NOW scoring as JSON blob"),
+    bigquery.SchemaField("next", "JSON", mode="NULLABLE", description="NEXT scoring as JSON blob"),
+    bigquery.SchemaField("measure", "JSON", mode="NULLABLE", description="MEASURE scoring as JSON blob"),
+    bigquery.SchemaField("blocker", "JSON", mode="NULLABLE", description="BLOCKER scoring as JSON blob"),
+    bigquery.SchemaField("fit", "JSON", mode="NULLABLE", description="FIT scoring as JSON blob"),
+
+    # Client taxonomy tagging
+    bigquery.SchemaField("challenges", "STRING", mode="REPEATED", description="Client challenges from taxonomy"),
+    bigquery.SchemaField("results", "STRING", mode="REPEATED", description="Desired results from taxonomy"),
+    bigquery.SchemaField("offering", "STRING", mode="NULLABLE", description="Primary offering type from taxonomy"),
+
+    # Processing metadata
+    bigquery.SchemaField("scored_at", "TIMESTAMP", mode="REQUIRED"),
+    bigquery.SchemaField("llm_model", "STRING", mode="REQUIRED"),
+
+    # Salesperson Assessment Fields
+    bigquery.SchemaField("salesperson_name", "STRING", mode="NULLABLE", description="UNKNOWN rep name"),
+    bigquery.SchemaField("salesperson_email", "STRING", mode="NULLABLE", description="UNKNOWN rep email"),
+    bigquery.SchemaField("sales_total_score", "INTEGER", mode="NULLABLE", description="Total sales assessment score (0-24)"),
+    bigquery.SchemaField("sales_total_qualified", "INTEGER", mode="NULLABLE", description="Number of sales criteria qualified (0-8)"),
+    bigquery.SchemaField("sales_qualified", "BOOLEAN", mode="NULLABLE", description="True if sales assessment meets threshold"),
+    bigquery.SchemaField("sales_introduction", "JSON", mode="NULLABLE", description="Introduction & Framing assessment"),
+    bigquery.SchemaField("sales_discovery", "JSON", mode="NULLABLE", description="Discovery assessment"),
+    bigquery.SchemaField("sales_scoping", "JSON", mode="NULLABLE", description="Opportunity scoping assessment"),
+    bigquery.SchemaField("sales_solution", "JSON", mode="NULLABLE", description="Solution positioning assessment"),
+    bigquery.SchemaField("sales_commercial", "JSON", mode="NULLABLE", description="Commercial confidence assessment"),
+    bigquery.SchemaField("sales_case_studies", "JSON", mode="NULLABLE", description="Case studies assessment"),
+    bigquery.SchemaField("sales_next_steps", "JSON", mode="NULLABLE", description="Next steps assessment"),
+    bigquery.SchemaField("sales_strategic_context", "JSON", mode="NULLABLE", description="Strategic context assessment"),
+    bigquery.SchemaField("sales_strengths", "STRING", mode="REPEATED", description="Top strengths identified"),
+    bigquery.SchemaField("sales_improvements", "STRING", mode="REPEATED", description="Top improvement areas"),
+    bigquery.SchemaField("sales_overall_coaching", "STRING", mode="NULLABLE", description="Overall coaching note"),
+
+    # Routing — which scorer produced this row. Distinct from the
+    # top-level `source` (ingestion path) and from `client_info.domain`
+    # (client business sector). See scripts/migrate_bq_add_talent_columns.py
+    # for the full disambiguation.
+    bigquery.SchemaField("scoring_domain", "STRING", mode="NULLABLE", description="'client' or 'talent' — which scorer ran"),
+
+    # Talent-specific scoring buckets (populated by TalentScorer in a future PR; NULL on client rows)
+    bigquery.SchemaField("talent_now", "JSON", mode="NULLABLE", description="Role/seniority/company snapshot"),
+    bigquery.SchemaField("talent_triggers", "STRING", mode="REPEATED", description="Trigger phrases / signals"),
+    bigquery.SchemaField("talent_motivation", "JSON", mode="NULLABLE", description="Primary driver + description"),
+    bigquery.SchemaField("talent_market", "JSON", mode="NULLABLE", description="Comp, notice, openness, time-to-move"),
+    bigquery.SchemaField("talent_leads", "JSON", mode="NULLABLE", description="Companies mentioned + hiring signals"),
+    bigquery.SchemaField("talent_narrative", "STRING", mode="NULLABLE", description="Free-text talent narrative"),
+
+    # Per-client intelligence extensions (populated by TalentScorer for talent transcripts; empty on client rows)
+    bigquery.SchemaField("mentioned_companies", "JSON", mode="REPEATED", description="{name, type, sentiment, evidence_quote}"),
+    bigquery.SchemaField("perception_themes", "JSON", mode="REPEATED", description="{company_name, theme, polarity, evidence_quote}"),
+    bigquery.SchemaField("articulated_blockers", "JSON", mode="REPEATED", description="{company_name, category, evidence_quote}"),
+
+    # Article 9 special-category handling metadata (talent only; empty on client rows).
+    bigquery.SchemaField("article9_flags", "JSON", mode="REPEATED", description="{category, location, confidence, redacted, raw_scrub} — UK GDPR Art.9 detection/redaction metadata"),
+    bigquery.SchemaField("article9_status", "STRING", mode="NULLABLE", description="flag | redacted | redact_fallback — Art.9 row outcome. Default on non-convergence is DROP (not stored); redact_fallback only if on-failure=fallback (non-default)."),
+]
+
+
+# Columns each scoring domain owns in meeting_intel. A domain's MERGE never
+# writes the other domain's columns, so a talent re-score leaves the client
+# scoring on the row intact and vice versa (the "omit-from-SET" pattern from
+# Brief 4). Every other column is shared transcript metadata.
+_TALENT_ONLY_COLUMNS = frozenset({
+    "talent_now", "talent_triggers", "talent_motivation", "talent_market",
+    "talent_leads", "talent_narrative", "mentioned_companies",
+    "perception_themes", "articulated_blockers", "article9_flags", "article9_status",
+})
+_CLIENT_ONLY_COLUMNS = frozenset(
+    {"client_info", "total_qualified_sections", "qualified", "now", "next", "measure",
+     "blocker", "fit", "challenges", "results", "offering"}
+    | {field.name for field in _MEETING_INTEL_SCHEMA if field.name.startswith("sales")}
+)
+
+# Long-text columns a re-score without the text must not blank out
+_PRESERVED_TEXT_COLUMNS = frozenset({"enhanced_notes", "my_notes", "full_transcript"})
+
+
+def _merge_update_clause(excluded: frozenset) -> str:
+    """UPDATE SET assignments for a meeting_intel MERGE, in schema order."""
+    assignments = []
+    for field in _MEETING_INTEL_SCHEMA:
+        name = field.name
+        if name == "meeting_id" or name in excluded:
+            continue
+        if name in _PRESERVED_TEXT_COLUMNS:
+            assignments.append(f"{name} = COALESCE(source.{name}, target.{name})")
+        else:
+            assignments.append(f"{name} = source.{name}")
+    return ",\n                ".join(assignments)
+
+
+_CLIENT_MERGE_UPDATE = _merge_update_clause(_TALENT_ONLY_COLUMNS)
+_TALENT_MERGE_UPDATE = _merge_update_clause(_CLIENT_ONLY_COLUMNS)
+
+# Inserts name their columns. INSERT ROW pairs source and target columns by
+# position, which only holds while the staged rows carry the live table's
+# exact column order.
+_MERGE_INSERT_COLUMNS = ", ".join(field.name for field in _MEETING_INTEL_SCHEMA)
+_MERGE_INSERT = (
+    f"INSERT ({_MERGE_INSERT_COLUMNS})\n"
+    f"            VALUES ({', '.join(f'source.{field.name}' for field in _MEETING_INTEL_SCHEMA)})"
+)
+
+
+# Lifetime of a MERGE staging table from its last checkout. Instances drop
+# theirs at exit; the expiry is what clears up after one that was killed.
+STAGING_TABLE_TTL = timedelta(hours=float(os.getenv("BQ_STAGING_TABLE_TTL_HOURS", "24")))
+
+
+def _unique_suffix() -> str:
+    """Name suffix for temp tables and staged objects: sortable by time, and
+    unique across the concurrent MERGEs one API instance runs."""
+    return f"{int(time.time())}_{uuid.uuid4().hex[:12]}"
+
+
+class _StagedRows(NamedTuple):
+    """Where a MERGE reads its source rows from, and how to clean up after."""
+    sql_ref: str                                # goes after USING in the MERGE
+    job_config: Optional[bigquery.QueryJobConfig]
+    cleanup: Callable[[], None]
+
+
 class BigQueryLoader:
     """Handles loading transcript data to BigQuery"""
     
@@ -33,6 +201,26 @@ class BigQueryLoader:
         # Client mappings table
         self.mappings_table_name = os.getenv('BQ_MAPPINGS_TABLE', 'client_mappings')
 
+        # meeting_intel schema, resolved on first MERGE (see _new_table_schema)
+        self._new_schema: Optional[List[bigquery.SchemaField]] = None
+
+        # Optional GCS bucket for MERGE source rows (see _stage_merge_source)
+        self.staging_bucket = os.getenv('BQ_STAGING_BUCKET')
+        self._storage_client = None
+
+        # Staging tables for MERGE source rows, reused across MERGEs (see
+        # _stage_merge_source). Idle ones wait in the list; the dict holds
+        # every one this loader created with the expiry it was last given.
+        self._idle_staging_tables: List[str] = []
+        self._staging_tables: Dict[str, datetime] = {}
+        self._staging_lock = threading.Lock()
+        self._drop_registered = False
+
+        # Dataset/table ids already confirmed to exist by this loader. Every
+        # load, MERGE and mapping write starts with an existence check; after
+        # the first success it's answered here instead of by a get_* call.
+        self._known_to_exist: Set[str] = set()
+
         # Initialize BigQuery client - use default credentials on Cloud Run
         if self.credentials_path.exists():
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = str(self.credentials_path.absolute())
@@ -40,12 +228,22 @@ class BigQueryLoader:
         else:
             # Use default service account on Cloud Run
             self.client = bigquery.Client(project=self.project_id)
+
+        # The client's requests session already keeps connections alive, but
+        # its default pool holds only 10 per host. The API calls this loader
+        # from up to BQ_EXECUTOR_WORKERS threads at once; past 10, connections
+        # were dropped after each call and the next call paid a new TLS
+        # handshake. Size the pool to the threads that share it.
+        pool_size = int(os.getenv("BQ_HTTP_POOL_SIZE") or os.getenv("BQ_EXECUTOR_WORKERS") or "32")
+        self.client._http.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
         
         console.print(f"[green]Initialized BigQuery client for project: {self.project_id}[/green]")
     
     def create_dataset_if_not_exists(self) -> None:
         """Create dataset if it doesn't exist"""
         dataset_id = f"{self.project_id}.{self.dataset_name}"
+        if dataset_id in self._known_to_exist:
+            return
         
         try:
             self.client.get_dataset(dataset_id)
@@ -55,119 +253,39 @@ class BigQueryLoader:
             dataset.location = "US"
             dataset.description = "UNKNOWN Brain meeting transcript analysis data"
             
-            dataset = self.client.create_dataset(dataset, timeout=30)
+            # exists_ok: another instance may create it between our get and here
+            dataset = self.client.create_dataset(dataset, exists_ok=True, timeout=30)
             console.print(f"[green]Created dataset {self.dataset_name}[/green]")
+        self._known_to_exist.add(dataset_id)
 
     def create_new_table_if_not_exists(self) -> None:
         """Create the new meeting_intel table with JSON column types"""
         table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
+        if table_id in self._known_to_exist:
+            return
 
         try:
             self.client.get_table(table_id)
             console.print(f"[blue]Table {self.new_table_name} already exists[/blue]")
+            self._known_to_exist.add(table_id)
             return
         except NotFound:
             pass
 
-        # Define schema for the new table with JSON types
-        schema = [
-            bigquery.SchemaField("meeting_id", "STRING", mode="REQUIRED", description="Unique meeting identifier"),
-            bigquery.SchemaField("date", "DATE", mode="REQUIRED", description="Meeting date"),
-            bigquery.SchemaField("participants", "STRING", mode="REPEATED", description="List of participants"),
-            bigquery.SchemaField("desk", "STRING", mode="NULLABLE", description="Business category"),
-            bigquery.SchemaField("source", "STRING", mode="REQUIRED", description="Source of transcript"),
-
-            # Enhanced client information as JSON. NULLABLE since Brief 4 —
-            # talent rows leave it NULL; the relax-client-required-columns
-            # migration relaxed this in production.
-            bigquery.SchemaField("client_info", "JSON", mode="NULLABLE", description="Client information as JSON blob"),
-
-            # Granola metadata fields
-            bigquery.SchemaField("granola_note_id", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("title", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("creator_name", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("creator_email", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("calendar_event_title", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("calendar_event_id", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("calendar_event_time", "TIMESTAMP", mode="NULLABLE"),
-            bigquery.SchemaField("granola_link", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("file_created_timestamp", "INTEGER", mode="NULLABLE"),
-            bigquery.SchemaField("zapier_step_id", "INTEGER", mode="NULLABLE"),
-
-            # Content sections
-            bigquery.SchemaField("enhanced_notes", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("my_notes", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("full_transcript", "STRING", mode="NULLABLE"),
-
-            # Client-domain scoring results. NULLABLE since Brief 4 — talent
-            # rows leave these NULL; the relax-client-required-columns
-            # migration relaxed them in production.
-            bigquery.SchemaField("total_qualified_sections", "INTEGER", mode="NULLABLE", description="Total qualified sections (0-5)"),
-            bigquery.SchemaField("qualified", "BOOLEAN", mode="NULLABLE", description="True if meets threshold"),
-
-            # JSON blob scoring sections (client-domain, NULLABLE on talent rows)
-            bigquery.SchemaField("now", "JSON", mode="NULLABLE", description="NOW scoring as JSON blob"),
-            bigquery.SchemaField("next", "JSON", mode="NULLABLE", description="NEXT scoring as JSON blob"),
-            bigquery.SchemaField("measure", "JSON", mode="NULLABLE", description="MEASURE scoring as JSON blob"),
-            bigquery.SchemaField("blocker", "JSON", mode="NULLABLE", description="BLOCKER scoring as JSON blob"),
-            bigquery.SchemaField("fit", "JSON", mode="NULLABLE", description="FIT scoring as JSON blob"),
-
-            # Client taxonomy tagging
-            bigquery.SchemaField("challenges", "STRING", mode="REPEATED", description="Client challenges from taxonomy"),
-            bigquery.SchemaField("results", "STRING", mode="REPEATED", description="Desired results from taxonomy"),
-            bigquery.SchemaField("offering", "STRING", mode="NULLABLE", description="Primary offering type from taxonomy"),
-
-            # Processing metadata
-            bigquery.SchemaField("scored_at", "TIMESTAMP", mode="REQUIRED"),
-            bigquery.SchemaField("llm_model", "STRING", mode="REQUIRED"),
-
-            # Salesperson Assessment Fields
-            bigquery.SchemaField("salesperson_name", "STRING", mode="NULLABLE", description="UNKNOWN rep name"),
-            bigquery.SchemaField("salesperson_email", "STRING", mode="NULLABLE", description="UNKNOWN rep email"),
-            bigquery.SchemaField("sales_total_score", "INTEGER", mode="NULLABLE", description="Total sales assessment score (0-24)"),
-            bigquery.SchemaField("sales_total_qualified", "INTEGER", mode="NULLABLE", description="Number of sales criteria qualified (0-8)"),
-            bigquery.SchemaField("sales_qualified", "BOOLEAN", mode="NULLABLE", description="True if sales assessment meets threshold"),
-            bigquery.SchemaField("sales_introduction", "JSON", mode="NULLABLE", description="Introduction & Framing assessment"),
-            bigquery.SchemaField("sales_discovery", "JSON", mode="NULLABLE", description="Discovery assessment"),
-            bigquery.SchemaField("sales_scoping", "JSON", mode="NULLABLE", description="Opportunity scoping assessment"),
-            bigquery.SchemaField("sales_solution", "JSON", mode="NULLABLE", description="Solution positioning assessment"),
-            bigquery.SchemaField("sales_commercial", "JSON", mode="NULLABLE", description="Commercial confidence assessment"),
-            bigquery.SchemaField("sales_case_studies", "JSON", mode="NULLABLE", description="Case studies assessment"),
-            bigquery.SchemaField("sales_next_steps", "JSON", mode="NULLABLE", description="Next steps assessment"),
-            bigquery.SchemaField("sales_strategic_context", "JSON", mode="NULLABLE", description="Strategic context assessment"),
-            bigquery.SchemaField("sales_strengths", "STRING", mode="REPEATED", description="Top strengths identified"),
-            bigquery.SchemaField("sales_improvements", "STRING", mode="REPEATED", description="Top improvement areas"),
-            bigquery.SchemaField("sales_overall_coaching", "STRING", mode="NULLABLE", description="Overall coaching note"),
-
-            # Routing — which scorer produced this row. Distinct from the
-            # top-level `source` (ingestion path) and from `client_info.domain`
-            # (client business sector). See scripts/migrate_bq_add_talent_columns.py
-            # for the full disambiguation.
-            bigquery.SchemaField("scoring_domain", "STRING", mode="NULLABLE", description="'client' or 'talent' — which scorer ran"),
-
-            # Talent-specific scoring buckets (populated by TalentScorer in a future PR; NULL on client rows)
-            bigquery.SchemaField("talent_now", "JSON", mode="NULLABLE", description="Role/seniority/company snapshot"),
-            bigquery.SchemaField("talent_triggers", "STRING", mode="REPEATED", description="Trigger phrases / signals"),
-            bigquery.SchemaField("talent_motivation", "JSON", mode="NULLABLE", description="Primary driver + description"),
-            bigquery.SchemaField("talent_market", "JSON", mode="NULLABLE", description="Comp, notice, openness, time-to-move"),
-            bigquery.SchemaField("talent_leads", "JSON", mode="NULLABLE", description="Companies mentioned + hiring signals"),
-            bigquery.SchemaField("talent_narrative", "STRING", mode="NULLABLE", description="Free-text talent narrative"),
-
-            # Per-client intelligence extensions (populated by TalentScorer for talent transcripts; empty on client rows)
-            bigquery.SchemaField("mentioned_companies", "JSON", mode="REPEATED", description="{name, type, sentiment, evidence_quote}"),
-            bigquery.SchemaField("perception_themes", "JSON", mode="REPEATED", description="{company_name, theme, polarity, evidence_quote}"),
-            bigquery.SchemaField("articulated_blockers", "JSON", mode="REPEATED", description="{company_name, category, evidence_quote}"),
-
-            # Article 9 special-category handling metadata (talent only; empty on client rows).
-            bigquery.SchemaField("article9_flags", "JSON", mode="REPEATED", description="{category, location, confidence, redacted, raw_scrub} — UK GDPR Art.9 detection/redaction metadata"),
-            bigquery.SchemaField("article9_status", "STRING", mode="NULLABLE", description="flag | redacted | redact_fallback — Art.9 row outcome. Default on non-convergence is DROP (not stored); redact_fallback only if on-failure=fallback (non-default)."),
-        ]
-
-        table = bigquery.Table(table_id, schema=schema)
+        table = bigquery.Table(table_id, schema=_MEETING_INTEL_SCHEMA)
         table.description = "UNKNOWN Brain meeting intelligence with opportunity and sales assessment scoring"
+        # Dashboards and the health check filter on date; the MERGE joins and
+        # dedup partitions on meeting_id, so clustered blocks can be skipped.
+        # scripts/migrate_cluster_meeting_intel.py applies the clustering to
+        # a table created before this (partitioning can't be added in place).
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.DAY, field="date"
+        )
+        table.clustering_fields = ["meeting_id"]
 
-        table = self.client.create_table(table, timeout=30)
-        console.print(f"[green]Created table {self.new_table_name} with {len(schema)} columns (including sales assessment)[/green]")
+        table = self.client.create_table(table, exists_ok=True, timeout=30)
+        console.print(f"[green]Created table {self.new_table_name} with {len(_MEETING_INTEL_SCHEMA)} columns (including sales assessment)[/green]")
+        self._known_to_exist.add(table_id)
     
     def merge_jsonl_data(self, jsonl_path: Path) -> int:
         """
@@ -187,7 +305,7 @@ class BigQueryLoader:
         self.create_dataset_if_not_exists()
         
         # Load data into temporary table first
-        temp_table_id = f"{self.project_id}.{self.dataset_name}.temp_upload_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+        temp_table_id = f"{self.project_id}.{self.dataset_name}.temp_upload_{_unique_suffix()}"
         target_table_id = f"{self.project_id}.{self.dataset_name}.{self.table_name}"
         
         job_config = bigquery.LoadJobConfig(
@@ -199,12 +317,7 @@ class BigQueryLoader:
         console.print(f"[blue]Loading data to temporary table: {temp_table_id}[/blue]")
         
         # Load to temp table
-        with open(jsonl_path, "rb") as source_file:
-            job = self.client.load_table_from_file(
-                source_file, 
-                temp_table_id, 
-                job_config=job_config
-            )
+        job = self._start_jsonl_load(jsonl_path, temp_table_id, job_config)
         
         console.print("[yellow]Uploading to temporary table...[/yellow]")
         job.result()  # Wait for completion
@@ -264,30 +377,60 @@ class BigQueryLoader:
         
         return inserted_rows + updated_rows
 
-    def _load_to_temp_table(self, jsonl_path: Path) -> Optional[str]:
+    def _start_jsonl_load(
+        self, jsonl: Union[Path, bytes], table_id: str, job_config: bigquery.LoadJobConfig
+    ) -> bigquery.LoadJob:
         """
-        Shared helper for merge_*_jsonl_data — load a JSONL into a fresh
-        temp table using the target table's schema (no autodetect). Returns
-        the fully-qualified temp table id, or None on failure.
+        Start a load job from a JSONL path or JSONL bytes.
+
+        Passing the size up front lets the client send anything under 5 MB
+        (every API write) as one multipart request instead of opening a
+        resumable session first. Bigger files still take the resumable path,
+        which streams them in 100 MB chunks rather than holding them whole.
+
+        In-memory rows go up gzipped (BigQuery detects the compression on
+        load): the repeated keys and JSON section blobs shrink several-fold.
+        Files are sent as they are, since BigQuery can split an uncompressed
+        file across workers but has to read a gzipped one serially.
         """
-        self.create_dataset_if_not_exists()
-        self.create_new_table_if_not_exists()
+        if isinstance(jsonl, bytes):
+            payload = gzip.compress(jsonl, compresslevel=6)
+            return self.client.load_table_from_file(
+                io.BytesIO(payload), table_id, size=len(payload), job_config=job_config
+            )
+        with open(jsonl, "rb") as source_file:
+            return self.client.load_table_from_file(
+                source_file, table_id, size=os.fstat(source_file.fileno()).st_size, job_config=job_config
+            )
 
-        target_table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
-        temp_table_id = (
-            f"{self.project_id}.{self.dataset_name}.temp_upload_{int(time.time())}_{uuid.uuid4().hex[:8]}"
-        )
+    def _load_to_temp_table(
+        self, jsonl: Union[Path, bytes], temp_table_id: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Shared helper for merge_*_jsonl_data — load a JSONL file, or JSONL
+        bytes already in memory, into a temp table using the target table's
+        schema (no autodetect), replacing whatever it held. Loads into a
+        fresh temp_upload_* table unless temp_table_id is given. Returns the
+        fully-qualified temp table id, or None on failure.
+        """
+        # A given table was created by the caller, with an expiry a load
+        # creating it would leave off; fail rather than recreate it bare
+        create_disposition = "CREATE_NEVER" if temp_table_id is not None else "CREATE_IF_NEEDED"
+        if temp_table_id is None:
+            temp_table_id = (
+                f"{self.project_id}.{self.dataset_name}.temp_upload_{_unique_suffix()}"
+            )
 
         job_config = bigquery.LoadJobConfig(
             source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
             autodetect=False,
             write_disposition="WRITE_TRUNCATE",
-            schema=self.client.get_table(target_table_id).schema,
+            create_disposition=create_disposition,
+            schema=self._new_table_schema(),
         )
 
         console.print(f"[blue]Loading data to temporary table: {temp_table_id}[/blue]")
-        with open(jsonl_path, "rb") as source_file:
-            job = self.client.load_table_from_file(source_file, temp_table_id, job_config=job_config)
+        job = self._start_jsonl_load(jsonl, temp_table_id, job_config)
 
         console.print("[yellow]Uploading to temporary table...[/yellow]")
         job.result()
@@ -297,12 +440,136 @@ class BigQueryLoader:
             return None
         return temp_table_id
 
-    def _run_merge_and_cleanup(self, merge_query: str, temp_table_id: str) -> int:
-        """Execute MERGE, drop the temp table, return inserted+updated count."""
+    def _stage_merge_source(self, jsonl: Union[Path, bytes]) -> Optional[_StagedRows]:
+        """
+        Make JSONL rows readable by a MERGE, or return None on failure.
+
+        Default: a WRITE_TRUNCATE load job into a staging table checked out
+        for this MERGE and handed back afterwards. The next MERGE's load
+        overwrites it, so a warm loader no longer creates and deletes a
+        table per upsert; concurrent MERGEs each get their own. Staging
+        tables carry an expiry (STAGING_TABLE_TTL) so ones stranded by a
+        killed instance still go away.
+
+        With BQ_STAGING_BUCKET set, the JSONL is written to that bucket
+        instead and the MERGE reads it as an external table defined on the
+        query itself, so the temp table is never materialised and there is
+        one BigQuery job per upsert rather than two. The object is deleted
+        after the MERGE; give the bucket a lifecycle rule as a backstop.
+        """
+        if not self.staging_bucket:
+            staging_table_id = self._checkout_staging_table()
+            try:
+                loaded = self._load_to_temp_table(jsonl, staging_table_id)
+            except Exception:
+                self._return_staging_table(staging_table_id)
+                raise
+            if loaded is None:
+                self._return_staging_table(staging_table_id)
+                return None
+            return _StagedRows(
+                f"`{staging_table_id}`", None, lambda: self._return_staging_table(staging_table_id)
+            )
+
+        if self._storage_client is None:
+            from google.cloud import storage
+            self._storage_client = storage.Client(project=self.project_id)
+        blob = self._storage_client.bucket(self.staging_bucket).blob(
+            f"bq-staging/{_unique_suffix()}.jsonl.gz"
+        )
+        data = jsonl if isinstance(jsonl, bytes) else Path(jsonl).read_bytes()
+        console.print(f"[blue]Staging rows at gs://{self.staging_bucket}/{blob.name}[/blue]")
+        blob.upload_from_string(gzip.compress(data, compresslevel=6), content_type="application/gzip")
+
+        external = bigquery.ExternalConfig("NEWLINE_DELIMITED_JSON")
+        external.compression = "GZIP"
+        external.source_uris = [f"gs://{self.staging_bucket}/{blob.name}"]
+        external.schema = self._new_table_schema()
+        job_config = bigquery.QueryJobConfig(table_definitions={"staged_rows": external})
+        return _StagedRows("staged_rows", job_config, blob.delete)
+
+    def _checkout_staging_table(self) -> str:
+        """
+        An idle staging table id, or a newly created one. Either way the table
+        exists and expires no sooner than half of STAGING_TABLE_TTL from now.
+        """
+        with self._staging_lock:
+            if self._idle_staging_tables:
+                staging_table_id = self._idle_staging_tables.pop()
+                expires = self._staging_tables[staging_table_id]
+            else:
+                staging_table_id = f"{self.project_id}.{self.dataset_name}.merge_staging_{_unique_suffix()}"
+                expires = None
+                if not self._drop_registered:
+                    # API instance, CLI run or script alike, drop them on the way out
+                    atexit.register(self.drop_staging_tables)
+                    self._drop_registered = True
+
+        now = datetime.now(timezone.utc)
+        if expires is not None and expires - now > STAGING_TABLE_TTL / 2:
+            return staging_table_id
+
+        # New, or due a refresh: one metadata call per table per half-TTL
+        table = bigquery.Table(staging_table_id, schema=self._new_table_schema())
+        table.expires = now + STAGING_TABLE_TTL
+        try:
+            if expires is None:
+                raise NotFound(staging_table_id)
+            self.client.update_table(table, ["expires"])
+        except NotFound:
+            # Brand new, or idle long enough to have expired already
+            self.client.create_table(table, exists_ok=True)
+        with self._staging_lock:
+            self._staging_tables[staging_table_id] = table.expires
+        return staging_table_id
+
+    def _return_staging_table(self, staging_table_id: str) -> None:
+        with self._staging_lock:
+            self._idle_staging_tables.append(staging_table_id)
+
+    def drop_staging_tables(self) -> None:
+        """Delete every MERGE staging table this loader created (run at exit)."""
+        with self._staging_lock:
+            staging_table_ids = list(self._staging_tables)
+            self._staging_tables.clear()
+            self._idle_staging_tables.clear()
+        for staging_table_id in staging_table_ids:
+            self.client.delete_table(staging_table_id, not_found_ok=True)
+        if staging_table_ids:
+            console.print(f"[blue]Dropped {len(staging_table_ids)} staging tables[/blue]")
+
+    def _new_table_schema(self) -> List[bigquery.SchemaField]:
+        """
+        meeting_intel's schema, ensuring the dataset and table exist first.
+
+        Cached on the loader: the API MERGEs on every scored transcript, and
+        re-checking the dataset/table and re-fetching the schema each time
+        cost three metadata round trips per write. A schema migration is
+        picked up by the next process (deploys restart the service).
+        """
+        if self._new_schema is None:
+            self.create_dataset_if_not_exists()
+            self.create_new_table_if_not_exists()
+            target_table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
+            self._new_schema = self.client.get_table(target_table_id).schema
+        return self._new_schema
+
+    def _run_merge_and_cleanup(self, merge_query: str, staged: _StagedRows) -> int:
+        """
+        Execute MERGE, drop the staged rows, return inserted+updated count.
+
+        Doesn't re-read the target table for a row total: that was another
+        metadata round trip on every API write, and callers that want the
+        total ask for it (display_new_table_status / show_status).
+        """
         target_table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
-        console.print(f"[blue]Merging data from temp table to {target_table_id}[/blue]")
-        merge_job = self.client.query(merge_query)
-        merge_job.result()
+        console.print(f"[blue]Merging data from {staged.sql_ref} to {target_table_id}[/blue]")
+        try:
+            merge_job = self.client.query(merge_query, job_config=staged.job_config)
+            merge_job.result()
+        finally:
+            staged.cleanup()
+            console.print("[blue]Cleaned up staged rows[/blue]")
 
         stats = merge_job._properties.get("statistics", {}).get("query", {})
         dml_stats = stats.get("dmlStats", {})
@@ -310,14 +577,9 @@ class BigQueryLoader:
         updated_rows = int(dml_stats.get("updatedRowCount", 0))
         console.print(f"[green]MERGE completed: {inserted_rows} inserted, {updated_rows} updated[/green]")
 
-        self.client.delete_table(temp_table_id)
-        console.print("[blue]Cleaned up temporary table[/blue]")
-
-        final_table = self.client.get_table(target_table_id)
-        console.print(f"[blue]Total table rows: {final_table.num_rows}[/blue]")
         return inserted_rows + updated_rows
 
-    def merge_client_jsonl_data(self, jsonl_path: Path) -> int:
+    def merge_client_jsonl_data(self, jsonl_path: Union[Path, bytes]) -> int:
         """
         Merge JSONL data into meeting_intel for the CLIENT scoring domain.
 
@@ -326,77 +588,33 @@ class BigQueryLoader:
         mentioned_companies, perception_themes, articulated_blockers) are
         NOT touched — they stay SQL NULL on new rows and unchanged on
         re-scored ones. This is the "omit-from-SET" pattern from Brief 4.
+
+        `jsonl_path` may also be the JSONL content as bytes, which is loaded
+        straight from memory (the API's one-row-per-request path).
         """
-        if not jsonl_path.exists():
+        if isinstance(jsonl_path, Path) and not jsonl_path.exists():
             console.print(f"[red]JSONL file not found: {jsonl_path}[/red]")
             return 0
 
-        temp_table_id = self._load_to_temp_table(jsonl_path)
-        if temp_table_id is None:
+        staged = self._stage_merge_source(jsonl_path)
+        if staged is None:
             return 0
         target_table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
 
         merge_query = f"""
         MERGE `{target_table_id}` AS target
-        USING `{temp_table_id}` AS source
+        USING {staged.sql_ref} AS source
         ON target.meeting_id = source.meeting_id
         WHEN MATCHED THEN
             UPDATE SET
-                date = source.date,
-                participants = source.participants,
-                desk = source.desk,
-                source = source.source,
-                client_info = source.client_info,
-                granola_note_id = source.granola_note_id,
-                title = source.title,
-                creator_name = source.creator_name,
-                creator_email = source.creator_email,
-                calendar_event_title = source.calendar_event_title,
-                calendar_event_id = source.calendar_event_id,
-                calendar_event_time = source.calendar_event_time,
-                granola_link = source.granola_link,
-                file_created_timestamp = source.file_created_timestamp,
-                zapier_step_id = source.zapier_step_id,
-                -- Preserve existing text fields if source is NULL to prevent data loss
-                enhanced_notes = COALESCE(source.enhanced_notes, target.enhanced_notes),
-                my_notes = COALESCE(source.my_notes, target.my_notes),
-                full_transcript = COALESCE(source.full_transcript, target.full_transcript),
-                total_qualified_sections = source.total_qualified_sections,
-                qualified = source.qualified,
-                now = source.now,
-                next = source.next,
-                measure = source.measure,
-                blocker = source.blocker,
-                fit = source.fit,
-                challenges = source.challenges,
-                results = source.results,
-                offering = source.offering,
-                scored_at = source.scored_at,
-                llm_model = source.llm_model,
-                salesperson_name = source.salesperson_name,
-                salesperson_email = source.salesperson_email,
-                sales_total_score = source.sales_total_score,
-                sales_total_qualified = source.sales_total_qualified,
-                sales_qualified = source.sales_qualified,
-                sales_introduction = source.sales_introduction,
-                sales_discovery = source.sales_discovery,
-                sales_scoping = source.sales_scoping,
-                sales_solution = source.sales_solution,
-                sales_commercial = source.sales_commercial,
-                sales_case_studies = source.sales_case_studies,
-                sales_next_steps = source.sales_next_steps,
-                sales_strategic_context = source.sales_strategic_context,
-                sales_strengths = source.sales_strengths,
-                sales_improvements = source.sales_improvements,
-                sales_overall_coaching = source.sales_overall_coaching,
-                scoring_domain = source.scoring_domain
+                {_CLIENT_MERGE_UPDATE}
         WHEN NOT MATCHED THEN
-            INSERT ROW
+            {_MERGE_INSERT}
         """
 
-        return self._run_merge_and_cleanup(merge_query, temp_table_id)
+        return self._run_merge_and_cleanup(merge_query, staged)
 
-    def merge_talent_jsonl_data(self, jsonl_path: Path) -> int:
+    def merge_talent_jsonl_data(self, jsonl_path: Union[Path, bytes]) -> int:
         """
         Merge JSONL data into meeting_intel for the TALENT scoring domain.
 
@@ -407,58 +625,30 @@ class BigQueryLoader:
         columns (client_info, total_qualified_sections, qualified,
         now/next/measure/blocker/fit, taxonomy, sales_*) are NOT touched —
         they stay SQL NULL on new talent rows.
+
+        Like merge_client_jsonl_data, accepts a path or JSONL bytes.
         """
-        if not jsonl_path.exists():
+        if isinstance(jsonl_path, Path) and not jsonl_path.exists():
             console.print(f"[red]JSONL file not found: {jsonl_path}[/red]")
             return 0
 
-        temp_table_id = self._load_to_temp_table(jsonl_path)
-        if temp_table_id is None:
+        staged = self._stage_merge_source(jsonl_path)
+        if staged is None:
             return 0
         target_table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
 
         merge_query = f"""
         MERGE `{target_table_id}` AS target
-        USING `{temp_table_id}` AS source
+        USING {staged.sql_ref} AS source
         ON target.meeting_id = source.meeting_id
         WHEN MATCHED THEN
             UPDATE SET
-                date = source.date,
-                participants = source.participants,
-                desk = source.desk,
-                source = source.source,
-                granola_note_id = source.granola_note_id,
-                title = source.title,
-                creator_name = source.creator_name,
-                creator_email = source.creator_email,
-                calendar_event_title = source.calendar_event_title,
-                calendar_event_id = source.calendar_event_id,
-                calendar_event_time = source.calendar_event_time,
-                granola_link = source.granola_link,
-                file_created_timestamp = source.file_created_timestamp,
-                zapier_step_id = source.zapier_step_id,
-                enhanced_notes = COALESCE(source.enhanced_notes, target.enhanced_notes),
-                my_notes = COALESCE(source.my_notes, target.my_notes),
-                full_transcript = COALESCE(source.full_transcript, target.full_transcript),
-                scored_at = source.scored_at,
-                llm_model = source.llm_model,
-                scoring_domain = source.scoring_domain,
-                talent_now = source.talent_now,
-                talent_triggers = source.talent_triggers,
-                talent_motivation = source.talent_motivation,
-                talent_market = source.talent_market,
-                talent_leads = source.talent_leads,
-                talent_narrative = source.talent_narrative,
-                mentioned_companies = source.mentioned_companies,
-                perception_themes = source.perception_themes,
-                articulated_blockers = source.articulated_blockers,
-                article9_flags = source.article9_flags,
-                article9_status = source.article9_status
+                {_TALENT_MERGE_UPDATE}
         WHEN NOT MATCHED THEN
-            INSERT ROW
+            {_MERGE_INSERT}
         """
 
-        return self._run_merge_and_cleanup(merge_query, temp_table_id)
+        return self._run_merge_and_cleanup(merge_query, staged)
 
     # Backward-compat alias — keeps existing callers (src/cli.py) working
     # without forcing every caller to learn the scoring_domain split.
@@ -496,12 +686,7 @@ class BigQueryLoader:
         console.print(f"[blue]Loading data from {jsonl_path} to {table_id}[/blue]")
         
         # Load data
-        with open(jsonl_path, "rb") as source_file:
-            job = self.client.load_table_from_file(
-                source_file, 
-                table_id, 
-                job_config=job_config
-            )
+        job = self._start_jsonl_load(jsonl_path, table_id, job_config)
         
         # Wait for job to complete
         console.print("[yellow]Uploading data to BigQuery...[/yellow]")
@@ -519,18 +704,19 @@ class BigQueryLoader:
         
         return job.output_rows
 
-    def load_new_jsonl_data(self, jsonl_path: Path, write_disposition: str = "WRITE_APPEND") -> int:
+    def load_new_jsonl_data(self, jsonl_path: Union[Path, bytes], write_disposition: str = "WRITE_APPEND") -> int:
         """
         Load JSONL data to new meeting_intel BigQuery table
 
         Args:
-            jsonl_path: Path to JSONL file with NewScoredTranscript format
+            jsonl_path: Path to JSONL file with NewScoredTranscript format,
+                or the JSONL content as bytes
             write_disposition: How to handle existing data
 
         Returns:
             Number of rows loaded
         """
-        if not jsonl_path.exists():
+        if not isinstance(jsonl_path, bytes) and not jsonl_path.exists():
             console.print(f"[red]JSONL file not found: {jsonl_path}[/red]")
             return 0
 
@@ -547,15 +733,10 @@ class BigQueryLoader:
             write_disposition=write_disposition,
         )
 
-        console.print(f"[blue]Loading data from {jsonl_path} to {table_id}[/blue]")
-
         # Load data
-        with open(jsonl_path, "rb") as source_file:
-            job = self.client.load_table_from_file(
-                source_file,
-                table_id,
-                job_config=job_config
-            )
+        source = "in-memory JSONL" if isinstance(jsonl_path, bytes) else jsonl_path
+        console.print(f"[blue]Loading data from {source} to {table_id}[/blue]")
+        job = self._start_jsonl_load(jsonl_path, table_id, job_config)
 
         # Wait for job to complete
         console.print("[yellow]Uploading data to BigQuery...[/yellow]")
@@ -580,66 +761,7 @@ class BigQueryLoader:
         Returns:
             Number of duplicate rows removed
         """
-        table_id = f"{self.project_id}.{self.dataset_name}.{self.table_name}"
-        
-        # First, count duplicates
-        count_query = f"""
-        SELECT 
-            COUNT(*) - COUNT(DISTINCT meeting_id) as duplicate_count
-        FROM `{table_id}`
-        """
-        
-        count_result = self.client.query(count_query).result()
-        duplicate_count = list(count_result)[0][0]
-        
-        if duplicate_count == 0:
-            console.print("[green]No duplicates found[/green]")
-            return 0
-        
-        console.print(f"[yellow]Found {duplicate_count} duplicate rows to remove[/yellow]")
-        
-        # Create temp table with deduplicated data
-        temp_table_id = f"{self.project_id}.{self.dataset_name}.temp_dedup_{int(time.time())}_{uuid.uuid4().hex[:8]}"
-        
-        dedup_query = f"""
-        CREATE TABLE `{temp_table_id}` AS
-        SELECT * EXCEPT(row_num)
-        FROM (
-            SELECT *,
-                ROW_NUMBER() OVER (
-                    PARTITION BY meeting_id 
-                    ORDER BY scored_at DESC
-                ) as row_num
-            FROM `{table_id}`
-        )
-        WHERE row_num = 1
-        """
-        
-        console.print(f"[blue]Creating deduplicated temp table: {temp_table_id}[/blue]")
-        dedup_job = self.client.query(dedup_query)
-        dedup_job.result()
-        
-        # Replace original table with deduplicated data
-        console.print(f"[yellow]Replacing {table_id} with deduplicated data[/yellow]")
-        
-        # Copy data back to original table
-        replace_query = f"""
-        CREATE OR REPLACE TABLE `{table_id}` AS
-        SELECT * FROM `{temp_table_id}`
-        """
-        
-        replace_job = self.client.query(replace_query)
-        replace_job.result()
-        
-        # Clean up temp table
-        self.client.delete_table(temp_table_id)
-        
-        # Verify final state
-        final_table = self.client.get_table(table_id)
-        console.print(f"[green]Deduplication complete. Removed {duplicate_count} duplicates[/green]")
-        console.print(f"[blue]Final table rows: {final_table.num_rows}[/blue]")
-        
-        return duplicate_count
+        return self._deduplicate(f"{self.project_id}.{self.dataset_name}.{self.table_name}")
 
     def deduplicate_new_table(self) -> int:
         """
@@ -648,66 +770,94 @@ class BigQueryLoader:
         Returns:
             Number of duplicate rows removed
         """
-        table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
-
-        # First, count duplicates
-        count_query = f"""
+        return self._deduplicate(f"{self.project_id}.{self.dataset_name}.{self.new_table_name}")
+
+    def _deduplicate(self, table_id: str) -> int:
+        """Delete all but the latest-scored row per meeting_id from table_id"""
+        # One read-only pass over meeting_id and scored_at decides what, if
+        # anything, to run; a clean table costs that probe and nothing else.
+        # tied_rows counts surplus rows the in-place DELETE can't remove:
+        # copies sharing the newest scored_at (e.g. the same JSONL appended
+        # twice), or with no scored_at to compare.
+        probe_query = f"""
         SELECT
-            COUNT(*) - COUNT(DISTINCT meeting_id) as duplicate_count
-        FROM `{table_id}`
+            COUNT(*) AS extra_rows,
+            COUNTIF(NOT COALESCE(scored_at < newest, FALSE)) AS tied_rows
+        FROM (
+            SELECT scored_at, MAX(scored_at) OVER (PARTITION BY meeting_id) AS newest
+            FROM `{table_id}`
+            WHERE TRUE
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY meeting_id
+                ORDER BY scored_at DESC
+            ) > 1
+        )
         """
+        probe = next(iter(self.client.query_and_wait(probe_query)))
+        extra_rows = probe["extra_rows"] or 0
 
-        count_result = self.client.query(count_query).result()
-        duplicate_count = list(count_result)[0][0]
-
-        if duplicate_count == 0:
+        if extra_rows == 0:
             console.print("[green]No duplicates found[/green]")
             return 0
 
-        console.print(f"[yellow]Found {duplicate_count} duplicate rows to remove[/yellow]")
-
-        # Create temp table with deduplicated data
-        temp_table_id = f"{self.project_id}.{self.dataset_name}.temp_dedup_{int(time.time())}_{uuid.uuid4().hex[:8]}"
-
-        dedup_query = f"""
-        CREATE TABLE `{temp_table_id}` AS
-        SELECT * EXCEPT(row_num)
-        FROM (
-            SELECT *,
-                ROW_NUMBER() OVER (
+        if probe["tied_rows"]:
+            # Only a rebuild can keep one of several identical rows
+            self._rewrite_deduplicated(table_id)
+            removed = extra_rows
+        else:
+            # Matching on (meeting_id, scored_at) is safe here: no surplus
+            # row shares its meeting's newest scored_at
+            delete_query = f"""
+            DELETE FROM `{table_id}`
+            WHERE STRUCT(meeting_id, scored_at) IN (
+                SELECT AS STRUCT meeting_id, scored_at
+                FROM `{table_id}`
+                WHERE TRUE
+                QUALIFY ROW_NUMBER() OVER (
                     PARTITION BY meeting_id
                     ORDER BY scored_at DESC
-                ) as row_num
-            FROM `{table_id}`
-        )
-        WHERE row_num = 1
-        """
+                ) > 1
+            )
+            """
+            delete_job = self.client.query(delete_query)
+            delete_job.result()
+            removed = delete_job.num_dml_affected_rows or 0
 
-        console.print(f"[blue]Creating deduplicated temp table: {temp_table_id}[/blue]")
-        dedup_job = self.client.query(dedup_query)
-        dedup_job.result()
+        console.print(f"[green]Deduplication complete. Removed {removed} duplicates[/green]")
+        return removed
 
-        # Replace original table with deduplicated data
-        console.print(f"[yellow]Replacing {table_id} with deduplicated data[/yellow]")
+    def _rewrite_deduplicated(self, table_id: str) -> None:
+        """
+        Rebuild table_id with one row per meeting_id, keeping its partitioning
+        and clustering.
+        """
+        table = self.client.get_table(table_id)
+        layout = ""
+        partitioning = table.time_partitioning
+        if partitioning is not None and partitioning.field:
+            field_type = next(f.field_type for f in table.schema if f.name == partitioning.field)
+            grain = partitioning.type_ or "DAY"
+            if field_type == "DATE":
+                expr = partitioning.field if grain == "DAY" else f"DATE_TRUNC({partitioning.field}, {grain})"
+            else:
+                expr = f"{field_type}_TRUNC({partitioning.field}, {grain})"
+            layout += f"PARTITION BY {expr}\n        "
+        if table.clustering_fields:
+            layout += f"CLUSTER BY {', '.join(table.clustering_fields)}\n        "
 
-        # Copy data back to original table
+        console.print(f"[yellow]Exact duplicate rows found, rewriting {table_id}[/yellow]")
         replace_query = f"""
-        CREATE OR REPLACE TABLE `{table_id}` AS
-        SELECT * FROM `{temp_table_id}`
+        CREATE OR REPLACE TABLE `{table_id}`
+        {layout}AS
+        SELECT *
+        FROM `{table_id}`
+        WHERE TRUE
+        QUALIFY ROW_NUMBER() OVER (
+            PARTITION BY meeting_id
+            ORDER BY scored_at DESC
+        ) = 1
         """
-
-        replace_job = self.client.query(replace_query)
-        replace_job.result()
-
-        # Clean up temp table
-        self.client.delete_table(temp_table_id)
-
-        # Verify final state
-        final_table = self.client.get_table(table_id)
-        console.print(f"[green]Deduplication complete. Removed {duplicate_count} duplicates[/green]")
-        console.print(f"[blue]Final table rows: {final_table.num_rows}[/blue]")
-
-        return duplicate_count
+        self.client.query(replace_query).result()
     
     def get_new_table_info(self) -> Optional[Dict[str, Any]]:
         """Get information about the new meeting_intel table"""
@@ -747,6 +897,12 @@ class BigQueryLoader:
         except NotFound:
             return None
     
+    @staticmethod
+    def _limit_config(limit: int) -> bigquery.QueryJobConfig:
+        return bigquery.QueryJobConfig(
+            query_parameters=[bigquery.ScalarQueryParameter("limit", "INT64", limit)]
+        )
+
     def query_recent_uploads(self, limit: int = 5) -> List[Dict[str, Any]]:
         """Query recent uploads to verify data"""
         table_id = f"{self.project_id}.{self.dataset_name}.{self.table_name}"
@@ -763,12 +919,14 @@ class BigQueryLoader:
             source
         FROM `{table_id}`
         ORDER BY scored_at DESC
-        LIMIT {limit}
+        LIMIT @limit
         """
         
         try:
-            query_job = self.client.query(query)
-            results = query_job.result()
+            # query_and_wait runs jobs.query once and gets the few rows back in
+            # that response, skipping the separate job poll and results fetch.
+            # LIMIT is a parameter so the SQL text is the same on every call.
+            results = self.client.query_and_wait(query, job_config=self._limit_config(limit))
             
             return [dict(row) for row in results]
         except Exception as e:
@@ -791,12 +949,11 @@ class BigQueryLoader:
             source
         FROM `{table_id}`
         ORDER BY scored_at DESC
-        LIMIT {limit}
+        LIMIT @limit
         """
 
         try:
-            query_job = self.client.query(query)
-            results = query_job.result()
+            results = self.client.query_and_wait(query, job_config=self._limit_config(limit))
 
             return [dict(row) for row in results]
         except Exception as e:
@@ -892,10 +1049,13 @@ class BigQueryLoader:
     def create_mappings_table_if_not_exists(self) -> None:
         """Create client_mappings table if it doesn't exist"""
         table_id = f"{self.project_id}.{self.dataset_name}.{self.mappings_table_name}"
+        if table_id in self._known_to_exist:
+            return
 
         try:
             self.client.get_table(table_id)
             console.print(f"[blue]Mappings table {self.mappings_table_name} already exists[/blue]")
+            self._known_to_exist.add(table_id)
             return
         except NotFound:
             pass
@@ -912,8 +1072,9 @@ class BigQueryLoader:
         table = bigquery.Table(table_id, schema=schema)
         table.description = "Client name variant to canonical name mappings"
 
-        table = self.client.create_table(table, timeout=30)
+        table = self.client.create_table(table, exists_ok=True, timeout=30)
         console.print(f"[green]Created mappings table {self.mappings_table_name}[/green]")
+        self._known_to_exist.add(table_id)
 
     def load_client_mappings(self) -> Dict[str, str]:
         """
@@ -961,17 +1122,12 @@ class BigQueryLoader:
 
         table_id = f"{self.project_id}.{self.dataset_name}.{self.mappings_table_name}"
 
-        # Escape single quotes for SQL
-        variant_escaped = variant_name.replace("'", "\\'")
-        canonical_escaped = canonical_name.replace("'", "\\'")
-        notes_sql = f"'{notes.replace(chr(39), chr(92)+chr(39))}'" if notes else "CAST(NULL AS STRING)"
-
         merge_query = f"""
         MERGE `{table_id}` AS target
         USING (SELECT
-            '{variant_escaped}' AS variant_name,
-            '{canonical_escaped}' AS canonical_name,
-            {notes_sql} AS notes,
+            @variant_name AS variant_name,
+            @canonical_name AS canonical_name,
+            @notes AS notes,
             CURRENT_TIMESTAMP() AS updated_at
         ) AS source
         ON target.variant_name = source.variant_name
@@ -986,7 +1142,12 @@ class BigQueryLoader:
         """
 
         try:
-            self.client.query(merge_query).result()
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                bigquery.ScalarQueryParameter("variant_name", "STRING", variant_name),
+                bigquery.ScalarQueryParameter("canonical_name", "STRING", canonical_name),
+                bigquery.ScalarQueryParameter("notes", "STRING", notes or None),
+            ])
+            self.client.query(merge_query, job_config=job_config).result()
             console.print(f"[green]Added/updated mapping: '{variant_name}' → '{canonical_name}'[/green]")
             return True
         except Exception as e:
@@ -1005,14 +1166,16 @@ class BigQueryLoader:
         """
         table_id = f"{self.project_id}.{self.dataset_name}.{self.mappings_table_name}"
 
-        variant_escaped = variant_name.replace("'", "\\'")
         delete_query = f"""
         DELETE FROM `{table_id}`
-        WHERE variant_name = '{variant_escaped}'
+        WHERE variant_name = @variant_name
         """
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ScalarQueryParameter("variant_name", "STRING", variant_name),
+        ])
 
         try:
-            result = self.client.query(delete_query).result()
+            self.client.query(delete_query, job_config=job_config).result()
             console.print(f"[green]Deleted mapping for '{variant_name}'[/green]")
             return True
         except Exception as e:
@@ -1064,24 +1227,9 @@ class BigQueryLoader:
 
         table_id = f"{self.project_id}.{self.dataset_name}.{self.new_table_name}"
 
-        # Define new sales assessment fields
+        # The sales assessment fields, as declared in the table schema
         SALES_ASSESSMENT_SCHEMA_FIELDS = [
-            bigquery.SchemaField("salesperson_name", "STRING", mode="NULLABLE", description="UNKNOWN rep name"),
-            bigquery.SchemaField("salesperson_email", "STRING", mode="NULLABLE", description="UNKNOWN rep email"),
-            bigquery.SchemaField("sales_total_score", "INTEGER", mode="NULLABLE", description="Total sales assessment score (0-24)"),
-            bigquery.SchemaField("sales_total_qualified", "INTEGER", mode="NULLABLE", description="Number of sales criteria qualified (0-8)"),
-            bigquery.SchemaField("sales_qualified", "BOOLEAN", mode="NULLABLE", description="True if sales assessment meets threshold"),
-            bigquery.SchemaField("sales_introduction", "JSON", mode="NULLABLE", description="Introduction & Framing assessment"),
-            bigquery.SchemaField("sales_discovery", "JSON", mode="NULLABLE", description="Discovery assessment"),
-            bigquery.SchemaField("sales_scoping", "JSON", mode="NULLABLE", description="Opportunity scoping assessment"),
-            bigquery.SchemaField("sales_solution", "JSON", mode="NULLABLE", description="Solution positioning assessment"),
-            bigquery.SchemaField("sales_commercial", "JSON", mode="NULLABLE", description="Commercial confidence assessment"),
-            bigquery.SchemaField("sales_case_studies", "JSON", mode="NULLABLE", description="Case studies assessment"),
-            bigquery.SchemaField("sales_next_steps", "JSON", mode="NULLABLE", description="Next steps assessment"),
-            bigquery.SchemaField("sales_strategic_context", "JSON", mode="NULLABLE", description="Strategic context assessment"),
-            bigquery.SchemaField("sales_strengths", "STRING", mode="REPEATED", description="Top strengths identified"),
-            bigquery.SchemaField("sales_improvements", "STRING", mode="REPEATED", description="Top improvement areas"),
-            bigquery.SchemaField("sales_overall_coaching", "STRING", mode="NULLABLE", description="Overall coaching note"),
+            field for field in _MEETING_INTEL_SCHEMA if field.name.startswith("sales")
         ]
 
         try:
@@ -1122,6 +1270,17 @@ class BigQueryLoader:
             return False
 
 
+@lru_cache(maxsize=1)
+def get_loader() -> BigQueryLoader:
+    """
+    Process-wide BigQueryLoader.
+
+    bigquery.Client is thread-safe and holds the authenticated session, so
+    one instance is reused rather than re-authenticating per upload.
+    """
+    return BigQueryLoader()
+
+
 def upload_to_bigquery(jsonl_path: Path, write_disposition: str = "WRITE_APPEND") -> bool:
     """
     Convenience function to upload JSONL data to BigQuery (legacy table)
@@ -1134,7 +1293,7 @@ def upload_to_bigquery(jsonl_path: Path, write_disposition: str = "WRITE_APPEND"
         True if successful, False otherwise
     """
     try:
-        loader = BigQueryLoader()
+        loader = get_loader()
         rows_loaded = loader.load_jsonl_data(jsonl_path, write_disposition)
 
         if rows_loaded > 0:
@@ -1148,26 +1307,29 @@ def upload_to_bigquery(jsonl_path: Path, write_disposition: str = "WRITE_APPEND"
 
 
 def upload_to_new_bigquery(
-    jsonl_path: Path,
+    jsonl_path: Union[Path, bytes],
     use_merge: bool = True,
     *,
     scoring_domain: str = "client",
+    show_status: bool = True,
 ) -> bool:
     """
     Convenience function to upload JSONL data to new meeting_intel BigQuery table.
 
     Args:
-        jsonl_path: Path to JSONL file
+        jsonl_path: Path to JSONL file, or the JSONL content as bytes
         use_merge: Use MERGE operation (recommended; prevents duplicates)
         scoring_domain: 'client' (default, current behaviour) or 'talent'.
             Determines which MERGE SET clause runs — each domain only writes
             its own columns; the other domain's columns stay SQL NULL.
+        show_status: Print the table summary and recent uploads afterwards
+            (two extra BigQuery calls; the API turns this off).
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        loader = BigQueryLoader()
+        loader = get_loader()
 
         if use_merge:
             if scoring_domain == "talent":
@@ -1182,7 +1344,8 @@ def upload_to_new_bigquery(
             rows_processed = loader.load_new_jsonl_data(jsonl_path)
 
         if rows_processed > 0:
-            loader.display_new_table_status()
+            if show_status:
+                loader.display_new_table_status()
             return True
         return False
 
@@ -11,7 +11,6 @@ from .importers.plaintext import PlaintextImporter
 from .importers.granola_drive import GranolaDriveImporter
 from .scorers import ClientScorer
 from .scoring import OutputGenerator
-from .bq_loader import BigQueryLoader
 
 app = typer.Typer(help="UNKNOWN Brain - LLM-powered Transcript Scoring")
 console = Console()
@@ -270,6 +269,10 @@ def upload_bq(
     write_disposition = write_disposition_map[write_mode]
     
     try:
+        # Imported here: google.cloud.bigquery takes most of a second to
+        # load, and ingest/score never touch BigQuery
+        from .bq_loader import BigQueryLoader
+
         loader = BigQueryLoader()
         
         if show_status:
@@ -307,6 +310,8 @@ def upload_bq_merge(
         raise typer.Exit(1)
     
     try:
+        from .bq_loader import BigQueryLoader
+
         loader = BigQueryLoader()
         
         if show_status:
@@ -335,6 +340,8 @@ def dedupe_bq():
     """Remove duplicate rows from BigQuery table."""
     
     try:
+        from .bq_loader import BigQueryLoader
+
         loader = BigQueryLoader()
         
         console.print("\n[bold]Current Table Status:[/bold]")
@@ -359,6 +366,8 @@ def migrate_sales_schema():
     """Add sales assessment columns to existing meeting_intel table."""
 
     try:
+        from .bq_loader import BigQueryLoader
+
         loader = BigQueryLoader()
 
         console.print("\n[bold]Adding sales assessment columns to BigQuery table...[/bold]")
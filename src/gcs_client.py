@@ -16,6 +16,11 @@ from google.cloud.exceptions import NotFound
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for transcript downloads (GCS_READ_CHUNK_MB, whole MiB so it
+# stays a multiple of the 256 KiB the client requires). 0 keeps the
+# library default: one streamed GET for the whole object.
+GCS_READ_CHUNK_BYTES = int(os.getenv("GCS_READ_CHUNK_MB", "16")) * 1024 * 1024
+
 class GCSClient:
     """Client for Google Cloud Storage operations"""
     
@@ -84,7 +89,7 @@ class GCSClient:
             Path to temporary file
         """
         try:
-            blob = self.bucket.blob(blob_name)
+            blob = self.bucket.blob(blob_name, chunk_size=GCS_READ_CHUNK_BYTES or None)
             
             # Create temporary file with same extension
             suffix = Path(blob_name).suffix
@@ -249,6 +254,19 @@ class GCSClient:
 
         return self.upload_results(cache_data, cache_key)
 
+    def discard_cached_score(
+        self, meeting_id: str, model: str, source: str, variant: Optional[str] = None
+    ) -> None:
+        """
+        Drop a cached score, e.g. one written alongside a MERGE that then
+        failed, so the retry re-scores and writes the row. Non-fatal on error.
+        """
+        cache_key = self.create_cache_key(meeting_id, model, source, variant)
+        try:
+            self.bucket.blob(cache_key).delete()
+        except Exception as e:
+            print(f"discard_cached_score error for {meeting_id} (non-fatal): {e}")
+
     def _claim_key(self, meeting_id: str, model: str, source: str) -> str:
         """Date-scoped claim marker path (mirrors the cache key)."""
         today = datetime.now().strftime('%Y-%m-%d')
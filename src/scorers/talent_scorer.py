@@ -405,13 +405,14 @@ class TalentScorer:
         Load variant→canonical name mappings from BigQuery and normalise keys.
 
         Lazy import so unit tests can patch the loader without paying the
-        BigQueryLoader instantiation cost just to construct the scorer.
+        BigQueryLoader instantiation cost just to construct the scorer. Uses
+        the process-wide loader, so the client it authenticated and the
+        dataset/table checks it has already answered carry over to uploads.
         """
         try:
-            from ..bq_loader import BigQueryLoader
+            from ..bq_loader import get_loader
 
-            loader = BigQueryLoader()
-            raw = loader.load_client_mappings()
+            raw = get_loader().load_client_mappings()
         except Exception as e:
             logger.warning(f"Failed to load client mappings (proceeding without): {e}")
             return {}
@@ -0,0 +1,297 @@
+"""
+Job-status store shared by the API handlers and pipeline tasks.
+
+main.processing_status used to be a plain per-process dict. With more than
+one uvicorn worker (or Cloud Run replica) each process saw a disjoint view,
+so GET /status/{id} 404'd for jobs started elsewhere, and the dict grew
+without bound.
+
+`make_status_store` returns a RedisStatusStore when REDIS_URL is set and
+the `redis` package is installed; otherwise an in-process LocalStatusStore
+(single-worker mode). Both implement the StatusStore interface: awaitable
+get / set / set_many / update / recent / count over meeting_id -> plain
+status dict, dropping an entry STATUS_TTL_SECONDS after its last write (GET
+/status then 404s). A status read from the store is a snapshot; changes go
+back through `update` (or `set`), and a batch of new jobs through
+`set_many`. The Redis store runs on redis.asyncio, so
+a slow or unreachable server holds up only the coroutine waiting on it, not
+the event loop.
+
+Redis layout:
+  job:{meeting_id}  -> orjson-encoded status, MSET + EXPIRE STATUS_TTL_SECONDS
+  jobs:recent       -> sorted set of meeting_ids scored by first-write time,
+                       so iteration order matches LocalStatusStore's
+
+Configure the Redis server with `maxmemory` + `maxmemory-policy allkeys-lru`
+so memory stays bounded even if TTLs are raised. The local store is also
+capped at STATUS_MAX_ENTRIES, dropping the oldest jobs first, and keeps
+plain `store[id]` access for in-process callers (tests, scripts).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+
+try:
+    import redis
+    import redis.asyncio
+except ImportError:  # optional: only needed for multi-worker deployments
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# How long a job status survives after its last write
+STATUS_TTL_SECONDS = int(os.getenv("STATUS_TTL_SECONDS", "86400"))
+
+# Hard cap on jobs held by the in-process store, regardless of TTL
+STATUS_MAX_ENTRIES = int(os.getenv("STATUS_MAX_ENTRIES", "10000"))
+
+# Socket timeouts for every Redis call. Status calls don't block the event
+# loop, but a handler or pipeline step awaiting one should still fail fast
+# against an unreachable server rather than wait out the OS TCP timeout.
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+# Seconds a pooled connection may sit idle before it's PINGed on reuse
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+
+_KEY_PREFIX = "job:"
+_RECENT_KEY = "jobs:recent"
+
+
+class StatusStore(ABC):
+    """Awaitable meeting_id -> status dict store (see module docstring)."""
+
+    @abstractmethod
+    async def get(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        """The job's status, or None if unknown or expired."""
+
+    async def set(self, meeting_id: str, value: Dict[str, Any]) -> None:
+        await self.set_many({meeting_id: value})
+
+    @abstractmethod
+    async def set_many(self, statuses: Dict[str, Dict[str, Any]]) -> None:
+        """Write several statuses at once (one round trip for Redis)."""
+
+    async def update(self, meeting_id: str, **fields: Any) -> None:
+        """Merge `fields` into an existing status; KeyError if there is none."""
+        current = await self.get(meeting_id)
+        if current is None:
+            raise KeyError(meeting_id)
+        await self.set(meeting_id, {**current, **fields})
+
+    @abstractmethod
+    async def delete(self, meeting_id: str) -> None:
+        """Drop a status; KeyError if there is none."""
+
+    @abstractmethod
+    async def recent(self, limit: int) -> List[Tuple[str, Dict[str, Any]]]:
+        """The last `limit` live (meeting_id, status) pairs, oldest first."""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Number of jobs tracked."""
+
+    async def ping(self) -> None:
+        """Check the backing store is reachable; raises if it isn't."""
+
+
+class LocalStatusStore(StatusStore):
+    """
+    In-process store of meeting_id -> status dict, bounded by age and count.
+    Iterates in first-write order, like RedisStatusStore. Nothing here does
+    I/O, so the async methods complete without suspending.
+    """
+
+    def __init__(self, ttl_seconds: int = STATUS_TTL_SECONDS, max_entries: int = STATUS_MAX_ENTRIES):
+        self._ttl = ttl_seconds
+        self._max = max_entries
+        # Two orders over the same ids: first write (what callers iterate)
+        # and last write (what expiry follows). Keeping the second one sorted
+        # makes every expiry sweep stop at the first live entry, so reads,
+        # len() and recent() never scan the whole store.
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._written: "OrderedDict[str, float]" = OrderedDict()
+
+    def _sweep(self) -> None:
+        cutoff = time.monotonic() - self._ttl
+        while self._written:
+            meeting_id, written_at = next(iter(self._written.items()))
+            if written_at >= cutoff:
+                break
+            del self._written[meeting_id]
+            del self._entries[meeting_id]
+
+    def __getitem__(self, meeting_id: str) -> Dict[str, Any]:
+        self._sweep()
+        return self._entries[meeting_id]
+
+    def __setitem__(self, meeting_id: str, value: Dict[str, Any]) -> None:
+        self._sweep()
+        # Plain assignment keeps an existing key's position (first-write order)
+        self._entries[meeting_id] = value
+        self._written[meeting_id] = time.monotonic()
+        self._written.move_to_end(meeting_id)
+        while len(self._entries) > self._max:
+            oldest, _ = self._entries.popitem(last=False)
+            del self._written[oldest]
+
+    def __delitem__(self, meeting_id: str) -> None:
+        del self._entries[meeting_id]
+        del self._written[meeting_id]
+
+    def __contains__(self, meeting_id: object) -> bool:
+        self._sweep()
+        return meeting_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        self._sweep()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self._sweep()
+        return len(self._entries)
+
+    async def get(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        self._sweep()
+        return self._entries.get(meeting_id)
+
+    async def set_many(self, statuses: Dict[str, Dict[str, Any]]) -> None:
+        for meeting_id, value in statuses.items():
+            self[meeting_id] = value
+
+    async def delete(self, meeting_id: str) -> None:
+        del self[meeting_id]
+
+    async def recent(self, limit: int) -> List[Tuple[str, Dict[str, Any]]]:
+        self._sweep()
+        return list(islice(reversed(self._entries.items()), max(limit, 0)))[::-1]
+
+    async def count(self) -> int:
+        return len(self)
+
+
+class RedisStatusStore(StatusStore):
+    """Status store persisted in Redis, over a redis.asyncio client."""
+
+    def __init__(self, client: Any, ttl_seconds: int = STATUS_TTL_SECONDS):
+        self._client = client
+        self._ttl = ttl_seconds
+
+    async def get(self, meeting_id: str) -> Optional[Dict[str, Any]]:
+        raw = await self._client.get(_KEY_PREFIX + meeting_id)
+        return None if raw is None else orjson.loads(raw)
+
+    async def set_many(self, statuses: Dict[str, Dict[str, Any]]) -> None:
+        if not statuses:
+            return
+        now = time.time()
+        # One MULTI/EXEC round trip however many jobs: MSET has no expiry
+        # option, so each key's EXPIRE rides in the same transaction
+        pipe = self._client.pipeline()
+        pipe.mset({_KEY_PREFIX + mid: orjson.dumps(value) for mid, value in statuses.items()})
+        for meeting_id in statuses:
+            pipe.expire(_KEY_PREFIX + meeting_id, self._ttl)
+        # NX keeps the original position so an update doesn't reorder the job
+        pipe.zadd(_RECENT_KEY, {meeting_id: now for meeting_id in statuses}, nx=True)
+        # Drop index entries whose status key has since expired
+        pipe.zremrangebyscore(_RECENT_KEY, "-inf", now - self._ttl)
+        await pipe.execute()
+
+    async def delete(self, meeting_id: str) -> None:
+        pipe = self._client.pipeline()
+        pipe.delete(_KEY_PREFIX + meeting_id)
+        pipe.zrem(_RECENT_KEY, meeting_id)
+        deleted, _ = await pipe.execute()
+        if not deleted:
+            raise KeyError(meeting_id)
+
+    async def recent(self, limit: int) -> List[Tuple[str, Dict[str, Any]]]:
+        if limit <= 0:
+            return []
+        members = await self._client.zrange(_RECENT_KEY, -limit, -1)
+        ids = [m.decode() if isinstance(m, bytes) else m for m in members]
+        if not ids:
+            return []
+        # One MGET for the lot, skipping ids whose status key has expired
+        raws = await self._client.mget([_KEY_PREFIX + mid for mid in ids])
+        return [
+            (mid, orjson.loads(raw))
+            for mid, raw in zip(ids, raws)
+            if raw is not None
+        ]
+
+    async def count(self) -> int:
+        return await self._client.zcard(_RECENT_KEY)
+
+    async def ping(self) -> None:
+        await self._client.ping()
+
+
+def _redis_url_or_none(redis_url: Optional[str]) -> Optional[str]:
+    redis_url = redis_url or os.getenv("REDIS_URL")
+    if not redis_url:
+        return None
+    if redis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed; "
+                       "running without Redis")
+        return None
+    return redis_url
+
+
+def _client_options() -> Dict[str, Any]:
+    return {
+        "socket_timeout": REDIS_SOCKET_TIMEOUT,
+        "socket_connect_timeout": REDIS_CONNECT_TIMEOUT,
+        "health_check_interval": REDIS_HEALTH_CHECK_INTERVAL,
+    }
+
+
+@lru_cache(maxsize=4)
+def get_redis(redis_url: Optional[str] = None) -> Optional[Any]:
+    """
+    Process-wide blocking Redis client for `redis_url` (default: $REDIS_URL),
+    for callers already off the event loop (e.g. the score cache lookup,
+    which runs in a worker thread).
+
+    Returns None when no URL is configured or the redis package is missing,
+    so callers can treat Redis as an optional layer.
+    """
+    redis_url = _redis_url_or_none(redis_url)
+    if redis_url is None:
+        return None
+    return redis.Redis.from_url(redis_url, **_client_options())
+
+
+@lru_cache(maxsize=4)
+def get_async_redis(redis_url: Optional[str] = None) -> Optional[Any]:
+    """
+    Process-wide redis.asyncio client for `redis_url` (default: $REDIS_URL),
+    for use from coroutines. Connections open lazily on the running loop.
+    None under the same conditions as get_redis.
+    """
+    redis_url = _redis_url_or_none(redis_url)
+    if redis_url is None:
+        return None
+    return redis.asyncio.Redis.from_url(redis_url, **_client_options())
+
+
+def make_status_store(redis_url: Optional[str] = None) -> StatusStore:
+    """
+    Build the process's status store.
+
+    Uses Redis when `redis_url` (default: $REDIS_URL) is set and the client
+    library is available; falls back to a LocalStatusStore otherwise.
+    """
+    client = get_async_redis(redis_url)
+    if client is None:
+        return LocalStatusStore()
+    return RedisStatusStore(client)
@@ -413,13 +413,11 @@ class TestArticle9DomainIsolation(unittest.TestCase):
         self.assertNotIn("article9_flags", NewScoreResult.model_fields)
 
     def test_talent_merge_writes_it_client_merge_does_not(self):
-        from src.bq_loader import BigQueryLoader
-        talent_src = inspect.getsource(BigQueryLoader.merge_talent_jsonl_data)
-        client_src = inspect.getsource(BigQueryLoader.merge_client_jsonl_data)
-        self.assertIn("article9_flags = source.article9_flags", talent_src)
-        self.assertIn("article9_status = source.article9_status", talent_src)
-        self.assertNotIn("article9_flags", client_src)
-        self.assertNotIn("article9_status", client_src)
+        from src.bq_loader import _CLIENT_MERGE_UPDATE, _TALENT_MERGE_UPDATE
+        self.assertIn("article9_flags = source.article9_flags", _TALENT_MERGE_UPDATE)
+        self.assertIn("article9_status = source.article9_status", _TALENT_MERGE_UPDATE)
+        self.assertNotIn("article9_flags", _CLIENT_MERGE_UPDATE)
+        self.assertNotIn("article9_status", _CLIENT_MERGE_UPDATE)
 
     def test_client_scorer_has_no_article9(self):
         from src.scorers import TalentScorer
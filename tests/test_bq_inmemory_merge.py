@@ -0,0 +1,473 @@
+"""
+Tests for the in-memory JSONL MERGE path.
+
+The API writes one row per scored transcript. It used to round-trip that
+row through /tmp/<id>_new.jsonl; now the JSONL is built in memory and
+handed to the temp-table load directly, with rows from concurrent
+pipelines batched into a single MERGE.
+"""
+
+import asyncio
+import gzip
+import os
+import unittest
+from unittest.mock import MagicMock, patch
+
+os.environ.setdefault("SCORING_COST_LOG_DISABLED", "true")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from src.bq_loader import BigQueryLoader
+
+
+class TestLoadToTempTableFromBytes(unittest.TestCase):
+    def test_bytes_are_loaded_without_touching_disk(self):
+        with patch("src.bq_loader.bigquery.Client"), \
+             patch.object(BigQueryLoader, "create_dataset_if_not_exists", return_value=None), \
+             patch.object(BigQueryLoader, "create_new_table_if_not_exists", return_value=None), \
+             patch("builtins.open") as mock_open:
+            loader = BigQueryLoader()
+            loader.client.get_table.return_value.schema = []
+            loader.client.load_table_from_file.return_value.errors = None
+
+            temp_table_id = loader._load_to_temp_table(b'{"meeting_id": "m1"}\n')
+
+        mock_open.assert_not_called()
+        source = loader.client.load_table_from_file.call_args.args[0]
+        self.assertEqual(gzip.decompress(source.getvalue()), b'{"meeting_id": "m1"}\n')
+        self.assertIn(".temp_upload_", temp_table_id)
+        # A known size keeps small loads on the single-request multipart upload
+        self.assertEqual(loader.client.load_table_from_file.call_args.kwargs["size"], len(source.getvalue()))
+
+    def test_table_checks_and_schema_fetch_happen_once_per_loader(self):
+        with patch("src.bq_loader.bigquery.Client"), \
+             patch.object(BigQueryLoader, "create_dataset_if_not_exists") as mock_dataset, \
+             patch.object(BigQueryLoader, "create_new_table_if_not_exists") as mock_table:
+            loader = BigQueryLoader()
+            loader.client.get_table.return_value.schema = []
+            loader.client.load_table_from_file.return_value.errors = None
+
+            loader._load_to_temp_table(b'{"meeting_id": "m1"}\n')
+            loader._load_to_temp_table(b'{"meeting_id": "m2"}\n')
+
+        mock_dataset.assert_called_once()
+        mock_table.assert_called_once()
+        loader.client.get_table.assert_called_once()
+
+    def test_client_merge_reads_table_metadata_once(self):
+        with patch("src.bq_loader.bigquery.Client"), patch("src.bq_loader.atexit"), \
+             patch.object(BigQueryLoader, "create_dataset_if_not_exists", return_value=None), \
+             patch.object(BigQueryLoader, "create_new_table_if_not_exists", return_value=None):
+            loader = BigQueryLoader()
+            loader.client.get_table.return_value.schema = []
+            loader.client.load_table_from_file.return_value.errors = None
+            loader.client.query.return_value._properties = {
+                "statistics": {"query": {"dmlStats": {"insertedRowCount": "1"}}}
+            }
+
+            self.assertEqual(loader.merge_client_jsonl_data(b'{"meeting_id": "m1"}\n'), 1)
+            self.assertEqual(loader.merge_client_jsonl_data(b'{"meeting_id": "m2"}\n'), 1)
+
+        loader.client.get_table.assert_called_once()  # the cached schema fetch
+        # One staging table, truncated by each load rather than dropped after each MERGE
+        first, second = (c.args[1] for c in loader.client.load_table_from_file.call_args_list)
+        self.assertEqual(first, second)
+        self.assertIn(".merge_staging_", first)
+        loader.client.delete_table.assert_not_called()
+
+        loader.drop_staging_tables()
+        loader.client.delete_table.assert_called_once_with(first, not_found_ok=True)
+
+    def test_concurrent_merges_get_separate_staging_tables(self):
+        with patch("src.bq_loader.bigquery.Client"), patch("src.bq_loader.atexit") as mock_atexit:
+            loader = BigQueryLoader()
+            loader.client.get_table.return_value.schema = []
+            first = loader._checkout_staging_table()
+            second = loader._checkout_staging_table()
+            loader._return_staging_table(first)
+
+            self.assertNotEqual(first, second)
+            self.assertEqual(loader._checkout_staging_table(), first)
+
+        mock_atexit.register.assert_called_once_with(loader.drop_staging_tables)
+
+    def test_staging_tables_are_created_with_an_expiry(self):
+        from datetime import datetime, timezone
+
+        from src.bq_loader import STAGING_TABLE_TTL
+
+        with patch("src.bq_loader.bigquery.Client"), patch("src.bq_loader.atexit"):
+            loader = BigQueryLoader()
+            loader.client.get_table.return_value.schema = []
+            staging_table_id = loader._checkout_staging_table()
+
+        table = loader.client.create_table.call_args.args[0]
+        self.assertEqual(f"{table.project}.{table.dataset_id}.{table.table_id}", staging_table_id)
+        remaining = table.expires - datetime.now(timezone.utc)
+        self.assertGreater(remaining, STAGING_TABLE_TTL * 0.9)
+        self.assertLessEqual(remaining, STAGING_TABLE_TTL)
+        loader.client.update_table.assert_not_called()
+
+    def test_reused_staging_table_expiry_is_refreshed_when_due(self):
+        from datetime import datetime, timezone
+
+        from src.bq_loader import STAGING_TABLE_TTL
+
+        with patch("src.bq_loader.bigquery.Client"), patch("src.bq_loader.atexit"):
+            loader = BigQueryLoader()
+            loader.client.get_table.return_value.schema = []
+            staging_table_id = loader._checkout_staging_table()
+            loader._return_staging_table(staging_table_id)
+
+            # Fresh: reused as is
+            self.assertEqual(loader._checkout_staging_table(), staging_table_id)
+            loader._return_staging_table(staging_table_id)
+            loader.client.update_table.assert_not_called()
+
+            # Past half its lifetime: pushed out again
+            loader._staging_tables[staging_table_id] = datetime.now(timezone.utc) + STAGING_TABLE_TTL / 4
+            self.assertEqual(loader._checkout_staging_table(), staging_table_id)
+
+        table, fields = loader.client.update_table.call_args.args
+        self.assertEqual(fields, ["expires"])
+        self.assertGreater(table.expires - datetime.now(timezone.utc), STAGING_TABLE_TTL * 0.9)
+        loader.client.create_table.assert_called_once()
+
+    def test_expired_staging_table_is_recreated(self):
+        from datetime import datetime, timedelta, timezone
+
+        from google.api_core.exceptions import NotFound
+
+        with patch("src.bq_loader.bigquery.Client"), patch("src.bq_loader.atexit"):
+            loader = BigQueryLoader()
+            loader.client.get_table.return_value.schema = []
+            staging_table_id = loader._checkout_staging_table()
+            loader._return_staging_table(staging_table_id)
+            loader._staging_tables[staging_table_id] = datetime.now(timezone.utc) - timedelta(minutes=1)
+            loader.client.update_table.side_effect = NotFound("gone")
+
+            self.assertEqual(loader._checkout_staging_table(), staging_table_id)
+
+        self.assertEqual(loader.client.create_table.call_count, 2)
+        self.assertIsNotNone(loader.client.create_table.call_args.args[0].expires)
+
+    def test_staging_bucket_merges_from_an_external_table(self):
+        with patch("src.bq_loader.bigquery.Client"), \
+             patch("google.cloud.storage.Client") as mock_storage, \
+             patch.object(BigQueryLoader, "create_dataset_if_not_exists", return_value=None), \
+             patch.object(BigQueryLoader, "create_new_table_if_not_exists", return_value=None):
+            loader = BigQueryLoader()
+            loader.staging_bucket = "staging"
+            loader.client.get_table.return_value.schema = []
+            loader.client.query.return_value._properties = {
+                "statistics": {"query": {"dmlStats": {"updatedRowCount": "1"}}}
+            }
+            blob = mock_storage.return_value.bucket.return_value.blob.return_value
+            blob.name = "bq-staging/x.jsonl"
+
+            self.assertEqual(loader.merge_talent_jsonl_data(b'{"meeting_id": "m1"}\n'), 1)
+
+        loader.client.load_table_from_file.assert_not_called()
+        loader.client.delete_table.assert_not_called()
+        blob.upload_from_string.assert_called_once()
+        blob.delete.assert_called_once()
+        query, = loader.client.query.call_args.args
+        self.assertIn("USING staged_rows AS source", query)
+        external = loader.client.query.call_args.kwargs["job_config"].table_definitions["staged_rows"]
+        self.assertEqual(external.source_uris, ["gs://staging/bq-staging/x.jsonl"])
+        self.assertEqual(external.compression, "GZIP")
+        staged, = blob.upload_from_string.call_args.args
+        self.assertEqual(gzip.decompress(staged), b'{"meeting_id": "m1"}\n')
+
+    def test_append_load_accepts_bytes(self):
+        with patch("src.bq_loader.bigquery.Client"), \
+             patch.object(BigQueryLoader, "create_dataset_if_not_exists", return_value=None), \
+             patch.object(BigQueryLoader, "create_new_table_if_not_exists", return_value=None), \
+             patch("builtins.open") as mock_open:
+            loader = BigQueryLoader()
+            job = loader.client.load_table_from_file.return_value
+            job.errors = None
+            job.output_rows = 1
+
+            self.assertEqual(loader.load_new_jsonl_data(b'{"meeting_id": "m1"}\n'), 1)
+
+        mock_open.assert_not_called()
+        source = loader.client.load_table_from_file.call_args.args[0]
+        self.assertEqual(gzip.decompress(source.getvalue()), b'{"meeting_id": "m1"}\n')
+
+
+class TestExistenceChecks(unittest.TestCase):
+    def test_dataset_and_tables_are_checked_once_per_loader(self):
+        with patch("src.bq_loader.bigquery.Client"):
+            loader = BigQueryLoader()
+            for _ in range(3):
+                loader.create_dataset_if_not_exists()
+                loader.create_new_table_if_not_exists()
+                loader.create_mappings_table_if_not_exists()
+
+        loader.client.get_dataset.assert_called_once()
+        self.assertEqual(loader.client.get_table.call_count, 2)
+
+    def test_missing_table_is_created_then_remembered(self):
+        from google.cloud.exceptions import NotFound
+
+        with patch("src.bq_loader.bigquery.Client"), patch("src.bq_loader.bigquery.Table"):
+            loader = BigQueryLoader()
+            loader.client.get_table.side_effect = NotFound("missing")
+            loader.create_mappings_table_if_not_exists()
+            loader.create_mappings_table_if_not_exists()
+
+        loader.client.create_table.assert_called_once()
+        # a concurrent instance creating it first is not an error
+        self.assertTrue(loader.client.create_table.call_args.kwargs["exists_ok"])
+
+    def test_new_meeting_intel_table_is_partitioned_and_clustered(self):
+        from google.cloud.exceptions import NotFound
+
+        with patch("src.bq_loader.bigquery.Client"):
+            loader = BigQueryLoader()
+            loader.client.get_table.side_effect = NotFound("missing")
+            loader.create_new_table_if_not_exists()
+
+        table, = loader.client.create_table.call_args.args
+        self.assertEqual(table.time_partitioning.field, "date")
+        self.assertEqual(table.clustering_fields, ["meeting_id"])
+
+
+class TestDeduplicate(unittest.TestCase):
+    def _loader(self, extra_rows, tied_rows=0, deleted=None):
+        from google.cloud import bigquery
+
+        loader = BigQueryLoader()
+        loader.client.query_and_wait.return_value = [{"extra_rows": extra_rows, "tied_rows": tied_rows}]
+        loader.client.query.return_value.num_dml_affected_rows = deleted
+        table = MagicMock()
+        table.time_partitioning = bigquery.TimePartitioning(field="date")
+        table.clustering_fields = ["meeting_id"]
+        table.schema = [bigquery.SchemaField("date", "DATE")]
+        loader.client.get_table.return_value = table
+        return loader
+
+    def test_clean_table_costs_one_probe_and_nothing_else(self):
+        with patch("src.bq_loader.bigquery.Client"):
+            loader = self._loader(extra_rows=0)
+            self.assertEqual(loader.deduplicate_table(), 0)
+
+        loader.client.query_and_wait.assert_called_once()
+        loader.client.query.assert_not_called()  # no DELETE, no rewrite
+
+    def test_duplicates_are_deleted_in_place(self):
+        with patch("src.bq_loader.bigquery.Client"):
+            loader = self._loader(extra_rows=2, deleted=2)
+            self.assertEqual(loader.deduplicate_new_table(), 2)
+
+        delete_query, = loader.client.query.call_args.args
+        loader.client.query.assert_called_once()
+        self.assertIn("DELETE FROM", delete_query)
+        self.assertIn("QUALIFY", delete_query)
+        loader.client.get_table.assert_not_called()
+
+    def test_exact_duplicates_are_rewritten_keeping_the_table_layout(self):
+        # Two rows sharing (meeting_id, scored_at): a DELETE can't keep just
+        # one of them, so the probe routes straight to a single rebuild
+        with patch("src.bq_loader.bigquery.Client"):
+            loader = self._loader(extra_rows=3, tied_rows=1)
+            self.assertEqual(loader.deduplicate_new_table(), 3)
+
+        replace_query, = loader.client.query.call_args.args
+        loader.client.query.assert_called_once()  # the rebuild, no DELETE first
+        self.assertIn("CREATE OR REPLACE TABLE", replace_query)
+        self.assertIn("PARTITION BY date", replace_query)
+        self.assertIn("CLUSTER BY meeting_id", replace_query)
+        self.assertIn(") = 1", replace_query)
+
+
+class TestQueryParameters(unittest.TestCase):
+    def test_recent_uploads_limit_is_a_parameter(self):
+        with patch("src.bq_loader.bigquery.Client"):
+            loader = BigQueryLoader()
+            loader.client.query_and_wait.return_value = []
+            loader.query_new_recent_uploads(limit=3)
+            loader.query_new_recent_uploads(limit=7)
+
+        first, second = loader.client.query_and_wait.call_args_list
+        self.assertIn("LIMIT @limit", first.args[0])
+        self.assertEqual(first.args[0], second.args[0])
+        self.assertEqual(second.kwargs["job_config"].query_parameters[0].value, 7)
+
+    def test_mapping_values_are_not_spliced_into_sql(self):
+        with patch("src.bq_loader.bigquery.Client"), \
+             patch.object(BigQueryLoader, "create_dataset_if_not_exists", return_value=None), \
+             patch.object(BigQueryLoader, "create_mappings_table_if_not_exists", return_value=None):
+            loader = BigQueryLoader()
+            self.assertTrue(loader.add_client_mapping("O'Brien Ltd", "O'Brien"))
+
+        query = loader.client.query.call_args.args[0]
+        self.assertNotIn("O'Brien", query)
+        params = {p.name: p.value for p in loader.client.query.call_args.kwargs["job_config"].query_parameters}
+        self.assertEqual(params, {"variant_name": "O'Brien Ltd", "canonical_name": "O'Brien", "notes": None})
+
+
+class TestMergeUpdateClauses(unittest.TestCase):
+    def test_each_domain_leaves_the_other_domains_columns_alone(self):
+        from src import bq_loader
+
+        for clause, foreign in (
+            (bq_loader._CLIENT_MERGE_UPDATE, bq_loader._TALENT_ONLY_COLUMNS),
+            (bq_loader._TALENT_MERGE_UPDATE, bq_loader._CLIENT_ONLY_COLUMNS),
+        ):
+            assigned = {line.split(" = ")[0].strip() for line in clause.split(",\n")}
+            self.assertFalse(assigned & foreign)
+            self.assertNotIn("meeting_id", assigned)
+            self.assertIn("full_transcript = COALESCE(source.full_transcript, target.full_transcript)", clause)
+
+    def test_insert_names_every_schema_column(self):
+        from src import bq_loader
+
+        for field in bq_loader._MEETING_INTEL_SCHEMA:
+            self.assertIn(f"source.{field.name}", bq_loader._MERGE_INSERT)
+
+
+class TestMergeRows(unittest.TestCase):
+    def test_rows_are_serialised_as_jsonl_lines(self):
+        import main
+
+        rows = [{"meeting_id": "m1", "qualified": True}, {"meeting_id": "m2", "qualified": False}]
+        with patch("main.upload_to_new_bigquery", return_value=True) as mock_upload:
+            self.assertTrue(main._merge_rows(rows, scoring_domain="talent"))
+
+        mock_upload.assert_called_once_with(
+            b'{"meeting_id":"m1","qualified":true}\n{"meeting_id":"m2","qualified":false}\n',
+            use_merge=True, show_status=False, scoring_domain="talent",
+        )
+
+
+class TestMergeBatcher(unittest.TestCase):
+    def _submit_all(self, batcher, submissions):
+        async def run():
+            return await asyncio.gather(
+                *(batcher.submit(row, **kwargs) for row, kwargs in submissions),
+                return_exceptions=True,
+            )
+        return asyncio.run(run())
+
+    def test_concurrent_rows_share_one_merge_per_domain(self):
+        import main
+
+        batcher = main._MergeBatcher(max_batch=50, flush_seconds=0.01)
+        submissions = [
+            ({"meeting_id": "c1"}, {}),
+            ({"meeting_id": "t1"}, {"scoring_domain": "talent"}),
+            ({"meeting_id": "c2"}, {}),
+        ]
+        with patch("main._merge_rows", return_value=True) as mock_merge:
+            results = self._submit_all(batcher, submissions)
+
+        self.assertEqual(results, [True, True, True])
+        calls = sorted(mock_merge.call_args_list, key=lambda c: len(c.args[0]))
+        self.assertEqual(calls[0].args, ([{"meeting_id": "t1"}],))
+        self.assertEqual(calls[0].kwargs, {"scoring_domain": "talent"})
+        self.assertEqual(calls[1].args, ([{"meeting_id": "c1"}, {"meeting_id": "c2"}],))
+        self.assertEqual(calls[1].kwargs, {})
+
+    def test_full_batch_flushes_without_waiting_for_window(self):
+        import main
+
+        batcher = main._MergeBatcher(max_batch=2, flush_seconds=60)
+        submissions = [({"meeting_id": "a"}, {}), ({"meeting_id": "b"}, {})]
+        with patch("main._merge_rows", return_value=True) as mock_merge:
+            results = self._submit_all(batcher, submissions)  # would hang on the 60s window
+
+        self.assertEqual(results, [True, True])
+        mock_merge.assert_called_once()
+
+    def test_batch_of_long_transcripts_flushes_at_the_byte_cap(self):
+        import main
+
+        batcher = main._MergeBatcher(max_batch=50, flush_seconds=60, max_bytes=100)
+        submissions = [({"meeting_id": "a", "full_transcript": "x" * 60}, {}),
+                       ({"meeting_id": "b", "full_transcript": "y" * 60}, {})]
+        with patch("main._merge_rows", return_value=True) as mock_merge:
+            results = self._submit_all(batcher, submissions)  # would hang on the 60s window
+
+        self.assertEqual(results, [True, True])
+        mock_merge.assert_called_once()
+
+    def test_redelivered_meeting_keeps_latest_row_only(self):
+        import main
+
+        batcher = main._MergeBatcher(max_batch=50, flush_seconds=0.01)
+        submissions = [({"meeting_id": "m", "v": 1}, {}), ({"meeting_id": "m", "v": 2}, {})]
+        with patch("main._merge_rows", return_value=True) as mock_merge:
+            self._submit_all(batcher, submissions)
+
+        self.assertEqual(mock_merge.call_args.args, ([{"meeting_id": "m", "v": 2}],))
+
+    def test_merge_error_reaches_every_row_in_the_batch(self):
+        import main
+
+        batcher = main._MergeBatcher(max_batch=50, flush_seconds=0.01)
+        submissions = [({"meeting_id": "a"}, {}), ({"meeting_id": "b"}, {})]
+        with patch("main._merge_rows", side_effect=RuntimeError("quota")):
+            results = self._submit_all(batcher, submissions)
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_drain_flushes_open_batches(self):
+        import main
+
+        batcher = main._MergeBatcher(max_batch=50, flush_seconds=60)
+
+        async def run():
+            pending = asyncio.ensure_future(batcher.submit({"meeting_id": "a"}))
+            await asyncio.sleep(0)
+            await batcher.drain()
+            return await pending
+
+        with patch("main._merge_rows", return_value=True) as mock_merge:
+            self.assertTrue(asyncio.run(run()))
+        mock_merge.assert_called_once()
+
+
+class TestClientRow(unittest.TestCase):
+    def test_row_carries_transcript_fields_and_section_blobs(self):
+        import main
+        from datetime import date, datetime, timezone
+        from src.schemas.client_schemas import ClientInfo, FitResult, NewScoreResult, SectionResult, Transcript
+
+        transcript = Transcript(
+            meeting_id="m1", date=date(2025, 9, 18), participants=["Ann"],
+            source="granola", title="Intro", zapier_step_id=" 42 ",
+            calendar_event_time="2025-09-18T14:00:00+01:00",
+        )
+        section = SectionResult(qualified=True, reason="r", summary="s", evidence=None)
+        score = NewScoreResult(
+            meeting_id="m1", client_info=ClientInfo(client="Acme", source="llm"),
+            date=date(2025, 9, 18), total_qualified_sections=5,
+            now=section, next=section, measure=section, blocker=section,
+            fit=FitResult(qualified=True, reason="r", summary="s", services=["talent"]),
+            scored_at=datetime(2025, 9, 18, 15, tzinfo=timezone.utc), llm_model="gpt-5-mini",
+        )
+
+        async def run():
+            with patch.object(main._merge_batcher, "submit", return_value=True) as mock_submit:
+                await main.upload_new_format_to_bigquery(transcript, score, None, "gpt-5-mini", "m1")
+            return mock_submit.call_args.args[0]
+
+        row = asyncio.run(run())
+
+        self.assertEqual(row["date"], "2025-09-18")
+        self.assertEqual(row["participants"], ["Ann"])
+        self.assertEqual(row["desk"], "Unknown")
+        self.assertEqual(row["title"], "Intro")
+        self.assertIsNone(row["granola_link"])
+        self.assertEqual(row["zapier_step_id"], 42)
+        self.assertEqual(row["calendar_event_time"], "2025-09-18T13:00:00Z")
+        self.assertEqual(row["client_info"]["client"], "Acme")
+        for name in main.CLIENT_SECTIONS:
+            self.assertEqual(row[name], getattr(score, name).model_dump(mode="json"))
+        self.assertIsNone(row["sales_introduction"])
+        self.assertNotIn("notes", row)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -64,11 +64,11 @@ class TestMergeStatementIncludesNewColumns(unittest.TestCase):
     """
 
     def test_merge_update_clause_contains_every_new_column(self):
-        src = pathlib.Path("src/bq_loader.py").read_text()
+        from src.bq_loader import _TALENT_MERGE_UPDATE
         for col in NEW_COLUMNS:
             self.assertIn(
                 f"{col} = source.{col}",
-                src,
+                _TALENT_MERGE_UPDATE,
                 f"MERGE UPDATE clause does not assign {col}",
             )
 
@@ -6,12 +6,16 @@ Verifies:
   - transient scorer error  -> returns "transient_failure" AND releases the claim
     (so the handler returns non-2xx and Eventarc redelivers)
   - poison meeting_id        -> returns "permanent_failure" (handler ACKs, no retry)
+  - failed MERGE             -> returns "transient_failure", releases the claim
+    and drops the result cache it was written alongside; a batched MERGE
+    failing does so for every meeting in the batch
   - success                  -> returns "completed"
 
 Everything external (GCS, importer, scorer, BQ upload) is mocked.
 """
 import asyncio
 import os
+import time
 import unittest
 from pathlib import Path
 from types import SimpleNamespace
@@ -41,10 +45,18 @@ def _transcript(granola_id="real-meeting-123", meeting_id="real-meeting-123"):
     return SimpleNamespace(granola_note_id=granola_id, meeting_id=meeting_id)
 
 
+def _reset_client_caches():
+    # Cached per-bucket GCS clients / pooled scorers would outlive each
+    # test's patches of main.GCSClient / main.get_scorer.
+    main._gcs_for_bucket.cache_clear()
+    main._idle_scorers.clear()
+
+
 class TestProcessPipelineResilience(unittest.TestCase):
     def setUp(self):
+        _reset_client_caches()
         # The handler normally seeds this; process_pipeline writes status into it.
-        main.processing_status["mid"] = main.ProcessingStatus(meeting_id="mid", status="pending")
+        main.processing_status["mid"] = {"meeting_id": "mid", "status": "pending"}
 
     def _run(self):
         return asyncio.run(
@@ -54,14 +66,14 @@ class TestProcessPipelineResilience(unittest.TestCase):
     @patch("main.upload_talent_format_to_bigquery", new_callable=AsyncMock)
     @patch("main.get_scorer")
     @patch("main.resolve_source", return_value="talent")
-    @patch("main.GranolaDriveImporter")
+    @patch("main.pick_importer")
     @patch("main.GCSClient")
     def test_transient_failure_releases_claim_and_signals_retry(
-        self, mock_gcs_cls, mock_importer_cls, mock_resolve, mock_get_scorer, mock_upload
+        self, mock_gcs_cls, mock_pick_importer, mock_resolve, mock_get_scorer, mock_upload
     ):
         gcs = _gcs_mock()
         mock_gcs_cls.return_value = gcs
-        mock_importer_cls.return_value.parse_file.return_value = _transcript()
+        mock_pick_importer.return_value.parse_file.return_value = _transcript()
 
         scorer = MagicMock()
         scorer.score_transcript_new.side_effect = openai.APITimeoutError(request=None)
@@ -72,20 +84,20 @@ class TestProcessPipelineResilience(unittest.TestCase):
         self.assertEqual(outcome, "transient_failure")
         gcs.release_claim.assert_called_once()          # claim released for retry
         mock_upload.assert_not_called()                 # nothing written
-        self.assertEqual(main.processing_status["mid"].status, "failed")
+        self.assertEqual(main.processing_status["mid"]["status"], "failed")
 
     @patch("main.upload_talent_format_to_bigquery", new_callable=AsyncMock)
     @patch("main.get_scorer")
     @patch("main.resolve_source", return_value="talent")
-    @patch("main.GranolaDriveImporter")
+    @patch("main.pick_importer")
     @patch("main.GCSClient")
     def test_poison_meeting_id_is_permanent(
-        self, mock_gcs_cls, mock_importer_cls, mock_resolve, mock_get_scorer, mock_upload
+        self, mock_gcs_cls, mock_pick_importer, mock_resolve, mock_get_scorer, mock_upload
     ):
         gcs = _gcs_mock()
         mock_gcs_cls.return_value = gcs
         # granola_note_id missing AND meeting_id == temp-file stem ("realmeeting")
-        mock_importer_cls.return_value.parse_file.return_value = _transcript(
+        mock_pick_importer.return_value.parse_file.return_value = _transcript(
             granola_id=None, meeting_id="realmeeting"
         )
         mock_get_scorer.return_value = MagicMock()
@@ -101,17 +113,17 @@ class TestProcessPipelineResilience(unittest.TestCase):
     @patch("main.upload_talent_format_to_bigquery", new_callable=AsyncMock)
     @patch("main.get_scorer")
     @patch("main.resolve_source", return_value="talent")
-    @patch("main.GranolaDriveImporter")
+    @patch("main.pick_importer")
     @patch("main.GCSClient")
     def test_cancellation_still_releases_claim(
-        self, mock_gcs_cls, mock_importer_cls, mock_resolve, mock_get_scorer, mock_upload
+        self, mock_gcs_cls, mock_pick_importer, mock_resolve, mock_get_scorer, mock_upload
     ):
         # A Cloud Run request timeout cancels the task -> CancelledError, which is
         # a BaseException (not Exception). The claim must still be released (via
         # finally) so the meeting isn't permanently stuck.
         gcs = _gcs_mock()
         mock_gcs_cls.return_value = gcs
-        mock_importer_cls.return_value.parse_file.return_value = _transcript()
+        mock_pick_importer.return_value.parse_file.return_value = _transcript()
         scorer = MagicMock()
         scorer.score_transcript_new.side_effect = asyncio.CancelledError()
         mock_get_scorer.return_value = scorer
@@ -124,14 +136,14 @@ class TestProcessPipelineResilience(unittest.TestCase):
     @patch("main.upload_talent_format_to_bigquery", new_callable=AsyncMock)
     @patch("main.get_scorer")
     @patch("main.resolve_source", return_value="talent")
-    @patch("main.GranolaDriveImporter")
+    @patch("main.pick_importer")
     @patch("main.GCSClient")
     def test_success_returns_completed_and_keeps_claim(
-        self, mock_gcs_cls, mock_importer_cls, mock_resolve, mock_get_scorer, mock_upload
+        self, mock_gcs_cls, mock_pick_importer, mock_resolve, mock_get_scorer, mock_upload
     ):
         gcs = _gcs_mock()
         mock_gcs_cls.return_value = gcs
-        mock_importer_cls.return_value.parse_file.return_value = _transcript()
+        mock_pick_importer.return_value.parse_file.return_value = _transcript()
 
         scorer = MagicMock()
         result = MagicMock()
@@ -144,7 +156,459 @@ class TestProcessPipelineResilience(unittest.TestCase):
         self.assertEqual(outcome, "completed")
         gcs.release_claim.assert_not_called()           # success keeps the claim
         mock_upload.assert_awaited_once()
-        self.assertEqual(main.processing_status["mid"].status, "completed")
+        self.assertEqual(main.processing_status["mid"]["status"], "completed")
+
+    @patch("main.upload_talent_format_to_bigquery", new_callable=AsyncMock)
+    @patch("main.get_scorer")
+    @patch("main.resolve_source", return_value="talent")
+    @patch("main.pick_importer")
+    @patch("main.GCSClient")
+    def test_cache_write_failure_does_not_fail_the_run(
+        self, mock_gcs_cls, mock_pick_importer, mock_resolve, mock_get_scorer, mock_upload
+    ):
+        gcs = _gcs_mock()
+        gcs.cache_score.side_effect = ConnectionError("gcs down")
+        mock_gcs_cls.return_value = gcs
+        mock_pick_importer.return_value.parse_file.return_value = _transcript()
+        mock_get_scorer.return_value.score_transcript_new.return_value = MagicMock()
+
+        self.assertEqual(self._run(), "completed")
+        mock_upload.assert_awaited_once()
+        gcs.release_claim.assert_not_called()
+
+    def _run_with_failing_merge(self, **merge_patch):
+        # The real upload helper and batcher; only the blocking MERGE is faked
+        gcs = _gcs_mock()
+        with patch("main.GCSClient", return_value=gcs), \
+             patch("main.pick_importer") as mock_pick_importer, \
+             patch("main.resolve_source", return_value="talent"), \
+             patch("main.get_scorer") as mock_get_scorer, \
+             patch("main._merge_batcher", main._MergeBatcher(max_batch=50, flush_seconds=0.01)), \
+             patch("main._merge_rows", **merge_patch) as mock_merge:
+            transcript = _transcript()
+            transcript.date = None  # read by the row builder
+            mock_pick_importer.return_value.parse_file.return_value = transcript
+            mock_get_scorer.return_value.score_transcript_new.return_value = MagicMock()
+            outcome = self._run()
+        mock_merge.assert_called_once()
+        return outcome, gcs
+
+    def test_bq_failure_is_transient_even_when_cache_write_succeeds(self):
+        outcome, gcs = self._run_with_failing_merge(side_effect=RuntimeError("merge failed"))
+
+        self.assertEqual(outcome, "transient_failure")
+        gcs.cache_score.assert_called_once()
+        gcs.discard_cached_score.assert_called_once()  # a redelivery must not hit the cache
+        gcs.release_claim.assert_called_once()
+        self.assertEqual(main.processing_status["mid"]["status"], "failed")
+
+    def test_merge_reporting_failure_is_transient(self):
+        # upload_to_new_bigquery reports a failed load or MERGE as False
+        outcome, gcs = self._run_with_failing_merge(return_value=False)
+
+        self.assertEqual(outcome, "transient_failure")
+        gcs.release_claim.assert_called_once()
+        self.assertIn("MERGE wrote no rows", main.processing_status["mid"]["error"])
+
+    def test_failed_batched_merge_is_transient_for_every_meeting_in_it(self):
+        # Concurrent pipelines share one MERGE through _MergeBatcher.submit();
+        # when it fails, none of them may be reported completed or keep a claim
+        meeting_ids = ["m0", "m1", "m2"]
+        for mid in meeting_ids:
+            main.processing_status[mid] = {"meeting_id": mid, "status": "pending"}
+        transcripts = [_transcript(granola_id=f"real-{mid}") for mid in meeting_ids]
+        for transcript in transcripts:
+            transcript.date = None
+        gcs = _gcs_mock()
+
+        async def run():
+            return await asyncio.gather(*(
+                main.process_pipeline("bucket", f"transcripts/{mid}.txt", "gpt-5-mini", mid)
+                for mid in meeting_ids
+            ))
+
+        with patch("main.GCSClient", return_value=gcs), \
+             patch("main.pick_importer") as mock_pick_importer, \
+             patch("main.resolve_source", return_value="talent"), \
+             patch("main.get_scorer") as mock_get_scorer, \
+             patch("main._merge_batcher", main._MergeBatcher(max_batch=len(meeting_ids), flush_seconds=60)), \
+             patch("main._merge_rows", side_effect=RuntimeError("quota exceeded")) as mock_merge:
+            mock_pick_importer.return_value.parse_file.side_effect = transcripts
+            mock_get_scorer.return_value.score_transcript_new.side_effect = lambda t: MagicMock(meeting_id=t.granola_note_id)
+            outcomes = asyncio.run(run())
+
+        mock_merge.assert_called_once()  # one shared MERGE, flushed by the full batch
+        self.assertEqual(len(mock_merge.call_args.args[0]), len(meeting_ids))
+        self.assertEqual(outcomes, ["transient_failure"] * len(meeting_ids))
+        self.assertEqual(gcs.release_claim.call_count, len(meeting_ids))
+        self.assertEqual(gcs.discard_cached_score.call_count, len(meeting_ids))
+        for mid in meeting_ids:
+            self.assertEqual(main.processing_status[mid]["status"], "failed")
+            self.assertIn("quota exceeded", main.processing_status[mid]["error"])
+
+    @patch("main.GCSClient", side_effect=RuntimeError("no credentials"))
+    def test_gcs_client_failure_is_reported_not_raised(self, mock_gcs_cls):
+        # gcs is still None in `finally`; the cleanup guards must not trip on it
+        self.assertEqual(self._run(), "transient_failure")
+        self.assertEqual(main.processing_status["mid"]["status"], "failed")
+        self.assertIn("no credentials", main.processing_status["mid"]["error"])
+
+    @patch("main.pick_importer")
+    @patch("main.GCSClient")
+    def test_reload_failure_cleans_up_prefetched_download(self, mock_gcs_cls, mock_pick_importer):
+        gcs = _gcs_mock()
+        gcs.bucket.blob.return_value.reload.side_effect = ConnectionError("metadata fetch failed")
+        mock_gcs_cls.return_value = gcs
+
+        outcome = self._run()
+
+        self.assertEqual(outcome, "transient_failure")
+        gcs.download_to_temp_file.assert_called_once_with("transcripts/x.txt")
+        gcs.cleanup_temp_files.assert_called_once_with([Path("/tmp/realmeeting.txt")])
+        mock_pick_importer.return_value.parse_file.assert_not_called()
+
+    @patch("main.upload_talent_format_to_bigquery", new_callable=AsyncMock)
+    @patch("main.get_scorer")
+    @patch("main.resolve_source", return_value="talent")
+    @patch("main.pick_importer")
+    @patch("main.GCSClient")
+    def test_clients_are_reused_across_runs(
+        self, mock_gcs_cls, mock_pick_importer, mock_resolve, mock_get_scorer, mock_upload
+    ):
+        mock_gcs_cls.return_value = _gcs_mock()
+        mock_pick_importer.return_value.parse_file.return_value = _transcript()
+        mock_get_scorer.return_value.score_transcript_new.return_value = MagicMock()
+
+        self.assertEqual(self._run(), "completed")
+        self.assertEqual(self._run(), "completed")
+
+        mock_gcs_cls.assert_called_once_with(bucket_name="bucket")
+        mock_get_scorer.assert_called_once_with("talent", model="gpt-5-mini")
+
+    @patch("main.get_loader")
+    @patch("main.get_scorer")
+    @patch("main.GCSClient")
+    def test_startup_scorer_serves_the_first_client_request(
+        self, mock_gcs_cls, mock_get_scorer, mock_get_loader
+    ):
+        warm = object()
+        mock_get_scorer.return_value = warm
+
+        async def run():
+            async with main.lifespan(main.app):
+                async with main._checkout_scorer("client", "gpt-5-mini") as scorer:
+                    return scorer
+
+        with patch.dict(os.environ, {"DEFAULT_LLM_MODEL": "gpt-5-mini"}):
+            self.assertIs(asyncio.run(run()), warm)
+        mock_get_scorer.assert_called_once_with("client", model="gpt-5-mini")
+
+
+class TestProcessBatchPipeline(unittest.TestCase):
+    def setUp(self):
+        _reset_client_caches()
+
+    def test_concurrency_is_bounded_and_failures_are_isolated(self):
+        in_flight = 0
+        peak = 0
+
+        async def fake_pipeline(bucket, file_path, model, meeting_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if file_path == "bad.txt":
+                raise RuntimeError("boom")
+            return "completed"
+
+        files = [f"f{i}.txt" for i in range(6)] + ["bad.txt"]
+        with patch("main.BATCH_CONCURRENCY", 2), \
+             patch("main.process_pipeline", side_effect=fake_pipeline) as mock_pipeline:
+            asyncio.run(main.process_batch_pipeline("bucket", files, None, "batch-x"))
+
+        self.assertEqual(mock_pipeline.call_count, len(files))  # siblings not cancelled
+        self.assertLessEqual(peak, 2)
+        failed = main.processing_status[main._job_id("bucket", "bad.txt")]
+        self.assertEqual((failed["status"], failed["error"]), ("failed", "boom"))
+        self.assertEqual(main.processing_status[main._job_id("bucket", "f0.txt")]["status"], "pending")
+        batch = main.processing_status["batch-x"]
+        self.assertEqual((batch["status"], batch["processed"], batch["total_files"]), ("completed", 7, 7))
+
+    def test_large_batch_holds_one_task_per_worker(self):
+        task_counts = []
+
+        async def fake_pipeline(bucket, file_path, model, meeting_id):
+            task_counts.append(len(asyncio.all_tasks()))
+            await asyncio.sleep(0)
+            return "completed"
+
+        files = [f"f{i}.txt" for i in range(50)]
+        with patch("main.BATCH_CONCURRENCY", 3), \
+             patch("main.process_pipeline", side_effect=fake_pipeline) as mock_pipeline:
+            asyncio.run(main.process_batch_pipeline("bucket", files, None, "batch-l"))
+
+        self.assertEqual([c.args[1] for c in mock_pipeline.call_args_list], files)
+        self.assertLessEqual(max(task_counts), 3 + 1)  # workers + the batch task
+        self.assertEqual(main.processing_status["batch-l"]["processed"], 50)
+
+    def test_progress_advances_before_slowest_file_finishes(self):
+        seen_by_slow = []
+
+        async def fake_pipeline(bucket, file_path, model, meeting_id):
+            if file_path == "slow.txt":
+                await asyncio.sleep(0.05)
+                seen_by_slow.append(main.processing_status["batch-s"]["processed"])
+            return "completed"
+
+        with patch("main.process_pipeline", side_effect=fake_pipeline):
+            asyncio.run(main.process_batch_pipeline("bucket", ["slow.txt", "a.txt", "b.txt"], None, "batch-s"))
+
+        self.assertEqual(seen_by_slow, [2])
+        self.assertEqual(main.processing_status["batch-s"]["processed"], 3)
+
+    @patch("main.upload_talent_format_to_bigquery", new_callable=AsyncMock)
+    @patch("main.get_scorer")
+    @patch("main.resolve_source", return_value="talent")
+    @patch("main.pick_importer")
+    @patch("main.GCSClient")
+    def test_next_file_downloads_while_current_one_scores(
+        self, mock_gcs_cls, mock_pick_importer, mock_resolve, mock_get_scorer, mock_upload
+    ):
+        events = []
+        gcs = _gcs_mock()
+        gcs.download_to_temp_file.side_effect = lambda name: (
+            events.append(f"download {name}") or Path(f"/tmp/tmp-{Path(name).stem}.txt")
+        )
+        mock_gcs_cls.return_value = gcs
+        mock_pick_importer.return_value.parse_file.side_effect = (
+            lambda path: _transcript(granola_id=f"note-{path.stem}")
+        )
+
+        def score(transcript):
+            events.append(f"score start {transcript.granola_note_id}")
+            time.sleep(0.05)
+            events.append(f"score end {transcript.granola_note_id}")
+            return MagicMock()
+        mock_get_scorer.return_value.score_transcript_new.side_effect = score
+
+        async def run_batch():
+            # One scoring slot, one file of prefetch
+            with patch("main._scoring_semaphore", asyncio.Semaphore(1)), \
+                 patch("main.BATCH_CONCURRENCY", 2):
+                await main.process_batch_pipeline("bucket", ["a.txt", "b.txt"], None, "batch-p")
+
+        asyncio.run(run_batch())
+
+        self.assertLess(events.index("download b.txt"), events.index("score end note-tmp-a"))
+        self.assertLess(events.index("score end note-tmp-a"), events.index("score start note-tmp-b"))
+
+
+class TestProcessBatchEndpoint(unittest.TestCase):
+    def setUp(self):
+        _reset_client_caches()
+        main._inflight_pipelines.clear()  # scheduled tasks never run here
+
+    @patch("main.GCSClient")
+    def test_lists_gcs_once_and_schedules_one_batch_task(self, mock_gcs_cls):
+        blobs = [SimpleNamespace(name="transcripts/a.txt"), SimpleNamespace(name="transcripts/b.md")]
+        mock_gcs_cls.return_value.list_transcripts.return_value = blobs
+        background_tasks = main.BackgroundTasks()
+        request = main.BatchRequest(bucket="bucket", prefix="transcripts/", max_files=5)
+
+        result = asyncio.run(main.process_batch(request, background_tasks))
+
+        mock_gcs_cls.return_value.list_transcripts.assert_called_once_with("transcripts/", 5)
+        self.assertEqual(result["total_files"], 2)
+        self.assertEqual(len(background_tasks.tasks), 1)
+        task = background_tasks.tasks[0]
+        self.assertIs(task.func, main.process_batch_pipeline)
+        self.assertEqual(task.args[1], ["transcripts/a.txt", "transcripts/b.md"])
+
+    @patch("main.GCSClient")
+    def test_explicit_file_list_skips_the_listing(self, mock_gcs_cls):
+        background_tasks = main.BackgroundTasks()
+        request = main.BatchRequest(
+            bucket="bucket", file_paths=["transcripts/a.txt", "transcripts/b.md", "transcripts/a.txt"]
+        )
+
+        result = asyncio.run(main.process_batch(request, background_tasks))
+
+        mock_gcs_cls.return_value.list_transcripts.assert_not_called()
+        self.assertEqual(result["total_files"], 2)
+        self.assertEqual(background_tasks.tasks[0].args[1], ["transcripts/a.txt", "transcripts/b.md"])
+
+    @patch("main.GCSClient")
+    def test_retried_post_rejoins_the_running_batch(self, mock_gcs_cls):
+        # The first response was lost (5xx from a proxy, dropped connection);
+        # the client resends the same files, in any order
+        files = ["transcripts/a.txt", "transcripts/b.md"]
+        first_tasks, retry_tasks = main.BackgroundTasks(), main.BackgroundTasks()
+
+        first = asyncio.run(main.process_batch(main.BatchRequest(bucket="bucket", file_paths=files), first_tasks))
+        retry = asyncio.run(main.process_batch(
+            main.BatchRequest(bucket="bucket", file_paths=files[::-1]), retry_tasks
+        ))
+
+        self.assertEqual(retry["batch_id"], first["batch_id"])
+        self.assertEqual(retry["message"], "Already processing")
+        self.assertEqual(len(first_tasks.tasks), 1)
+        self.assertEqual(retry_tasks.tasks, [])
+
+    @patch("main.GCSClient")
+    def test_files_already_in_flight_are_not_run_twice(self, mock_gcs_cls):
+        main._inflight_pipelines.add(main._job_id("bucket", "transcripts/a.txt"))  # a /process-transcript run
+        background_tasks = main.BackgroundTasks()
+        request = main.BatchRequest(bucket="bucket", file_paths=["transcripts/a.txt", "transcripts/b.md"])
+
+        result = asyncio.run(main.process_batch(request, background_tasks))
+
+        self.assertEqual(result["total_files"], 1)
+        self.assertEqual(background_tasks.tasks[0].args[1], ["transcripts/b.md"])
+
+    def test_batch_run_releases_its_in_flight_ids(self):
+        files = ["transcripts/a.txt", "transcripts/bad.txt"]
+        background_tasks = main.BackgroundTasks()
+
+        async def fake_pipeline(bucket, file_path, model, meeting_id):
+            self.assertIn(meeting_id, main._inflight_pipelines)
+            if file_path.endswith("bad.txt"):
+                raise RuntimeError("boom")
+            return "completed"
+
+        async def run():
+            result = await main.process_batch(main.BatchRequest(bucket="bucket", file_paths=files), background_tasks)
+            await background_tasks()
+            return result
+
+        with patch("main.process_pipeline", side_effect=fake_pipeline) as mock_pipeline:
+            result = asyncio.run(run())
+
+        self.assertEqual(mock_pipeline.call_args_list[0].args[3], main._job_id("bucket", files[0]))
+        self.assertEqual(main.processing_status[result["batch_id"]]["status"], "completed")
+        self.assertEqual(main._inflight_pipelines, set())
+
+    @patch("main.GCSClient")
+    def test_empty_listing_schedules_nothing(self, mock_gcs_cls):
+        mock_gcs_cls.return_value.list_transcripts.return_value = []
+        background_tasks = main.BackgroundTasks()
+
+        result = asyncio.run(main.process_batch(main.BatchRequest(bucket="bucket"), background_tasks))
+
+        self.assertEqual(result["status"], "empty")
+        self.assertEqual(background_tasks.tasks, [])
+
+
+class TestCachedResultsEndpoint(unittest.TestCase):
+    def setUp(self):
+        _reset_client_caches()
+
+    @patch("main.GCSClient")
+    def test_listing_requests_only_the_fields_it_reports(self, mock_gcs_cls):
+        gcs = mock_gcs_cls.return_value
+        gcs.bucket_name = "bucket"
+        prefix = f"cache/{main.datetime.now().strftime('%Y-%m-%d')}/"
+        gcs.client.list_blobs.return_value = iter([
+            SimpleNamespace(name=f"{prefix}meet-1-gpt-5-mini.json", time_created=None, size=12),
+        ])
+
+        result = asyncio.run(main.list_cached_results())
+
+        self.assertEqual(
+            gcs.client.list_blobs.call_args.kwargs["fields"],
+            "items(name,timeCreated,size),nextPageToken",
+        )
+        self.assertEqual(result["count"], 1)
+        self.assertEqual(result["cached_results"][0]["size_bytes"], 12)
+
+    @patch("main.GCSClient")
+    def test_blob_names_split_at_the_last_dash(self, mock_gcs_cls):
+        gcs = mock_gcs_cls.return_value
+        prefix = f"cache/{main.datetime.now().strftime('%Y-%m-%d')}/"
+        gcs.client.list_blobs.return_value = iter([
+            SimpleNamespace(name=f"{prefix}meet-1-gpt-client.json", time_created=None, size=1),
+            SimpleNamespace(name=f"{prefix}legacy.json", time_created=None, size=1),
+        ])
+
+        results = asyncio.run(main.list_cached_results())["cached_results"]
+
+        self.assertEqual((results[0]["meeting_id"], results[0]["model"]), ("meet-1-gpt", "client"))
+        self.assertEqual((results[1]["meeting_id"], results[1]["model"]), ("legacy", "unknown"))
+
+
+class TestProcessTranscriptCoalescing(unittest.TestCase):
+    def test_repeat_post_while_in_flight_is_not_rescheduled(self):
+        request = main.TranscriptRequest(bucket="bucket", file_path="transcripts/dup.txt")
+        first_tasks, second_tasks = main.BackgroundTasks(), main.BackgroundTasks()
+
+        async def scenario():
+            first = await main.process_transcript(request, first_tasks)
+            second = await main.process_transcript(request, second_tasks)
+            with patch("main.process_pipeline", new_callable=AsyncMock, return_value="completed"):
+                await first_tasks()
+            return first, second
+
+        first, second = asyncio.run(scenario())
+
+        self.assertEqual(first["message"], "Processing started")
+        self.assertEqual(second["message"], "Already processing")
+        self.assertEqual(second["meeting_id"], first["meeting_id"])
+        self.assertEqual(second_tasks.tasks, [])
+        self.assertEqual(first["meeting_id"], main._job_id("bucket", "transcripts/dup.txt"))
+        self.assertRegex(first["meeting_id"], r"^job-[0-9a-f]{16}$")
+        self.assertEqual(main.processing_status[first["meeting_id"]]["file_path"], "bucket/transcripts/dup.txt")
+        # Finished runs leave the in-flight set, so a later POST runs again
+        self.assertNotIn(first["meeting_id"], main._inflight_pipelines)
+
+
+class TestLookupCachedScore(unittest.TestCase):
+    def setUp(self):
+        self.gcs = MagicMock()
+        self.gcs.create_cache_key.return_value = "cache/2026-01-01/m1-gpt-5-mini-client.json"
+        self.gcs.get_cached_score.return_value = {"results": {"total_qualified_sections": 4}}
+
+    def _lookup(self):
+        return main._lookup_cached_score(self.gcs, "m1", "gpt-5-mini", "client", None)
+
+    def test_without_redis_goes_straight_to_gcs(self):
+        with patch("main.get_redis", return_value=None):
+            self.assertEqual(self._lookup(), {"results": {"total_qualified_sections": 4}})
+        self.gcs.get_cached_score.assert_called_once_with("m1", "gpt-5-mini", "client", variant=None)
+
+    def test_gcs_hit_is_copied_into_redis_then_served_from_it(self):
+        redis_client = MagicMock()
+        redis_client.get.return_value = None
+        with patch("main.get_redis", return_value=redis_client):
+            first = self._lookup()
+            key, raw = redis_client.set.call_args.args
+            redis_client.get.return_value = raw
+            second = self._lookup()
+
+        self.assertEqual(key, "score:cache/2026-01-01/m1-gpt-5-mini-client.json")
+        self.assertEqual(redis_client.set.call_args.kwargs, {"ex": main.SCORE_CACHE_TTL_SECONDS})
+        self.assertEqual(first, second)
+        self.gcs.get_cached_score.assert_called_once()  # second lookup never reached GCS
+
+    def test_redis_error_falls_back_to_gcs(self):
+        redis_client = MagicMock()
+        redis_client.get.side_effect = ConnectionError("redis down")
+        with patch("main.get_redis", return_value=redis_client):
+            self.assertEqual(self._lookup(), {"results": {"total_qualified_sections": 4}})
+
+
+class TestPickImporter(unittest.TestCase):
+    def test_dispatch_by_extension_reuses_instances(self):
+        granola = main.pick_importer("transcripts/[2025-01-01] Call - A - B - C.txt")
+        self.assertIsInstance(granola, main.GranolaDriveImporter)
+        self.assertIs(main.pick_importer("other/x.TXT"), granola)
+        self.assertIs(main.pick_importer("transcripts/call.vtt"), main.DEFAULT_IMPORTER)
+        self.assertIs(main.pick_importer("transcripts/noext"), main.DEFAULT_IMPORTER)
+
+    def test_webhook_file_filter(self):
+        for name in ("transcripts/a.txt", "transcripts/2025/b.md"):
+            self.assertTrue(main.TRANSCRIPT_FILE_RE.match(name), name)
+        for name in ("transcripts/a.vtt", "other/a.txt", "transcripts/.txt", "transcripts/a.txt.bak"):
+            self.assertIsNone(main.TRANSCRIPT_FILE_RE.match(name), name)
 
 
 if __name__ == "__main__":
@@ -138,6 +138,13 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
     coroutines so the pipeline only exercises the dispatch branches.
     """
 
+    def setUp(self):
+        import main as main_module
+        # Cached per-bucket GCS clients / pooled scorers would outlive the
+        # per-test patches below.
+        main_module._gcs_for_bucket.cache_clear()
+        main_module._idle_scorers.clear()
+
     def _run_pipeline(self, blob_metadata, *, temp_path="/tmp/fake-transcript.txt",
                       transcript_meeting_id="test-meeting-id", granola_note_id=None,
                       claim_result=True):
@@ -163,14 +170,12 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
         mock_gcs.cleanup_temp_files.return_value = None
 
         meeting_id = "test-meeting-id"
-        from main import ProcessingStatus
-        main_module.processing_status[meeting_id] = ProcessingStatus(
-            meeting_id=meeting_id, status="pending"
-        )
+        main_module.processing_status[meeting_id] = {
+            "meeting_id": meeting_id, "status": "pending"
+        }
 
         with patch.object(main_module, "GCSClient", return_value=mock_gcs), \
-             patch.object(main_module, "GranolaDriveImporter") as mock_granola, \
-             patch.object(main_module, "PlaintextImporter") as mock_plaintext, \
+             patch.object(main_module, "pick_importer") as mock_pick_importer, \
              patch("src.router.ClientScorer") as mock_client_cls, \
              patch("src.router.TalentScorer") as mock_talent_cls, \
              patch.object(main_module, "upload_new_format_to_bigquery",
@@ -181,13 +186,15 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
             transcript_stub = SimpleNamespace(
                 meeting_id=transcript_meeting_id, granola_note_id=granola_note_id
             )
-            mock_granola.return_value.parse_file.return_value = transcript_stub
-            mock_plaintext.return_value.parse_file.return_value = transcript_stub
+            mock_pick_importer.return_value.parse_file.return_value = transcript_stub
 
             # Client scorer mock — produces a NewScoreResult-shaped stub
-            # (has .total_qualified_sections for status update + .__dict__
-            # for cache_score).
-            client_score_result = SimpleNamespace(total_qualified_sections=5)
+            # (has .total_qualified_sections for status update +
+            # .model_dump(mode='json') for cache_score).
+            client_score_result = SimpleNamespace(
+                total_qualified_sections=5,
+                model_dump=lambda mode=None: {"total_qualified_sections": 5},
+            )
             client_scorer = MagicMock()
             client_scorer.score_transcript_new.return_value = client_score_result
             mock_client_cls.return_value = client_scorer
@@ -217,7 +224,7 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
 
     def test_client_source_reaches_client_scorer_and_writer(self):
         status, m = self._run_pipeline({"source": "client"})
-        self.assertEqual(status.status, "completed")
+        self.assertEqual(status["status"], "completed")
         m["client_scorer_cls"].assert_called_once()
         m["client_bq"].assert_called_once()
         m["talent_scorer_cls"].assert_not_called()
@@ -225,7 +232,7 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
 
     def test_talent_source_reaches_talent_scorer_and_writer(self):
         status, m = self._run_pipeline({"source": "talent"})
-        self.assertEqual(status.status, "completed")
+        self.assertEqual(status["status"], "completed")
         m["talent_scorer_cls"].assert_called_once()
         m["talent_bq"].assert_called_once()
         m["client_scorer_cls"].assert_not_called()
@@ -241,8 +248,8 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
 
     def test_no_metadata_fails_without_bigquery_write(self):
         status, m = self._run_pipeline(None)
-        self.assertEqual(status.status, "failed")
-        self.assertIn("source", (status.error or "").lower())
+        self.assertEqual(status["status"], "failed")
+        self.assertIn("source", (status["error"] or "").lower())
         m["client_bq"].assert_not_called()
         m["talent_bq"].assert_not_called()
         m["client_scorer_cls"].assert_not_called()
@@ -250,7 +257,7 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
 
     def test_garbage_source_fails_without_bigquery_write(self):
         status, m = self._run_pipeline({"source": "weird"})
-        self.assertEqual(status.status, "failed")
+        self.assertEqual(status["status"], "failed")
         m["client_bq"].assert_not_called()
         m["talent_bq"].assert_not_called()
         m["client_scorer_cls"].assert_not_called()
@@ -265,8 +272,8 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
             transcript_meeting_id="tmpqm_h4lle",   # == temp stem -> poison
             granola_note_id=None,
         )
-        self.assertEqual(status.status, "failed")
-        self.assertIn("meeting_id", (status.error or "").lower())
+        self.assertEqual(status["status"], "failed")
+        self.assertIn("meeting_id", (status["error"] or "").lower())
         # No scorer instantiated, no BQ write — the guard fires before both.
         m["talent_scorer_cls"].assert_not_called()
         m["client_scorer_cls"].assert_not_called()
@@ -278,7 +285,7 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
         claim), this task must skip scoring AND the BQ write — preventing the
         duplicate-row race and the wasted second scoring."""
         status, m = self._run_pipeline({"source": "talent"}, claim_result=False)
-        self.assertEqual(status.status, "completed")
+        self.assertEqual(status["status"], "completed")
         m["talent_scorer_cls"].assert_not_called()
         m["client_scorer_cls"].assert_not_called()
         m["talent_bq"].assert_not_called()
@@ -292,7 +299,7 @@ class TestProcessPipelineRoutingGuarantee(unittest.TestCase):
             transcript_meeting_id="tmpqm_h4lle",      # importer stem fallback...
             granola_note_id="2f7de01e-4196-4d2e-8233-73d0a781a95c",  # ...but real id present
         )
-        self.assertEqual(status.status, "completed")
+        self.assertEqual(status["status"], "completed")
         m["talent_scorer_cls"].assert_called_once()
         m["talent_bq"].assert_called_once()
 
@@ -0,0 +1,340 @@
+"""
+Tests for src.status_store.
+
+Covers:
+  - make_status_store falls back to LocalStatusStore without REDIS_URL
+  - LocalStatusStore drops entries past the TTL or the size cap
+  - RedisStatusStore round-trips status dicts and sets the TTL
+  - iteration follows first-write order; updates don't reorder
+  - set_many seeds a batch in one transaction
+  - recent() skips ids whose status key has expired
+  - main._update_status writes changes back through the store
+  - the Redis clients are built with socket timeouts, and a failing store
+    doesn't mask the pipeline error being recorded
+  - the app lifespan pings Redis when it is configured
+  - uvicorn defaults to several workers only with a shared store
+
+The Redis client is a small in-memory fake of redis.asyncio; no server is
+needed.
+"""
+
+import asyncio
+import os
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+os.environ.setdefault("SCORING_COST_LOG_DISABLED", "true")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from src.status_store import LocalStatusStore, RedisStatusStore, make_status_store
+
+
+def _status(meeting_id, status, **fields):
+    return {"meeting_id": meeting_id, "status": status, **fields}
+
+
+class _FakeRedisState:
+    """Just enough Redis, synchronously, for RedisStatusStore."""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+        self.zsets = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def mget(self, keys):
+        return [self.values.get(k) for k in keys]
+
+    def mset(self, mapping):
+        self.values.update(mapping)
+        for key in mapping:
+            self.ttls.pop(key, None)
+        return True
+
+    def expire(self, key, seconds):
+        self.ttls[key] = seconds
+        return key in self.values
+
+    def delete(self, key):
+        return int(self.values.pop(key, None) is not None)
+
+    def zadd(self, key, mapping, nx=False):
+        zset = self.zsets.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if nx and member in zset:
+                continue
+            added += member not in zset
+            zset[member] = score
+        return added
+
+    def zrem(self, key, member):
+        return int(self.zsets.get(key, {}).pop(member, None) is not None)
+
+    def zremrangebyscore(self, key, low, high):
+        zset = self.zsets.get(key, {})
+        stale = [m for m, score in zset.items() if score <= high]
+        for m in stale:
+            del zset[m]
+        return len(stale)
+
+    def zrange(self, key, start, end):
+        zset = self.zsets.get(key, {})
+        members = sorted(zset, key=zset.get)
+        return [m.encode() for m in members[start:(end + 1) or None]]
+
+    def zcard(self, key):
+        return len(self.zsets.get(key, {}))
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self._client = client
+        self._calls = []
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._calls.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self):
+        self._client.executed += 1
+        return [getattr(self._client.state, name)(*args, **kwargs) for name, args, kwargs in self._calls]
+
+
+class _FakeRedis:
+    """redis.asyncio.Redis over _FakeRedisState: every command is awaited."""
+
+    def __init__(self):
+        self.state = _FakeRedisState()
+        self.executed = 0  # pipeline round trips
+
+    def pipeline(self):
+        return _FakePipeline(self)
+
+    def __getattr__(self, name):
+        command = getattr(self.state, name)
+
+        async def call(*args, **kwargs):
+            return command(*args, **kwargs)
+        return call
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestMakeStatusStore(unittest.TestCase):
+    def test_no_redis_url_uses_local_store(self):
+        env = {k: v for k, v in os.environ.items() if k != "REDIS_URL"}
+        with patch.dict(os.environ, env, clear=True):
+            store = make_status_store()
+        self.assertIsInstance(store, LocalStatusStore)
+        self.assertEqual(_run(store.count()), 0)
+
+    def test_redis_clients_fail_fast(self):
+        from src import status_store
+
+        status_store.get_redis.cache_clear()
+        status_store.get_async_redis.cache_clear()
+        try:
+            with patch.object(status_store, "redis") as mock_redis:
+                status_store.get_redis("redis://example:6379/0")
+                store = status_store.make_status_store("redis://example:6379/0")
+        finally:
+            status_store.get_redis.cache_clear()
+            status_store.get_async_redis.cache_clear()
+
+        self.assertIsInstance(store, RedisStatusStore)
+        for from_url in (mock_redis.Redis.from_url, mock_redis.asyncio.Redis.from_url):
+            kwargs = from_url.call_args.kwargs
+            self.assertEqual(kwargs["socket_timeout"], status_store.REDIS_SOCKET_TIMEOUT)
+            self.assertEqual(kwargs["socket_connect_timeout"], status_store.REDIS_CONNECT_TIMEOUT)
+            self.assertGreater(kwargs["health_check_interval"], 0)
+
+
+class TestLocalStatusStore(unittest.TestCase):
+    def test_size_cap_drops_oldest_first(self):
+        store = LocalStatusStore(ttl_seconds=60, max_entries=2)
+        for mid in ("a", "b", "c"):
+            store[mid] = _status(mid, "pending")
+        self.assertEqual(list(store), ["b", "c"])
+        self.assertNotIn("a", store)
+
+    def test_recent_returns_last_n_live_entries_oldest_first(self):
+        store = LocalStatusStore(ttl_seconds=60)
+        with patch("src.status_store.time.monotonic", return_value=1000.0):
+            store["a"] = _status("a", "pending")
+        with patch("src.status_store.time.monotonic", return_value=1050.0):
+            store["b"] = _status("b", "pending")
+            store["c"] = _status("c", "pending")
+            store["d"] = _status("d", "pending")
+        with patch("src.status_store.time.monotonic", return_value=1070.0):
+            self.assertEqual([mid for mid, _ in _run(store.recent(2))], ["c", "d"])
+            self.assertEqual([mid for mid, _ in _run(store.recent(10))], ["b", "c", "d"])
+            self.assertEqual(_run(store.recent(0)), [])
+
+    def test_refreshed_front_entry_does_not_shield_stale_ones(self):
+        store = LocalStatusStore(ttl_seconds=60)
+        with patch("src.status_store.time.monotonic", return_value=1000.0):
+            store["a"] = _status("a", "pending")
+        with patch("src.status_store.time.monotonic", return_value=1010.0):
+            store["b"] = _status("b", "completed")
+        with patch("src.status_store.time.monotonic", return_value=1065.0):
+            store["a"] = _status("a", "completed")
+        with patch("src.status_store.time.monotonic", return_value=1075.0):
+            self.assertEqual(len(store), 1)
+            self.assertEqual(list(store), ["a"])
+
+    def test_update_keeps_first_write_order(self):
+        store = LocalStatusStore(ttl_seconds=60)
+        store["a"] = _status("a", "pending")
+        store["b"] = _status("b", "pending")
+        _run(store.update("a", status="completed"))
+        self.assertEqual(list(store), ["a", "b"])
+        self.assertEqual(store["a"], _status("a", "completed"))
+
+    def test_entries_expire_after_ttl(self):
+        store = LocalStatusStore(ttl_seconds=60)
+        with patch("src.status_store.time.monotonic", return_value=1000.0):
+            store["old"] = _status("old", "completed")
+        with patch("src.status_store.time.monotonic", return_value=1030.0):
+            store["new"] = _status("new", "pending")
+        with patch("src.status_store.time.monotonic", return_value=1070.0):
+            self.assertIsNone(_run(store.get("old")))
+            self.assertEqual(_run(store.get("new")), _status("new", "pending"))
+            self.assertEqual(len(store), 1)
+            store["newest"] = _status("newest", "pending")  # sweep on write
+        self.assertEqual(list(store._entries), ["new", "newest"])
+
+
+class TestRedisStatusStore(unittest.TestCase):
+    def setUp(self):
+        self.redis = _FakeRedis()
+        self.store = RedisStatusStore(self.redis, ttl_seconds=60)
+
+    def test_round_trip_and_ttl(self):
+        _run(self.store.set("m1", _status("m1", "pending")))
+        self.assertEqual(_run(self.store.get("m1")), _status("m1", "pending"))
+        self.assertEqual(self.redis.state.ttls["job:m1"], 60)
+
+    def test_missing_key(self):
+        self.assertIsNone(_run(self.store.get("nope")))
+        with self.assertRaises(KeyError):
+            _run(self.store.update("nope", status="failed"))
+        with self.assertRaises(KeyError):
+            _run(self.store.delete("nope"))
+
+    def test_update_keeps_first_write_order(self):
+        async def run():
+            await self.store.set("a", _status("a", "pending"))
+            await self.store.set("b", _status("b", "pending"))
+            await self.store.update("a", status="completed")
+            return await self.store.recent(10), await self.store.count()
+
+        recent, count = _run(run())
+        self.assertEqual([mid for mid, _ in recent], ["a", "b"])
+        self.assertEqual(count, 2)
+        self.assertEqual(recent[0][1]["status"], "completed")
+
+    def test_set_many_seeds_a_batch_in_one_round_trip(self):
+        statuses = {mid: _status(mid, "pending") for mid in ("batch", "f0", "f1", "f2")}
+        _run(self.store.set_many(statuses))
+
+        self.assertEqual(self.redis.executed, 1)
+        self.assertEqual(_run(self.store.get("f1")), _status("f1", "pending"))
+        self.assertEqual({k: self.redis.state.ttls[k] for k in self.redis.state.values},
+                         {f"job:{mid}": 60 for mid in statuses})
+        self.assertEqual([mid for mid, _ in _run(self.store.recent(10))], list(statuses))
+
+    def test_recent_skips_expired(self):
+        _run(self.store.set("a", _status("a", "pending")))
+        _run(self.store.set("b", _status("b", "failed", error="boom")))
+        del self.redis.state.values["job:a"]  # TTL elapsed
+        self.assertEqual(
+            _run(self.store.recent(10)),
+            [("b", _status("b", "failed", error="boom"))],
+        )
+
+    def test_recent_returns_last_n_oldest_first(self):
+        for mid in ("a", "b", "c"):
+            _run(self.store.set(mid, _status(mid, "pending")))
+        self.assertEqual([mid for mid, _ in _run(self.store.recent(2))], ["b", "c"])
+        self.assertEqual(_run(self.store.recent(0)), [])
+
+    def test_delete(self):
+        _run(self.store.set("a", _status("a", "pending")))
+        _run(self.store.delete("a"))
+        self.assertIsNone(_run(self.store.get("a")))
+        self.assertEqual(_run(self.store.count()), 0)
+
+
+class TestUpdateStatusWritesThrough(unittest.TestCase):
+    def test_update_status_persists_in_redis_store(self):
+        import main
+
+        store = RedisStatusStore(_FakeRedis())
+        _run(store.set("mid", {"meeting_id": "mid", "status": "pending"}))
+        with patch.object(main, "processing_status", store):
+            _run(main._update_status("mid", status="failed", error="boom"))
+        self.assertEqual(_run(store.get("mid")), {"meeting_id": "mid", "status": "failed", "error": "boom"})
+
+    def test_failing_store_is_logged_not_raised_on_error_paths(self):
+        import main
+
+        store = MagicMock()
+        store.update = AsyncMock(side_effect=ConnectionError("redis down"))
+        with patch.object(main, "processing_status", store), \
+             self.assertLogs("main", level="ERROR") as logs:
+            _run(main._update_status_safely("mid", status="failed", error="openai timeout"))
+        self.assertIn("redis down", logs.output[0])
+
+
+class TestDefaultWorkers(unittest.TestCase):
+    def test_one_worker_when_redis_url_falls_back_to_local_store(self):
+        import main
+
+        # REDIS_URL set but the redis package missing: status stays per-process
+        with patch.dict(os.environ, {"REDIS_URL": "redis://example:6379/0"}), \
+             patch.object(main, "processing_status", LocalStatusStore()):
+            self.assertEqual(main._default_workers(), 1)
+
+    def test_one_worker_per_core_with_a_shared_store(self):
+        import main
+
+        with patch.object(main, "processing_status", RedisStatusStore(_FakeRedis())), \
+             patch("main.os.cpu_count", return_value=4):
+            self.assertEqual(main._default_workers(), 4)
+
+
+class TestLifespanChecksRedis(unittest.TestCase):
+    def _start(self, redis_client):
+        import main
+
+        async def run():
+            async with main.lifespan(main.app):
+                pass
+
+        with patch.object(main, "processing_status", RedisStatusStore(redis_client)), \
+             patch.object(main, "_gcs_for_bucket"), patch.object(main, "get_loader"), \
+             patch.object(main, "get_scorer"), patch.dict(main._idle_scorers, clear=True):
+            asyncio.run(run())
+
+    def test_redis_is_pinged_at_startup(self):
+        client = MagicMock()
+        client.ping = AsyncMock()
+        self._start(client)
+        client.ping.assert_awaited_once()
+
+    def test_unreachable_redis_does_not_block_startup(self):
+        client = MagicMock()
+        client.ping = AsyncMock(side_effect=ConnectionError("refused"))
+        with self.assertLogs("main", level="ERROR"):
+            self._start(client)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -197,13 +197,13 @@ class TestTalentScorerConstruction(unittest.TestCase):
     def test_constructor_loads_mappings_from_bq_when_not_injected(self, mock_openai):
         from src.scorers import TalentScorer
 
-        with patch("src.bq_loader.BigQueryLoader") as mock_loader_cls:
-            mock_loader = mock_loader_cls.return_value
+        with patch("src.bq_loader.get_loader") as mock_get_loader:
+            mock_loader = mock_get_loader.return_value
             mock_loader.load_client_mappings.return_value = {"Acme Co.": "Acme"}
 
             scorer = TalentScorer(model="gpt-5-mini")
 
-            mock_loader_cls.assert_called_once()
+            mock_get_loader.assert_called_once()
             mock_loader.load_client_mappings.assert_called_once()
             self.assertEqual(scorer._client_mappings.get("acme co."), "Acme")
 
@@ -212,8 +212,8 @@ class TestTalentScorerConstruction(unittest.TestCase):
         """If BQ is unreachable at __init__, scoring still works with empty mappings."""
         from src.scorers import TalentScorer
 
-        with patch("src.bq_loader.BigQueryLoader") as mock_loader_cls:
-            mock_loader_cls.side_effect = RuntimeError("BQ unreachable")
+        with patch("src.bq_loader.get_loader") as mock_get_loader:
+            mock_get_loader.side_effect = RuntimeError("BQ unreachable")
             scorer = TalentScorer(model="gpt-5-mini")
             self.assertEqual(scorer._client_mappings, {})
 